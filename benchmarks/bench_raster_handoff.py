@@ -0,0 +1,194 @@
+"""
+Benchmark of the page-pixel handoff from PyMuPDF to the analysis stages.
+
+Compares the previous chain (pix.samples -> Image.frombytes -> convert("RGB")
+-> np.array, plus pickling samples out of a render process) with RasterHandle
+(read-only NumPy view over the pixmap, PIL image only where needed, shared
+memory between processes) on synthetic A3 and A1 sheets. Each variant runs in
+a fresh subprocess so its peak RSS is not polluted by the previous one.
+
+Runs fully offline - no model, no API key.
+
+Usage:
+    python benchmarks/bench_raster_handoff.py             # A3 and A1, RGB and gray
+    python benchmarks/bench_raster_handoff.py --pages 5   # per-job totals for 5 sheets
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "web"))
+
+import fitz  # PyMuPDF
+import numpy as np
+import psutil
+from PIL import Image
+
+from raster_handle import RasterHandle, get_copy_stats
+
+# Sheet sizes in points and the analysis zoom (16 MP budget applies to A1)
+SHEETS = {
+    "A3": ((1191, 842), 1.5),
+    "A1": ((2384, 1684), 1.4),
+}
+MODES = {"RGB": fitz.csRGB, "L": fitz.csGRAY}
+VARIANTS = ("legacy", "handle", "legacy-process", "handle-process")
+
+
+def build_sheet(name):
+    """A plan-like sheet: wall grid, dimension text, a title block."""
+    (width, height), _ = SHEETS[name]
+    doc = fitz.open()
+    page = doc.new_page(width=width, height=height)
+    page.draw_rect(fitz.Rect(20, 20, width - 20, height - 20), width=2)
+    for x in range(60, int(width) - 60, 45):
+        page.draw_line((x, 60), (x, height - 160), width=1.5)
+    for y in range(60, int(height) - 160, 40):
+        page.draw_line((60, y), (width - 60, y), width=1.5)
+        page.insert_text((70, y + 15), f"12'-{y % 12}\" X 10'-6\"", fontsize=7)
+    page.insert_text((width - 400, height - 80), "GROUND FLOOR PLAN  SCALE 1:100", fontsize=16)
+    return doc.tobytes()
+
+
+def _render(sheet_bytes, sheet, mode):
+    _, zoom = SHEETS[sheet]
+    doc = fitz.open(stream=sheet_bytes, filetype="pdf")
+    pix = doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=MODES[mode], alpha=False)
+    doc.close()
+    return pix
+
+
+def _payload(image):
+    """What the model client does with each page: encode it to PNG."""
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=1)
+    return len(buffer.getvalue())
+
+
+def _legacy(pix, mode, copies):
+    samples = pix.samples                                   # bytes copy of the pixmap
+    copies.append(len(samples))
+    image = Image.frombytes(mode, (pix.width, pix.height), samples)
+    copies.append(len(samples))
+    image = image.convert("RGB")                            # SeamCarver / extractor input
+    copies.append(image.width * image.height * 3)
+    array = np.array(image)                                 # NumPy stage
+    copies.append(array.nbytes)
+    return array, image
+
+
+def _handle(pix):
+    handle = RasterHandle.from_pixmap(pix)
+    array = handle.array                                    # view, no copy
+    image = handle.to_image()                               # copies only for RGB
+    return array, image
+
+
+def _process_render(sheet_bytes, sheet, mode, shared):
+    pix = _render(sheet_bytes, sheet, mode)
+    if shared:
+        return RasterHandle.from_pixmap(pix).to_shared()
+    return pix.width, pix.height, pix.samples
+
+
+def _warm_up_shared():
+    # Starts the shared-memory resource tracker, which a running service already has
+    return RasterHandle.allocate("L", (1, 1), shared=True).freeze().to_shared()
+
+
+def run_variant(variant, sheet, mode):
+    """Run one variant in this process and return its measurements."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    sheet_bytes = build_sheet(sheet)
+    process = psutil.Process(os.getpid())
+    pool = ProcessPoolExecutor(max_workers=1) if variant.endswith("-process") else None
+    if pool:
+        # Start the helper and the shared-memory tracker before measuring
+        RasterHandle.from_shared(pool.submit(_warm_up_shared).result())
+    rss_before = process.memory_info().rss
+    copies_before = get_copy_stats()
+    copies = []
+    started = time.perf_counter()
+
+    if variant == "legacy":
+        array, image = _legacy(_render(sheet_bytes, sheet, mode), mode, copies)
+    elif variant == "handle":
+        array, image = _handle(_render(sheet_bytes, sheet, mode))
+    elif variant == "legacy-process":
+        width, height, samples = pool.submit(_process_render, sheet_bytes, sheet, mode, False).result()
+        copies += [len(samples)] * 3                        # samples, pickle out, unpickle in
+        image = Image.frombytes(mode, (width, height), samples)
+        copies.append(len(samples))
+        array = np.array(image)
+        copies.append(array.nbytes)
+    else:
+        handle = RasterHandle.from_shared(pool.submit(_process_render, sheet_bytes, sheet, mode, True).result())
+        copies.append(handle.nbytes)                        # pixmap -> shared block, in the helper
+        array = handle.array
+        image = handle.to_image()
+
+    payload_bytes = _payload(image)
+    seconds = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # KiB on Linux
+    if pool:
+        pool.shutdown()
+
+    copied = get_copy_stats()
+    copies += [copied["bytes"] - copies_before["bytes"]] if copied["copies"] > copies_before["copies"] else []
+    return {
+        "pixels": f"{array.shape[1]}x{array.shape[0]}",
+        "copies": len(copies),
+        "copied_mb": sum(copies) / (1024 ** 2),
+        "peak_mb": max(peak - rss_before, 0) / (1024 ** 2),
+        "ms": seconds * 1000,
+        "png_kb": payload_bytes / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Page pixel handoff benchmark")
+    parser.add_argument("--pages", type=int, default=5, help="sheets per job for the per-job totals")
+    parser.add_argument("--run-variant", nargs=3, metavar=("VARIANT", "SHEET", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_variant:
+        print(json.dumps(run_variant(*args.run_variant)))
+        return 0
+
+    results = {}
+    for sheet in SHEETS:
+        for mode in MODES:
+            for variant in VARIANTS:
+                output = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--run-variant", variant, sheet, mode],
+                    check=True, capture_output=True, text=True,
+                ).stdout
+                results[(sheet, mode, variant)] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'sheet':<6} {'mode':<4} {'variant':<16} {'pixels':>11} {'copies':>7} {'copied MB':>10} {'peak MB':>8} {'ms':>8}")
+    for (sheet, mode, variant), r in results.items():
+        print(f"{sheet:<6} {mode:<4} {variant:<16} {r['pixels']:>11} {r['copies']:>7d} {r['copied_mb']:>10.1f} "
+              f"{r['peak_mb']:>8.1f} {r['ms']:>8.1f}")
+
+    print(f"\nSaved per job of {args.pages} sheet(s), handle vs legacy:")
+    for sheet in SHEETS:
+        for mode in MODES:
+            for kind in ("", "-process"):
+                old, new = results[(sheet, mode, "legacy" + kind)], results[(sheet, mode, "handle" + kind)]
+                print(f"  {sheet} {mode:<3} {'in-process' if not kind else 'render helper':<13} "
+                      f"{(old['copies'] - new['copies']) * args.pages:>3d} copies, "
+                      f"{(old['copied_mb'] - new['copied_mb']) * args.pages:>7.1f} MB copied, "
+                      f"peak {old['peak_mb'] - new['peak_mb']:>6.1f} MB lower per sheet")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Micro-benchmarks for the rule engine (src/core/check_rules.py).
+
+Runs fully offline on synthetic extraction outputs - no model, no API key.
+Timings are normalised against a fixed pure-Python reference workload so the
+baselines stored in benchmarks/baselines.json stay comparable across machines.
+Each repeat times the reference right before the benchmark and the gate uses
+the median of those paired ratios, so one noisy sample cannot fail the run.
+Python-level call counts are deterministic for the seeded synthetic plans and
+are gated much more tightly than time.
+
+Usage:
+    python benchmarks/bench_rules.py                    # compare against baselines
+    python benchmarks/bench_rules.py --update-baseline  # record new baselines
+    python benchmarks/bench_rules.py --threshold 0.3    # allow 30% slowdown
+    python benchmarks/bench_rules.py --repeat 9         # more timing repeats
+"""
+
+import argparse
+import gc
+import json
+import os
+import re
+import statistics
+import sys
+import timeit
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from src.core import check_rules
+from synthetic_plans import ROOM_TYPES, generate_dimension_strings, generate_plans
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baselines.json")
+
+# Allowed relative regression before the run fails
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_ALLOC_THRESHOLD = 0.10
+DEFAULT_CALLS_THRESHOLD = 0.02
+DEFAULT_REPEAT = 5
+
+# Reference calls per timing sample
+REFERENCE_NUMBER = 5
+
+
+_REFERENCE_PATTERN = re.compile(r"(\d+)-(\d+)")
+
+
+def _reference_workload():
+    """Fixed interpreter-bound loop (regex, strings, dicts) used to normalise timings across machines."""
+    rows = []
+    for i in range(5000):
+        match = _REFERENCE_PATTERN.match(f"{i}-{i * 7}")
+        rows.append({"value": int(match.group(1)) * 0.3048, "text": f"{i:05d}".lower()})
+    return rows
+
+
+def _paired_timings(fn, repeat, number):
+    """Return (best seconds per call, median ratio to the reference) over `repeat` samples.
+
+    Every sample times the reference workload immediately before the benchmark,
+    so CPU frequency drift between samples cancels out of the ratio. timeit
+    pauses GC while timing.
+    """
+    seconds = []
+    ratios = []
+    for _ in range(repeat):
+        gc.collect()
+        reference = timeit.timeit(_reference_workload, number=REFERENCE_NUMBER) / REFERENCE_NUMBER
+        sample = timeit.timeit(fn, number=number) / number
+        seconds.append(sample)
+        ratios.append(sample / reference)
+    return min(seconds), statistics.median(ratios)
+
+
+def _call_count(fn):
+    """Return the number of Python and C function calls made by one run of fn."""
+    calls = 0
+
+    def profiler(frame, event, arg):
+        nonlocal calls
+        if event in ("call", "c_call"):
+            calls += 1
+
+    sys.setprofile(profiler)
+    try:
+        fn()
+    finally:
+        sys.setprofile(None)
+    # Drop the sys.setprofile(None) call itself
+    return calls - 1
+
+
+def _allocations(fn):
+    """Return (peak KiB, live blocks) traced while running fn once."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return round(peak / 1024, 1), blocks
+
+
+def build_benchmarks():
+    """Return {name: (callable, items processed per call, number per timing sample)}."""
+    single_plan = generate_plans(1, seed=1, floors=(3, 3), rooms_per_type=(2, 2))
+    thousand_plans = generate_plans(1000, seed=2)
+    clean_plans = generate_plans(1000, seed=3, malformed_rate=0.0)
+    dimensions = generate_dimension_strings(1000, seed=4)
+
+    room_entries = {room_type: [] for room_type in ROOM_TYPES}
+    for values in thousand_plans.values():
+        for room_type in ROOM_TYPES:
+            room_entries[room_type].extend(values[0][room_type])
+
+    def parse_dimensions():
+        return [check_rules.parse_dimension(dim) for dim in dimensions]
+
+    def check_rooms():
+        return [check_rules.check_room_dimensions(room_type, entries) for room_type, entries in room_entries.items()]
+
+    return {
+        "process_rooms_per_plan": (lambda: check_rules.process_rooms(single_plan), 1, 300),
+        "process_rooms_1000_plans": (lambda: check_rules.process_rooms(thousand_plans), 1000, 3),
+        "process_rooms_1000_clean_plans": (lambda: check_rules.process_rooms(clean_plans), 1000, 3),
+        "parse_dimension_1000": (parse_dimensions, 1000, 50),
+        "check_room_dimensions_1000_plans": (check_rooms, 1000, 3),
+    }
+
+
+def run_benchmarks(repeat=DEFAULT_REPEAT):
+    results = {}
+    for name, (fn, items, number) in build_benchmarks().items():
+        seconds, relative_time = _paired_timings(fn, repeat, number)
+        peak_kib, blocks = _allocations(fn)
+        results[name] = {
+            "seconds": seconds,
+            "relative_time": relative_time,
+            "calls": _call_count(fn),
+            "items_per_second": items / seconds if seconds else 0.0,
+            "alloc_peak_kib": peak_kib,
+            "alloc_blocks": blocks,
+        }
+    return results
+
+
+def compare(results, baselines, time_threshold, alloc_threshold, calls_threshold=DEFAULT_CALLS_THRESHOLD):
+    """Return a list of regression messages (empty when within thresholds)."""
+    regressions = []
+    for name, current in results.items():
+        baseline = baselines.get(name)
+        if not baseline:
+            continue
+        time_ratio = current["relative_time"] / baseline["relative_time"]
+        if time_ratio > 1 + time_threshold:
+            regressions.append(f"{name}: {time_ratio:.2f}x slower than baseline")
+        if baseline.get("calls") and current["calls"] / baseline["calls"] > 1 + calls_threshold:
+            regressions.append(f"{name}: calls {current['calls']} vs baseline {baseline['calls']}")
+        for key in ("alloc_peak_kib", "alloc_blocks"):
+            if baseline[key] and current[key] / baseline[key] > 1 + alloc_threshold:
+                regressions.append(f"{name}: {key} {current[key]} vs baseline {baseline[key]}")
+    return regressions
+
+
+def print_results(results, baselines):
+    print(f"{'benchmark':<36} {'ms/call':>10} {'items/s':>12} {'rel':>8} {'calls':>9} {'peak KiB':>10} {'blocks':>8} {'vs base':>8}")
+    for name, r in results.items():
+        baseline = baselines.get(name)
+        delta = f"{r['relative_time'] / baseline['relative_time']:.2f}x" if baseline else "new"
+        print(f"{name:<36} {r['seconds'] * 1000:>10.3f} {r['items_per_second']:>12.0f} "
+              f"{r['relative_time']:>8.2f} {r['calls']:>9d} {r['alloc_peak_kib']:>10.1f} {r['alloc_blocks']:>8d} {delta:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rule engine micro-benchmarks")
+    parser.add_argument("--update-baseline", action="store_true", help="write results to baselines.json")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_TIME_THRESHOLD, help="allowed relative slowdown")
+    parser.add_argument("--alloc-threshold", type=float, default=DEFAULT_ALLOC_THRESHOLD, help="allowed relative allocation growth")
+    parser.add_argument("--calls-threshold", type=float, default=DEFAULT_CALLS_THRESHOLD, help="allowed relative call count growth")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timing samples per benchmark (median is gated)")
+    args = parser.parse_args(argv)
+
+    baselines = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    results = run_benchmarks(args.repeat)
+    print_results(results, baselines)
+
+    if args.update_baseline:
+        stored = {
+            name: {key: round(value, 6) if isinstance(value, float) else value for key, value in r.items()}
+            for name, r in results.items()
+        }
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baselines written to {BASELINE_PATH}")
+        return 0
+
+    regressions = compare(results, baselines, args.threshold, args.alloc_threshold, args.calls_threshold)
+    if regressions:
+        print("\nRegressions:")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
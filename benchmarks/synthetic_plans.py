@@ -0,0 +1,119 @@
+"""
+Synthetic extraction outputs for benchmarking the rule engine.
+
+Generates data in the same shape analysis.py writes to output.json, so
+check_rules.process_rooms can be exercised without a model or API key.
+"""
+
+import random
+
+ROOM_TYPES = [
+    "bedroom", "drawingroom", "studyroom", "kitchen",
+    "bathroom", "water_closet", "combined_bath_wc", "store",
+]
+
+FLOOR_NAMES = ["Ground Floor", "First Floor", "Second Floor", "Third Floor", "Fourth Floor"]
+
+# Dimension string formats seen in model output
+DIMENSION_FORMATS = ["feet_inch", "feet_only", "fraction_inch", "decimal_inch", "meters"]
+
+
+def _dimension(rng, fmt):
+    width_ft, length_ft = rng.randint(3, 18), rng.randint(4, 22)
+    if fmt == "feet_inch":
+        return f"{width_ft}'-{rng.randint(0, 11)}\"x{length_ft}'-{rng.randint(0, 11)}\""
+    if fmt == "feet_only":
+        return f"{width_ft}'x{length_ft}'"
+    if fmt == "fraction_inch":
+        return f"{width_ft}'-1/2\"x{length_ft}'-3/4\""
+    if fmt == "decimal_inch":
+        return f"{width_ft}'-{rng.randint(0, 11)}.5\" x {length_ft}'-{rng.randint(0, 11)}.5\""
+    # Metric values are not parsed by feet_inch_to_meter and exercise the skip path
+    return f"{width_ft * 0.3048:.2f}m x {length_ft * 0.3048:.2f}m"
+
+
+def _malformed_room_entry(rng):
+    return rng.choice([
+        "Not Sure",
+        ["Absent"],
+        (None,),
+        ([], "Ground Floor"),
+        (["12x"], "Ground Floor"),
+        (["Not Sure", "", None], ["First Floor"]),
+    ])
+
+
+def _room_entries(rng, floors, rooms_per_type, formats, malformed_rate):
+    entries = []
+    for floor in FLOOR_NAMES[:floors]:
+        if rng.random() < malformed_rate:
+            entries.append(_malformed_room_entry(rng))
+            continue
+        dims = [_dimension(rng, rng.choice(formats)) for _ in range(rooms_per_type)]
+        if rooms_per_type > 1 and rng.random() < 0.3:
+            # Multi-part rooms (e.g. kitchen with separate dining) arrive nested
+            dims = [dims[:1], dims[1:]]
+        entries.append((dims, floor))
+    return entries
+
+
+def _staircase_entries(rng, floors, malformed_rate):
+    entries = []
+    for floor in FLOOR_NAMES[:floors]:
+        if rng.random() < malformed_rate:
+            entries.append({"staircase_width": ["Not Sure"], "staircase_tread": ["0.25"], "staircase_riser": ["abc"], "floor": [floor]})
+            continue
+        entries.append({
+            "staircase_width": [f"{rng.uniform(0.8, 1.4):.3f}"],
+            "staircase_tread": [f"{rng.uniform(0.22, 0.30):.3f}"],
+            "staircase_riser": [f"{rng.uniform(0.15, 0.21):.3f}"],
+            "floor": [floor],
+        })
+    return entries
+
+
+def generate_plan(rng, floors=2, rooms_per_type=2, formats=None, malformed_rate=0.1):
+    """Return one synthetic building entry as produced by analyze_map_with_ai."""
+    formats = formats or DIMENSION_FORMATS
+    plot = rng.uniform(60, 600)
+    building = {
+        "plot_area_far": [{
+            "total_plot_area": [round(plot, 2)],
+            "total_covered_area": [round(plot * rng.uniform(0.4, 1.2), 2)],
+        }],
+        "riser_treader_width": _staircase_entries(rng, floors, malformed_rate),
+        "height_plinth": [{
+            "plinth level": [f"{rng.uniform(0.3, 1.2):.2f}" if rng.random() >= malformed_rate else "Not Sure"],
+            "height": [f"{rng.uniform(6.0, 14.0):.2f}"],
+        }],
+        "floor_count": [{"floor_count": [floors if rng.random() >= malformed_rate else "Not Sure"]}],
+    }
+    for room_type in ROOM_TYPES:
+        building[room_type] = _room_entries(rng, floors, rooms_per_type, formats, malformed_rate)
+    return building
+
+
+def generate_plans(count, seed=0, floors=(1, 4), rooms_per_type=(1, 3), formats=None, malformed_rate=0.1):
+    """
+    Return {map_name: [building]} for `count` synthetic plans.
+
+    `floors` and `rooms_per_type` are inclusive (min, max) ranges sampled per plan.
+    """
+    rng = random.Random(seed)
+    plans = {}
+    for index in range(count):
+        plans[f"synthetic_{index:05d}"] = [generate_plan(
+            rng,
+            floors=rng.randint(*floors),
+            rooms_per_type=rng.randint(*rooms_per_type),
+            formats=formats,
+            malformed_rate=malformed_rate,
+        )]
+    return plans
+
+
+def generate_dimension_strings(count, seed=0, formats=None):
+    """Return `count` dimension strings drawn from the given formats."""
+    rng = random.Random(seed)
+    formats = formats or DIMENSION_FORMATS
+    return [_dimension(rng, rng.choice(formats)) for _ in range(count)]
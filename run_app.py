@@ -12,6 +12,9 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 
+# Local runs have no separate worker service; analyse in this process unless told otherwise
+os.environ.setdefault("ANALYSIS_EMBEDDED_WORKER", "true")
+
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
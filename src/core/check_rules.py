@@ -322,7 +322,26 @@ def check_floor_count(floor_data):
     return passed, logs, structured
 
 # ---------- MAIN PROCESSING ----------
-def process_rooms(data):
+NOT_EVALUATED = "Not Evaluated"
+
+def not_evaluated_result(rule_name, reason):
+    """Structured entry for a rule whose extraction was skipped."""
+    return {
+        "rule": rule_name,
+        "recorded_value": "N/A",
+        "expected_value": "N/A",
+        "status": NOT_EVALUATED,
+        "reason": reason
+    }
+
+def process_rooms(data, skip_rules=None):
+    """
+    Validate every map in `data`.
+
+    `skip_rules` maps rule names to the reason they were not evaluated (fail-fast
+    mode); those rules are reported as "Not Evaluated" and do not affect the verdict.
+    """
+    skip_rules = skip_rules or {}
     human_logs = []
     structured_results = {}
 
@@ -334,6 +353,11 @@ def process_rooms(data):
 
         def log(rule_name, passed, txt_logs, structured):
             nonlocal overall_passed
+            if rule_name in skip_rules:
+                human_log.append(f"{rule_name} - Not Evaluated ⏭")
+                human_log.append(f"  - {skip_rules[rule_name]}")
+                structured_results[map_name][rule_name] = [not_evaluated_result(rule_name, skip_rules[rule_name])]
+                return
             human_log.append(f"{rule_name} - {'Passed ✅' if passed else 'Failed ❌'}")
             human_log.extend([f"  - {log}" for log in txt_logs])
             structured_results[map_name][rule_name] = structured
@@ -380,10 +404,10 @@ def combine_room_results(*results):
         combined_struct.extend(struct)
     return passed_all, combined_logs, combined_struct
 
-def run_validation(base_path=None):
+def run_validation(base_path=None, skip_rules=None):
     file_path = os.path.join(base_path or ".", "output.json")
 
     with open(file_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    return process_rooms(data)
+    return process_rooms(data, skip_rules=skip_rules)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 # main path - get from environment or use current directory
 MAIN_PATH = os.environ.get("PROJECT_ROOT", os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -10,6 +11,115 @@ num_of_zeros = 5
 BOX_CONF = 0.45
 SAVE_CROPS = False
 
+# PDF rasterization: zoom applied to every page, per-page pixel budget (the zoom
+# is lowered for sheets whose physical size would exceed it), tile edge in pixels
+# above which pages are rendered in clipped tiles, which pages to analyse
+# (1-based, e.g. "all", "1", "1,3-4") and a hard page limit
+PDF_RENDER_ZOOM = float(os.environ.get("PDF_RENDER_ZOOM", "1.5"))
+RENDER_PIXEL_BUDGET_MP = float(os.environ.get("RENDER_PIXEL_BUDGET_MP", "16"))
+RENDER_TILE_SIZE = int(os.environ.get("RENDER_TILE_SIZE", "2048"))
+ANALYSIS_PDF_PAGES = os.environ.get("ANALYSIS_PDF_PAGES", "all")
+ANALYSIS_PDF_MAX_PAGES = int(os.environ.get("ANALYSIS_PDF_MAX_PAGES", "20"))
+
+# Render profile for analysis pages: "analysis" (RGB), "analysis-gray" (8-bit
+# grayscale) or "analysis-bilevel" (1-bit, rendered at BILEVEL_RENDER_ZOOM and
+# thresholded at BILEVEL_THRESHOLD). Plans are black linework, so gray is the default.
+ANALYSIS_RENDER_PROFILE = os.environ.get("ANALYSIS_RENDER_PROFILE", "analysis-gray")
+BILEVEL_RENDER_ZOOM = float(os.environ.get("BILEVEL_RENDER_ZOOM", "2.0"))
+BILEVEL_THRESHOLD = int(os.environ.get("BILEVEL_THRESHOLD", "200"))
+
+# Disk-backed raster cache shared by analysis and the preview routes
+RASTER_CACHE_DIR = os.environ.get("RASTER_CACHE_DIR", os.path.join(tempfile.gettempdir(), "buildplanwizard_raster_cache"))
+RASTER_CACHE_MAX_MB = int(os.environ.get("RASTER_CACHE_MAX_MB", "512"))
+PREVIEW_DPI = 150
+THUMBNAIL_MAX_SIZE = 320
+
+# Sandboxed rasterization: PDFs are checked structurally (header, encryption,
+# page and object counts) and rendered in pre-forked helper processes limited
+# to RENDER_SANDBOX_MEMORY_MB of address space and RENDER_SANDBOX_CPU_SECONDS of
+# CPU per task, killed after RENDER_SANDBOX_TIMEOUT_SECONDS of wall-clock time.
+# RENDER_SANDBOX_WORKERS = 0 uses one helper per available core. The limit only
+# contains a decompression bomb if every helper of a process can reach it at
+# once without exhausting the instance (512 MB on the target plan), and if it
+# fires before the analysis watchdog (ANALYSIS_CHILD_MAX_RSS_MB) kills the
+# whole analysis: one helper at 256 MB renders a full 16 MP RGB page.
+RENDER_SANDBOX = os.environ.get("RENDER_SANDBOX", "true").lower() == "true"
+RENDER_SANDBOX_WORKERS = int(os.environ.get("RENDER_SANDBOX_WORKERS", "1"))
+RENDER_SANDBOX_MEMORY_MB = int(os.environ.get("RENDER_SANDBOX_MEMORY_MB", "256"))
+RENDER_SANDBOX_CPU_SECONDS = int(os.environ.get("RENDER_SANDBOX_CPU_SECONDS", "60"))
+RENDER_SANDBOX_TIMEOUT_SECONDS = float(os.environ.get("RENDER_SANDBOX_TIMEOUT_SECONDS", "90"))
+PDF_MAX_PAGES = int(os.environ.get("PDF_MAX_PAGES", "200"))
+PDF_MAX_OBJECTS = int(os.environ.get("PDF_MAX_OBJECTS", "250000"))
+
+# Isolated analyses: the worker runs each analysis in one of its pre-forked
+# child processes (one per slot) and watches the child's RSS, render helpers
+# included. A child above ANALYSIS_CHILD_MAX_RSS_MB is killed and its job
+# failed; a child is replaced after ANALYSIS_CHILD_MAX_JOBS analyses or once it
+# stays above ANALYSIS_CHILD_RECYCLE_RSS_MB between jobs. Jobs are claimed only
+# while the worker's process tree plus the projected peak growth of each
+# running and new analysis (at least ANALYSIS_JOB_PEAK_MB, raised by recently
+# observed peaks) fits ANALYSIS_MEMORY_BUDGET_MB; 0 disables the check.
+ANALYSIS_ISOLATION = os.environ.get("ANALYSIS_ISOLATION", "true").lower() == "true"
+ANALYSIS_CHILD_MAX_JOBS = int(os.environ.get("ANALYSIS_CHILD_MAX_JOBS", "20"))
+ANALYSIS_CHILD_MAX_RSS_MB = int(os.environ.get("ANALYSIS_CHILD_MAX_RSS_MB", "384"))
+ANALYSIS_CHILD_RECYCLE_RSS_MB = int(os.environ.get("ANALYSIS_CHILD_RECYCLE_RSS_MB", "256"))
+ANALYSIS_CHILD_TIMEOUT_SECONDS = float(os.environ.get("ANALYSIS_CHILD_TIMEOUT_SECONDS", "1800"))
+ANALYSIS_MEMORY_BUDGET_MB = int(os.environ.get("ANALYSIS_MEMORY_BUDGET_MB", "448"))
+ANALYSIS_JOB_PEAK_MB = int(os.environ.get("ANALYSIS_JOB_PEAK_MB", "160"))
+
+# Raster uploads are normalized in the background after insert: EXIF orientation
+# applied, metadata stripped, downscaled to the analysis pixel budget and
+# re-encoded as WebP. The untouched original moves to the cold originals store.
+UPLOAD_NORMALIZATION = os.environ.get("UPLOAD_NORMALIZATION", "true").lower() == "true"
+UPLOAD_WEBP_QUALITY = int(os.environ.get("UPLOAD_WEBP_QUALITY", "85"))
+# Threads normalizing uploads in the web process, and uploads allowed to wait
+# for one; past that, uploads are kept as stored
+UPLOAD_NORMALIZATION_WORKERS = int(os.environ.get("UPLOAD_NORMALIZATION_WORKERS", "1"))
+UPLOAD_NORMALIZATION_BACKLOG = int(os.environ.get("UPLOAD_NORMALIZATION_BACKLOG", "8"))
+
+# Uploaded plan files live in a content-addressed blob store (keyed by SHA-256,
+# shared by identical uploads); maps rows keep only the digest and size.
+# BLOB_STORE is "local" (files under BLOB_STORE_DIR) or "s3" (any S3-compatible
+# endpoint; BLOB_STORE_DIR is then the local read-through copy).
+BLOB_STORE = os.environ.get("BLOB_STORE", "local").lower()
+BLOB_STORE_DIR = os.environ.get("BLOB_STORE_DIR", os.path.join(MAIN_PATH, "storage", "blobs"))
+BLOB_S3_BUCKET = os.environ.get("BLOB_S3_BUCKET", "")
+BLOB_S3_PREFIX = os.environ.get("BLOB_S3_PREFIX", "maps/")
+BLOB_S3_ENDPOINT_URL = os.environ.get("BLOB_S3_ENDPOINT_URL", "")
+# Size bound of each local read-through copy of an s3 store (least recently
+# read blobs are deleted first; 0: unbounded)
+BLOB_CACHE_MAX_MB = int(os.environ.get("BLOB_CACHE_MAX_MB", "512"))
+# A local store survives a redeploy only on a persistent disk; say so with
+# BLOB_STORE_LOCAL_DURABLE. In production (APP_ENV=production, or on Render,
+# which sets RENDER=true) startup fails unless the store is durable, since the
+# local disk there is wiped on every deploy and not shared with other services.
+BLOB_STORE_LOCAL_DURABLE = os.environ.get("BLOB_STORE_LOCAL_DURABLE", "false").lower() == "true"
+PRODUCTION = (os.environ.get("APP_ENV", "").lower() == "production"
+              or os.environ.get("RENDER", "").lower() == "true")
+# Cold store for the originals of normalized uploads, read only to recover
+# one: a directory next to the blob store with BLOB_STORE=local, or objects
+# under their own prefix written with an infrequent-access storage class with
+# BLOB_STORE=s3 (empty: the bucket's default class; S3-compatible services
+# without storage classes need it empty). ORIGINALS_STORE_DIR is the local
+# read-through copy with s3.
+ORIGINALS_STORE_DIR = os.environ.get("ORIGINALS_STORE_DIR", os.path.join(MAIN_PATH, "storage", "originals"))
+ORIGINALS_S3_PREFIX = os.environ.get("ORIGINALS_S3_PREFIX", "originals/")
+ORIGINALS_S3_STORAGE_CLASS = os.environ.get("ORIGINALS_S3_STORAGE_CLASS", "STANDARD_IA")
+# Copy files still held in the legacy maps.image column into the blob store at
+# startup. The column is only cleared once the copy sits in a durable store.
+BLOB_BACKFILL = os.environ.get("BLOB_BACKFILL", "false").lower() == "true"
+
+# Read the PDF text layer before calling the model: groups answered confidently
+# from it skip their model call, the rest get its findings as prompt hints
+TEXT_LAYER_EXTRACTION = os.environ.get("TEXT_LAYER_EXTRACTION", "true").lower() == "true"
+
+# Measure plot, footprint and rooms from PDF vector drawings to cross-check the model
+GEOMETRY_EXTRACTION = os.environ.get("GEOMETRY_EXTRACTION", "true").lower() == "true"
+
+# Label the pages of a multi-sheet PDF (site plan, floor plan, section, elevation,
+# area statement) and send each extractor group only the sheets it reads
+PAGE_CLASSIFICATION = os.environ.get("PAGE_CLASSIFICATION", "true").lower() == "true"
+
 # Get Gemini API keys from environment variables
 gemini_api_keys = [
     key for key in [
@@ -24,6 +134,29 @@ if not gemini_api_keys:
     raise ValueError("No Gemini API keys found! Set GEMINI_API_KEY environment variable.")
 
 gemini_model = "gemini-2.5-flash"
+# Key passed to the last successful genai.configure() (labels the model-call metrics)
+active_gemini_api_key = None
+
+# Model calls per minute shared by every analysis running in a process (the
+# worker's slots share one key budget; 0 disables the limit) and the burst
+# allowed after an idle spell (0: one minute's worth)
+GEMINI_REQUESTS_PER_MINUTE = int(os.environ.get("GEMINI_REQUESTS_PER_MINUTE", "60"))
+GEMINI_REQUEST_BURST = int(os.environ.get("GEMINI_REQUEST_BURST", "0"))
+# The buckets are process-local, so the key's limit is divided by the number of
+# processes that run analyses with it: every worker.py and every web process
+# with the embedded worker. Set this to that count when scaling out, otherwise
+# each process takes the full GEMINI_REQUESTS_PER_MINUTE.
+GEMINI_RATE_LIMIT_PROCESSES = max(1, int(os.environ.get("GEMINI_RATE_LIMIT_PROCESSES", "1")))
+
+# Fail-fast analysis: run the cheap, high-reject extractor groups first and skip
+# the remaining model calls once a rule has definitively failed.
+ANALYSIS_FAIL_FAST = os.environ.get("ANALYSIS_FAIL_FAST", "false").lower() == "true"
+FAIL_FAST_GROUP_ORDER = [
+    group.strip() for group in os.environ.get(
+        "ANALYSIS_FAIL_FAST_ORDER",
+        "area,setback_floors,staircase,room,height_kitchen_bathroom",
+    ).split(",") if group.strip()
+]
 
 def get_gemini_model():
     """Get the configured Gemini model name"""
@@ -33,11 +166,13 @@ def configure_gemini_api():
     """Configure Gemini API with key rotation. Returns configured model or None if all keys fail."""
     import google.generativeai as genai
     
+    global active_gemini_api_key
     last_error = None
     for api_key in gemini_api_keys:
         try:
             genai.configure(api_key=api_key)
             model = genai.GenerativeModel(gemini_model)
+            active_gemini_api_key = api_key
             print(f"Gemini API configured with key: {api_key[:8]}...{api_key[-4:]}")
             return model
         except Exception as e:
@@ -0,0 +1,21 @@
+"""
+Transient vs permanent analysis failures.
+
+A rate-limited, timed-out or unavailable model call will likely succeed if
+the job runs again later, so it is retried with backoff; anything else (an
+unreadable plan, a bug) fails the job straight away.
+"""
+
+# HTTP statuses worth retrying; google.api_core exceptions carry theirs in `.code`
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class TransientAnalysisError(Exception):
+    """The analysis was cut short by a failure expected to clear on retry."""
+
+
+def is_transient_error(exc):
+    if isinstance(exc, (TransientAnalysisError, ConnectionError, TimeoutError)):
+        return True
+    code = getattr(exc, "code", None)
+    return isinstance(code, int) and code in TRANSIENT_STATUS_CODES
@@ -0,0 +1,268 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Counters and histograms are updated where things happen (model calls, job
+outcomes, claim waits); gauges that describe shared state (queue depth,
+pool size, RSS) or mirror running totals kept elsewhere (pool and limiter
+stats) are computed by collectors when /metrics is scraped. Only counters and
+histograms take part in drain()/absorb(), so they only ever go up. Every
+process keeps its own values, so scrape the web app and each worker; the
+queue gauges read from the database and agree across processes.
+
+/metrics answers only scrapes that send METRICS_TOKEN as a bearer token; a
+worker's own endpoint listens on the loopback interface by default and is open
+there without a token.
+"""
+
+import hmac
+import ipaddress
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Seconds; spans a fast DB round trip to a multi-minute analysis
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self):
+        """[(suffix, ((label, value), ...), value), ...] for the exposition."""
+        with self._lock:
+            return [("", tuple(zip(self.labelnames, key)), value) for key, value in sorted(self._values.items())]
+
+    def drain(self):
+        """Return the recorded values and start again from zero."""
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def absorb(self, values):
+        """Add values drained from the same counter in another process."""
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0) + value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value)
+
+    def absorb(self, values):
+        """Add values drained from the same histogram in another process."""
+        with self._lock:
+            for key, (counts, total) in values.items():
+                own_counts, own_total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+                self._values[key] = ([a + b for a, b in zip(own_counts, counts)], own_total + total)
+
+    def samples(self):
+        result = []
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                labels = tuple(zip(self.labelnames, key))
+                for bound, count in zip(self.buckets, counts):
+                    result.append(("_bucket", labels + (("le", _format_value(bound)),), count))
+                result.append(("_sum", labels, total))
+                result.append(("_count", labels, counts[-1]))
+        return result
+
+
+class Registry:
+    """Metrics plus collectors called at scrape time for computed gauges."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector):
+        """`collector()` refreshes gauges before each scrape; its failures are logged, not raised."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def drain(self):
+        """
+        Counter and histogram values recorded since the last drain, by metric
+        name, for a child process to hand to its parent's absorb().
+        """
+        with self._lock:
+            metrics = [metric for metric in self._metrics if hasattr(metric, "absorb")]
+        drained = {metric.name: metric.drain() for metric in metrics}
+        return {name: values for name, values in drained.items() if values}
+
+    def absorb(self, drained):
+        """Merge the output of another process's drain() into this registry."""
+        with self._lock:
+            by_name = {metric.name: metric for metric in self._metrics if hasattr(metric, "absorb")}
+        for name, values in drained.items():
+            if name in by_name:
+                by_name[name].absorb(values)
+
+    def render(self):
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics)
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:
+                print(f"[Metrics] Collector {getattr(collector, '__name__', collector)} failed: {e}", flush=True)
+
+        lines = []
+        for metric in metrics:
+            samples = metric.samples()
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = Registry()
+
+# Model calls, shared by every extractor of the process
+gemini_requests = REGISTRY.counter(
+    "gemini_requests_total", "Gemini generate_content calls by API key and outcome", ("key", "outcome"))
+gemini_request_seconds = REGISTRY.histogram(
+    "gemini_request_seconds", "Gemini generate_content latency by API key", ("key",))
+
+
+def api_key_label(api_key, configured_keys):
+    """Labels an API key by its position in the key rotation ("key0", ...), never by key material."""
+    if api_key in configured_keys:
+        return f"key{configured_keys.index(api_key)}"
+    return "none"
+
+
+process_resident_memory = REGISTRY.gauge("process_resident_memory_bytes", "Resident memory of this process")
+
+
+def _collect_process():
+    import psutil
+    process_resident_memory.set(psutil.Process(os.getpid()).memory_info().rss)
+
+
+REGISTRY.register_collector(_collect_process)
+
+
+def authorized(authorization_header, open_without_token=False):
+    """
+    Scrapes must send "Authorization: Bearer <METRICS_TOKEN>". Without a
+    token configured, only endpoints that allow it (a loopback-bound worker
+    server) answer.
+    """
+    token = os.environ.get("METRICS_TOKEN")
+    if not token:
+        return open_without_token
+    return hmac.compare_digest(authorization_header or "", f"Bearer {token}")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        if not authorized(self.headers.get("Authorization"), open_without_token=self.server.loopback):
+            self.send_error(401)
+            return
+        body = REGISTRY.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # one line per scrape would drown the worker log
+
+
+def serve_metrics(port, host="127.0.0.1"):
+    """
+    Serve GET /metrics on a daemon thread (processes without a web server, i.e.
+    the worker). Bound to a non-loopback host, it requires METRICS_TOKEN.
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.loopback = ipaddress.ip_address(server.server_address[0]).is_loopback
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
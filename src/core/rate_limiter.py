@@ -0,0 +1,82 @@
+"""
+Process-wide rate limit for Gemini calls.
+
+A worker running several analyses at once shares one API key budget, so every
+model call takes a token from a single bucket refilled at
+GEMINI_REQUESTS_PER_MINUTE; a call that finds the bucket empty waits for the
+next token instead of failing with a 429.
+
+The bucket is not shared between processes. The key's limit is divided evenly
+instead: GEMINI_RATE_LIMIT_PROCESSES gives the number of worker processes that
+use the key, and a worker's analysis children split its share again.
+"""
+
+import threading
+import time
+
+from . import config_map as config
+
+
+class RateLimiter:
+    """Thread-safe token bucket: `rate_per_minute` tokens per minute, up to `burst` at once."""
+
+    def __init__(self, rate_per_minute, burst=None):
+        self.rate_per_second = rate_per_minute / 60.0 if rate_per_minute else 0.0
+        self.burst = max(1, burst if burst is not None else int(rate_per_minute or 1))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def acquire(self):
+        """Take one token, sleeping until one is available; return the seconds waited."""
+        if not self.rate_per_second:
+            with self._lock:
+                self.calls += 1
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_second)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.calls += 1
+                    if waited:
+                        self.waits += 1
+                        self.wait_seconds += waited
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(delay)
+            waited += delay
+
+    def split(self, parts):
+        """Keep 1/parts of the rate and burst, for one of `parts` processes sharing the key budget."""
+        with self._lock:
+            self.rate_per_second /= max(1, parts)
+            self.burst = max(1, self.burst // max(1, parts))
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def absorb(self, stats):
+        """Add call and wait counts reported by a child process's limiter."""
+        with self._lock:
+            self.calls += stats.get("calls", 0)
+            self.waits += stats.get("waits", 0)
+            self.wait_seconds += stats.get("wait_seconds", 0.0)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+                "rate_per_minute": self.rate_per_second * 60.0,
+            }
+
+
+gemini_rate_limiter = RateLimiter(config.GEMINI_REQUESTS_PER_MINUTE, config.GEMINI_REQUEST_BURST or None)
+gemini_rate_limiter.split(config.GEMINI_RATE_LIMIT_PROCESSES)
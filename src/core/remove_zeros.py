@@ -12,13 +12,14 @@ import os
 
 class SeamCarver:
     def __init__(self, pil_image):
-        self.pil_image = pil_image.convert("RGB")
+        # Grayscale and RGB pages are read as they are; only other modes are converted
+        self.pil_image = pil_image if pil_image.mode in ("L", "RGB") else pil_image.convert("RGB")
 
     def get_seam_carving_cuts(self, ksize=3, num_of_zeros = 5):
         
-        img = np.array(self.pil_image)
+        img = np.asarray(self.pil_image)
 
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         sobel_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=ksize)
         sobel_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=ksize)
         energy = np.abs(sobel_x) + np.abs(sobel_y)
@@ -27,8 +28,8 @@ class SeamCarver:
         zero_rows = np.where(np.all(energy == 0, axis=1))[0]
         zero_cols = np.where(np.all(energy == 0, axis=0))[0]
 
-        # Remove rows if more than  num_of_zeros are zero
-        img_array = np.array(img)
+        # Remove rows if more than  num_of_zeros are zero (np.delete returns new arrays)
+        img_array = img
         if len(zero_rows) > num_of_zeros:
             energy = np.delete(energy, zero_rows, axis=0)
             img_array = np.delete(img_array, zero_rows, axis=0)
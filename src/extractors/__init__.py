@@ -8,6 +8,9 @@ from .room_extraction import RoomExtractor
 from .setback_floors_extraction import SetbackFloorsExtractor
 from .staircase_extraction import StaircaseExtractor
 from .height_kitchen_bathroom_extraction import HeightKitchenBathroomExtractor
+from .text_layer_extraction import TextLayerExtractor
+from .geometry_extraction import GeometryExtractor
+from .page_classification import PageClassifier
 
 __all__ = [
     'BaseExtractor',
@@ -15,5 +18,8 @@ __all__ = [
     'RoomExtractor',
     'SetbackFloorsExtractor',
     'StaircaseExtractor',
-    'HeightKitchenBathroomExtractor'
+    'HeightKitchenBathroomExtractor',
+    'TextLayerExtractor',
+    'GeometryExtractor',
+    'PageClassifier'
 ]
\ No newline at end of file
@@ -5,9 +5,15 @@ Provides common functionality for all extractor implementations.
 
 import json
 import re
+import time
 from PIL import Image
 from io import BytesIO
 
+from ..core import config_map as config
+from ..core.errors import TransientAnalysisError, is_transient_error
+from ..core.metrics import api_key_label, gemini_request_seconds, gemini_requests
+from ..core.rate_limiter import gemini_rate_limiter
+
 
 class BaseExtractor:
     """
@@ -29,7 +35,8 @@ class BaseExtractor:
         Main extraction method that orchestrates the extraction process.
         
         Args:
-            image: PIL Image object containing the architectural plan
+            image: PIL Image of the architectural plan, or a list of page images
+                   from a multi-sheet plan set
             prompt: String prompt for the AI model
             examples: List of example data (empty for new extractors)
             model: AI model instance (Gemini)
@@ -63,6 +70,9 @@ class BaseExtractor:
             
             return final_output
             
+        except TransientAnalysisError:
+            # The job is retried later rather than reported with empty data
+            raise
         except Exception as e:
             print(f"Extraction error in {self.__class__.__name__}: {str(e)}")
             # Return default/empty structure on error
@@ -73,7 +83,7 @@ class BaseExtractor:
         Call the AI model with the image and prompt.
         
         Args:
-            image: PIL Image to process
+            image: PIL Image (or list of page images) to process
             prompt: Prompt string for the model
             model: AI model instance
             
@@ -81,20 +91,29 @@ class BaseExtractor:
             dict: Parsed JSON response from the model
         """
         try:
-            # Convert PIL image to bytes for model input
-            image_bytes = BytesIO()
-            image.save(image_bytes, format='PNG')
-            image_bytes.seek(0)
-            
-            # Prepare the content for the model
-            content = [
-                prompt,
-                image  # Pass PIL image directly - Gemini can handle it
-            ]
-            
-            # Generate response using the model
-            response = model.generate_content(content)
-            response_text = response.text
+            pages = list(image) if isinstance(image, (list, tuple)) else [image]
+
+            # Prepare the content for the model - Gemini accepts PIL images directly
+            content = [prompt]
+            if len(pages) > 1:
+                content.append(f"The following {len(pages)} images are sheets of the same building plan set.")
+            content.extend(pages)
+            
+            # Generate response using the model, within the process-wide call budget
+            waited = gemini_rate_limiter.acquire()
+            if waited:
+                print(f"Rate limit: waited {waited:.1f}s for a model call slot")
+            key = api_key_label(config.active_gemini_api_key, config.gemini_api_keys)
+            started = time.monotonic()
+            try:
+                response = model.generate_content(content)
+                response_text = response.text
+            except Exception as call_error:
+                gemini_requests.inc(key=key, outcome="transient_error" if is_transient_error(call_error) else "error")
+                raise
+            finally:
+                gemini_request_seconds.observe(time.monotonic() - started, key=key)
+            gemini_requests.inc(key=key, outcome="ok")
             
             # Try to extract JSON from the response
             json_response = self._extract_json_from_response(response_text)
@@ -103,6 +122,8 @@ class BaseExtractor:
             
         except Exception as e:
             print(f"AI model call error: {str(e)}")
+            if is_transient_error(e):
+                raise TransientAnalysisError(f"Model call failed: {str(e)}") from e
             return {}
     
     def _extract_json_from_response(self, response_text):
@@ -143,8 +164,13 @@ class BaseExtractor:
             json_start_arr = response_text.find('[')
             json_end_arr = response_text.rfind(']') + 1
             
-            # Prefer array format if found, otherwise use object format
-            if json_start_arr != -1 and json_end_arr > json_start_arr:
+            # Use whichever bracket opens first, so objects containing arrays
+            # (e.g. {"floor_data": [], ...}) are not truncated to the inner array
+            if json_start_obj != -1 and (json_start_arr == -1 or json_start_obj < json_start_arr) and json_end_obj > json_start_obj:
+                json_str = response_text[json_start_obj:json_end_obj]
+                print(f"Extracted JSON object: {json_str}")
+                return json.loads(json_str)
+            elif json_start_arr != -1 and json_end_arr > json_start_arr:
                 json_str = response_text[json_start_arr:json_end_arr]
                 print(f"Extracted JSON array: {json_str}")
                 return json.loads(json_str)
@@ -0,0 +1,382 @@
+"""
+Local area measurement from PDF vector drawings.
+
+CAD exports draw the plot boundary, the building outline and the rooms as
+vector paths. This extractor rebuilds closed polygons from the page drawings,
+works out the drawing scale (scale notation, scale bar, or dimension strings
+matched to the lines they label) and measures plot area, ground-floor footprint
+and room rectangles with NumPy. Output follows the AreaExtractor and
+RoomExtractor formats so it can be compared with, or stand in for, model output.
+"""
+
+import re
+import statistics
+
+import numpy as np
+
+from .text_layer_extraction import TextLayerExtractor, parse_length_meters, SQFT_PER_SQM
+
+METERS_PER_POINT_PAPER = 0.0254 / 72.0
+
+# Endpoint snapping tolerance (points) when joining loose line segments
+SNAP_TOLERANCE = 0.5
+
+# Dimension-based scale needs this many agreeing samples within the spread
+MIN_SCALE_SAMPLES = 2
+MAX_SCALE_SPREAD = 0.10
+
+# Cross-check tolerance between measured and extracted areas
+CROSS_CHECK_TOLERANCE = 0.10
+
+# Measured rooms smaller than this (m²) are fixtures, not rooms
+MIN_ROOM_AREA_M2 = 1.0
+
+ROOM_WORDS = {
+    "BED": "bedroom",
+    "DRAWING": "drawingroom",
+    "LIVING": "drawingroom",
+    "LOUNGE": "drawingroom",
+    "STUDY": "studyroom",
+    "STORE": "store room",
+}
+
+_METRIC_SCALE = re.compile(r"SCALE\s*[:=\-]?\s*1\s*:\s*(\d+(?:\.\d+)?)")
+_IMPERIAL_SCALE = re.compile(r"SCALE\s*[:=\-]?\s*(\d+)\s*/\s*(\d+)\s*\"\s*=\s*1\s*'")
+_NUMBER = re.compile(r"^\d+(?:\.\d+)?$")
+
+
+def polygon_area(points):
+    """Shoelace area of an (N, 2) vertex array, in the points' squared units."""
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def format_feet_inches(meters):
+    """Format a length in meters as 10'-6" (nearest half inch)."""
+    total_inches = round(meters / 0.0254 * 2) / 2
+    feet, inches = divmod(total_inches, 12)
+    return f"{int(feet)}'-{inches:g}\""
+
+
+class GeometryExtractor:
+    """
+    Measures plot, footprint and rooms from the vector drawings of the
+    selected PDF pages. Results are only produced for pages with a known scale.
+    """
+
+    def __init__(self, source, pages=None, text_layer=None):
+        """
+        Args:
+            source: PDF file path or in-memory PDF bytes
+            pages: 0-based page indexes to read (default: all pages)
+            text_layer: an extracted TextLayerExtractor for the same pages (read if
+                omitted); its page content supplies the drawings
+        """
+        self.source = source
+        self.pages = pages
+        self.text_layer = text_layer
+        self.page_results = {}   # page -> measurements
+
+    def extract(self):
+        """Read the drawings and measure every page with a known scale. Returns self."""
+        if self.text_layer is None:
+            self.text_layer = TextLayerExtractor(self.source, self.pages).extract()
+
+        for page_number, page in self.text_layer.content.items():
+            scale, source = self._page_scale(page_number)
+            if scale is None:
+                continue
+            polygons = self._closed_polygons(page["paths"], page["size"])
+            measured = self._measure(page_number, polygons, scale)
+            if measured:
+                measured["scale_source"] = source
+                self.page_results[page_number] = measured
+        return self
+
+    # ---------- scale ----------
+
+    def _page_scale(self, page_number):
+        """Real meters per PDF point for a page, and how it was found."""
+        rows = [row for row in self.text_layer.rows if row["page"] == page_number]
+
+        # 1. A single scale notation on the sheet
+        scales = set()
+        for row in rows:
+            for match in _METRIC_SCALE.finditer(row["text"]):
+                scales.add(round(METERS_PER_POINT_PAPER * float(match.group(1)), 9))
+            for match in _IMPERIAL_SCALE.finditer(row["text"]):
+                paper_inches_per_foot = float(match.group(1)) / float(match.group(2))
+                scales.add(round(0.3048 / (paper_inches_per_foot * 72.0), 9))
+        if len(scales) == 1:
+            return scales.pop(), "notation"
+
+        # 2. A scale bar: "0 1 2 5 M" with labels placed linearly along x
+        for row in rows:
+            if not re.search(r"(?<![A-Z])(M|MTR|METRES?|METERS?)$", row["text"]):
+                continue
+            ticks = [(float(w[4]), (w[0] + w[2]) / 2) for w in row["words"] if _NUMBER.match(w[4])]
+            if len(ticks) >= 3 and ticks[0][0] == 0:
+                values, xs = np.array(ticks).T
+                slope, intercept = np.polyfit(values, xs, 1)
+                residual = np.abs(xs - (slope * values + intercept)).max()
+                if slope > 0 and residual <= 1.0:
+                    return 1.0 / slope, "scale_bar"
+
+        # 3. Dimension strings calibrated against the lines they label
+        samples = []
+        for dimension in self.text_layer.dimensions:
+            if dimension["page"] != page_number or not dimension["line_length"] or "X" in dimension["text"]:
+                continue
+            meters = parse_length_meters(dimension["text"])
+            if meters:
+                samples.append(meters / dimension["line_length"])
+        if len(samples) >= MIN_SCALE_SAMPLES:
+            median = statistics.median(samples)
+            agreeing = [s for s in samples if abs(s - median) <= MAX_SCALE_SPREAD * median]
+            if len(agreeing) >= MIN_SCALE_SAMPLES:
+                return statistics.median(agreeing), "dimensions"
+        return None, None
+
+    # ---------- polygons ----------
+
+    def _closed_polygons(self, paths, page_size):
+        """Closed polygons (arrays of vertices) from rectangles, quads, closed paths and joined segments."""
+        page_width, page_height = page_size
+        polygons, loose = [], []
+        for closed, items in paths:
+            chain = []
+            for item in items:
+                op = item[0]
+                if op == "re":
+                    x0, y0, x1, y1 = item[1:]
+                    polygons.append(np.array([(x0, y0), (x1, y0), (x1, y1), (x0, y1)]))
+                elif op == "qu":
+                    polygons.append(np.array(item[1:]).reshape(4, 2))
+                elif op in ("l", "c"):
+                    # Curves arrive as their chord
+                    start_x, start_y, end_x, end_y = item[1:]
+                    if chain and abs(chain[-1][0] - start_x) <= SNAP_TOLERANCE and abs(chain[-1][1] - start_y) <= SNAP_TOLERANCE:
+                        chain.append((end_x, end_y))
+                    else:
+                        if len(chain) >= 2:
+                            loose.append(chain)
+                        chain = [(start_x, start_y), (end_x, end_y)]
+            if len(chain) >= 2:
+                first, last = np.array(chain[0]), np.array(chain[-1])
+                if closed and len(chain) >= 3:
+                    polygons.append(np.array(chain))
+                elif len(chain) >= 4 and np.abs(first - last).max() <= SNAP_TOLERANCE:
+                    polygons.append(np.array(chain[:-1]))
+                else:
+                    loose.append(chain)
+        polygons.extend(self._join_segments(loose))
+
+        # Drop the sheet frame and degenerate shapes
+        result = []
+        for polygon in polygons:
+            width = np.ptp(polygon[:, 0])
+            height = np.ptp(polygon[:, 1])
+            if width >= 0.85 * page_width and height >= 0.85 * page_height:
+                continue
+            if width > SNAP_TOLERANCE and height > SNAP_TOLERANCE:
+                result.append(polygon)
+        return result
+
+    @staticmethod
+    def _join_segments(chains):
+        """Join open chains whose snapped endpoints form simple cycles into polygons."""
+        adjacency, coords = {}, {}
+        for chain in chains:
+            for (x0, y0), (x1, y1) in zip(chain, chain[1:]):
+                a = (round(x0 / SNAP_TOLERANCE), round(y0 / SNAP_TOLERANCE))
+                b = (round(x1 / SNAP_TOLERANCE), round(y1 / SNAP_TOLERANCE))
+                if a == b:
+                    continue
+                coords[a], coords[b] = (x0, y0), (x1, y1)
+                adjacency.setdefault(a, set()).add(b)
+                adjacency.setdefault(b, set()).add(a)
+
+        polygons, seen = [], set()
+        for start in adjacency:
+            if start in seen or len(adjacency[start]) != 2:
+                continue
+            cycle, previous, node = [start], None, start
+            while True:
+                seen.add(node)
+                neighbours = [n for n in adjacency[node] if n != previous]
+                if len(adjacency[node]) != 2 or not neighbours:
+                    cycle = None
+                    break
+                previous, node = node, neighbours[0]
+                if node == start:
+                    break
+                if node in seen:
+                    cycle = None
+                    break
+                cycle.append(node)
+            if cycle and len(cycle) >= 3:
+                polygons.append(np.array([coords[n] for n in cycle]))
+        return polygons
+
+    # ---------- measurement ----------
+
+    def _measure(self, page_number, polygons, scale):
+        if not polygons:
+            return None
+        areas = np.array([polygon_area(p) for p in polygons]) * scale * scale
+        boxes = np.array([(p[:, 0].min(), p[:, 1].min(), p[:, 0].max(), p[:, 1].max()) for p in polygons])
+
+        def inside(outer_index):
+            o = boxes[outer_index]
+            tol = SNAP_TOLERANCE
+            return ((boxes[:, 0] >= o[0] - tol) & (boxes[:, 1] >= o[1] - tol)
+                    & (boxes[:, 2] <= o[2] + tol) & (boxes[:, 3] <= o[3] + tol))
+
+        # The plot is the largest polygon that encloses a building-sized polygon
+        plot_index = footprint_index = None
+        for index in np.argsort(-areas):
+            ratios = areas / areas[index]
+            candidates = np.flatnonzero(inside(index) & (ratios >= 0.1) & (ratios < 0.98))
+            if len(candidates):
+                plot_index = index
+                footprint_index = candidates[np.argmax(areas[candidates])]
+                break
+        if plot_index is None:
+            return None
+
+        rooms = self._rooms(page_number, polygons, areas, boxes, inside(footprint_index), footprint_index, scale)
+        return {
+            "plot_area_m2": float(areas[plot_index]),
+            "footprint_area_m2": float(areas[footprint_index]),
+            "rooms": rooms,
+        }
+
+    def _rooms(self, page_number, polygons, areas, boxes, within_footprint, footprint_index, scale):
+        """Labelled axis-aligned rectangles inside the footprint, as {room type: [(w, l) meters]}."""
+        labels = []
+        for row in self.text_layer.rows:
+            if row["page"] != page_number:
+                continue
+            for word in row["words"]:
+                text = word[4].upper()
+                for key, room_type in ROOM_WORDS.items():
+                    if key in text:
+                        labels.append((room_type, (word[0] + word[2]) / 2, (word[1] + word[3]) / 2))
+
+        candidates = [
+            i for i in np.flatnonzero(within_footprint)
+            if i != footprint_index and len(polygons[i]) == 4
+            and MIN_ROOM_AREA_M2 <= areas[i] <= 0.6 * areas[footprint_index]
+        ]
+        rooms = {}
+        for room_type, x, y in labels:
+            containing = [i for i in candidates if boxes[i][0] <= x <= boxes[i][2] and boxes[i][1] <= y <= boxes[i][3]]
+            if not containing:
+                continue
+            best = min(containing, key=lambda i: areas[i])
+            width = (boxes[best][2] - boxes[best][0]) * scale
+            length = (boxes[best][3] - boxes[best][1]) * scale
+            rooms.setdefault(room_type, []).append(tuple(sorted((round(width, 3), round(length, 3)))))
+        return rooms
+
+    # ---------- results ----------
+
+    def _best_page(self):
+        if not self.page_results:
+            return None
+        return max(self.page_results.values(), key=lambda r: r["plot_area_m2"])
+
+    def area_result(self):
+        """
+        AreaExtractor-compatible output (areas in sq. ft.), or None when nothing
+        was measured. Total covered area is the footprint times the text layer's
+        floor count; it and FAR are None when the floor count was not read.
+        """
+        best = self._best_page()
+        if best is None:
+            return None
+        plot = round(best["plot_area_m2"] * SQFT_PER_SQM, 2)
+        footprint = round(best["footprint_area_m2"] * SQFT_PER_SQM, 2)
+        floors = self.text_layer.values.get("no_of_floors") if self.text_layer is not None else None
+        covered = far = None
+        if floors and floors > 0:
+            covered = round(footprint * int(floors), 2)
+            far = round(covered / plot, 2) if plot > 0 else None
+        return {
+            "floor_data": [],
+            "plot_data": {
+                "total_plot_area": plot,
+                "ground_covered_area": footprint,
+                "total_covered_area": covered,
+                "far": far,
+            },
+        }
+
+    def room_result(self):
+        """RoomExtractor-compatible output, or None when no labelled room was measured."""
+        floor = {}
+        for measured in self.page_results.values():
+            for room_type, sizes in measured["rooms"].items():
+                for width, length in sizes:
+                    floor.setdefault(room_type, []).append(f"{format_feet_inches(width)} x {format_feet_inches(length)}")
+        if not floor:
+            return None
+        return {"floor_data": [floor]}
+
+    def cross_check(self, group_name, result):
+        """Return messages where an extracted group result disagrees with the measured geometry."""
+        messages = []
+        if group_name == "area":
+            measured = self.area_result()
+            plot_data = result.get("plot_data", {}) if isinstance(result, dict) else {}
+            if not measured or not isinstance(plot_data, dict):
+                return messages
+            for key in ("total_plot_area", "ground_covered_area"):
+                extracted = plot_data.get(key)
+                expected = measured["plot_data"][key]
+                if isinstance(extracted, (int, float)) and extracted > 0 and expected > 0:
+                    if abs(extracted - expected) > CROSS_CHECK_TOLERANCE * expected:
+                        messages.append(f"{key}: extracted {extracted:g} sq. ft. vs measured {expected:g} sq. ft.")
+        elif group_name == "room":
+            measured = self.room_result()
+            floors = result.get("floor_data", []) if isinstance(result, dict) else []
+            if not measured or not floors or not isinstance(floors[0], dict):
+                return messages
+            for room_type, sizes in measured["floor_data"][0].items():
+                extracted = [v for v in floors[0].get(room_type, []) if isinstance(v, str) and "x" in v.lower()]
+                if len(extracted) != len(sizes):
+                    messages.append(f"{room_type}: extracted {len(extracted)} room(s) vs {len(sizes)} measured ({', '.join(sizes)})")
+        return messages
+
+    def hints(self, group_name):
+        """Prompt text with the measured values for a group ("" when nothing was measured)."""
+        if group_name == "area":
+            measured = self.area_result()
+            if not measured:
+                return ""
+            plot_data = measured["plot_data"]
+            return (
+                "\n\nVECTOR GEOMETRY (measured from the drawing lines; use it to sanity-check what you read): "
+                f"plot boundary ≈ {plot_data['total_plot_area']:g} sq. ft., "
+                f"ground floor footprint ≈ {plot_data['ground_covered_area']:g} sq. ft."
+                + (f", footprint × floor count ≈ {plot_data['total_covered_area']:g} sq. ft."
+                   if plot_data["total_covered_area"] is not None else "")
+            )
+        if group_name == "room":
+            measured = self.room_result()
+            if not measured:
+                return ""
+            lines = [f"- {room_type}: {', '.join(sizes)}" for room_type, sizes in measured["floor_data"][0].items()]
+            return "\n\nVECTOR GEOMETRY (labelled room outlines measured from the drawing lines):\n" + "\n".join(lines)
+        return ""
+
+    def summary(self):
+        return {
+            page + 1: {
+                "scale_source": r["scale_source"],
+                "plot_area_m2": round(r["plot_area_m2"], 2),
+                "footprint_area_m2": round(r["footprint_area_m2"], 2),
+                "rooms": sum(len(v) for v in r["rooms"].values()),
+            }
+            for page, r in self.page_results.items()
+        }
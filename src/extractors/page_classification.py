@@ -0,0 +1,236 @@
+"""
+Cheap local classification of the sheets of a plan set.
+
+A submitted PDF usually carries a site plan, one or more floor plans, a
+section, an elevation and an area statement. Sending every sheet to every
+extractor multiplies the image tokens of each model call by the page count, so
+each page is labelled from its text-layer keywords, line-density statistics of
+its vector drawings (or of the rendered raster for scanned sheets) and its
+aspect ratio, and each extractor group receives only the page types it reads.
+"""
+
+import numpy as np
+
+from .text_layer_extraction import TextLayerExtractor
+
+
+PAGE_TYPES = ("site_plan", "floor_plan", "section", "elevation", "area_statement")
+
+# Sheet titles: one match is strong evidence for the page type
+TITLE_KEYWORDS = {
+    "site_plan": ("SITE PLAN", "LOCATION PLAN", "KEY PLAN", "LAYOUT PLAN"),
+    "floor_plan": ("FLOOR PLAN", "GROUND FLOOR", "FIRST FLOOR", "SECOND FLOOR", "TERRACE PLAN", "BASEMENT PLAN"),
+    "section": ("SECTION", "SECTIONAL", "SEC. A-A", "SECTION A-A", "SECTION X-X"),
+    "elevation": ("ELEVATION", "FRONT VIEW", "SIDE VIEW"),
+    "area_statement": ("AREA STATEMENT", "AREA CALCULATION", "AREA DETAILS", "AREA CHART", "AREA TABLE"),
+}
+
+# Words that appear on the drawing itself; weaker, counted per occurrence
+CONTENT_KEYWORDS = {
+    "site_plan": ("ROAD", "PLOT NO", "KHASRA", "NORTH", "NEIGHBOUR", "BOUNDARY", "GATE", "SETBACK"),
+    "floor_plan": ("BED ROOM", "BEDROOM", "KITCHEN", "TOILET", "DRAWING", "LIVING", "DINING", "STORE", "BATH", "LOBBY"),
+    "section": ("RISER", "TREAD", "SLAB", "PLINTH", "LINTEL", "PARAPET", "FOUNDATION", "G.L.", "FFL"),
+    "elevation": ("WINDOW", "RAILING", "CLADDING", "FINISH", "PAINT"),
+    "area_statement": ("COVERED AREA", "PLOT AREA", "F.A.R", "GROUND COVERAGE", "PERMISSIBLE", "PROPOSED", "SQ.M", "SQ.FT", "TOTAL"),
+}
+
+TITLE_WEIGHT = 3.0
+CONTENT_WEIGHT = 0.5
+CONTENT_CAP = 3           # occurrences counted per content keyword
+
+# Below this score the page is "unknown" and sent to every group
+MIN_PAGE_SCORE = 1.5
+
+# Segments shorter than this (points) are hatching and text strokes, not linework
+MIN_SEGMENT_LENGTH = 4.0
+# Angle tolerance (radians) for horizontal / vertical segments
+ORTHOGONAL_TOLERANCE = 0.03
+
+# Drawn length per page diagonal separating sparse sheets (site plans, tables,
+# elevations) from dense ones (floor plans), and the text density of a table sheet
+SPARSE_LINE_DENSITY = 10.0
+TABLE_WORDS_PER_SQ_IN = 0.15
+
+# Raster fallback: pages with fewer words and segments than these are treated as scans
+MIN_VECTOR_WORDS = 5
+MIN_VECTOR_SEGMENTS = 20
+RASTER_SAMPLE_SIZE = 1024
+
+
+def _segment_stats(segments):
+    """Total length and horizontal / vertical / diagonal length shares of line segments."""
+    if len(segments) == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    dx = segments[:, 2] - segments[:, 0]
+    dy = segments[:, 3] - segments[:, 1]
+    lengths = np.hypot(dx, dy)
+    keep = lengths >= MIN_SEGMENT_LENGTH
+    if not keep.any():
+        return 0.0, 0.0, 0.0, 0.0
+    dx, dy, lengths = np.abs(dx[keep]), np.abs(dy[keep]), lengths[keep]
+    angles = np.arctan2(dy, dx)
+    horizontal = angles <= ORTHOGONAL_TOLERANCE
+    vertical = angles >= np.pi / 2 - ORTHOGONAL_TOLERANCE
+    total = float(lengths.sum())
+    h_share = float(lengths[horizontal].sum()) / total
+    v_share = float(lengths[vertical].sum()) / total
+    return total, h_share, v_share, 1.0 - h_share - v_share
+
+
+def drawing_segments(paths):
+    """Straight segments of a page's vector paths (read_page_content), rectangles split into their edges."""
+    segments = []
+    for _, items in paths:
+        for item in items:
+            if item[0] == "l":
+                segments.append(item[1:])
+            elif item[0] == "re":
+                x0, y0, x1, y1 = item[1:]
+                segments.extend(((x0, y0, x1, y0), (x1, y0, x1, y1), (x1, y1, x0, y1), (x0, y1, x0, y0)))
+    return np.array(segments, dtype=np.float64).reshape(-1, 4)
+
+
+def raster_features(image):
+    """
+    Line-density statistics of a rendered page: ink share and the share of
+    long horizontal vs vertical strokes, from a downsampled grayscale copy.
+    """
+    # Box-reduce first, so only the small sample is ever converted and copied
+    factor = max(1, max(image.size) // RASTER_SAMPLE_SIZE)
+    sample = image.convert("L") if image.mode == "1" else image
+    if factor > 1:
+        sample = sample.reduce(factor)
+    if sample.mode != "L":
+        sample = sample.convert("L")
+    ink = np.asarray(sample) < 128
+    if not ink.any():
+        return {"ink": 0.0, "h_share": 0.0, "v_share": 0.0}
+    # A row or column that is a quarter ink is a drawn line, not text
+    h_lines = int((ink.mean(axis=1) > 0.25).sum())
+    v_lines = int((ink.mean(axis=0) > 0.25).sum())
+    lines = max(h_lines + v_lines, 1)
+    return {"ink": float(ink.mean()), "h_share": h_lines / lines, "v_share": v_lines / lines}
+
+
+class PageClassifier:
+    """
+    Labels the selected PDF pages as site plan, floor plan, section, elevation
+    or area statement, and routes extractor groups to the pages they need.
+    """
+
+    def __init__(self, source, pages=None, text_layer=None, images=None):
+        """
+        Args:
+            source: PDF file path or in-memory PDF bytes
+            pages: 0-based page indexes to classify (default: all pages)
+            text_layer: an extracted TextLayerExtractor for the same pages (read if
+                omitted); its page content supplies the drawings
+            images: rendered images of `pages`, in order, used for scanned sheets
+        """
+        self.source = source
+        self.pages = pages
+        self.text_layer = text_layer
+        self.images = images
+        self.features = {}   # page -> feature dict
+        self.scores = {}     # page -> {page type: score}
+        self.labels = {}     # page -> page type or "unknown"
+
+    def classify(self):
+        """Compute features and a label for every page. Returns self."""
+        if self.text_layer is None:
+            self.text_layer = TextLayerExtractor(self.source, self.pages).extract()
+
+        for index, (page_number, page) in enumerate(self.text_layer.content.items()):
+            image = self.images[index] if self.images and index < len(self.images) else None
+            features = self._page_features(page_number, page["size"], drawing_segments(page["paths"]), image)
+            scores = self._score(features)
+            best = max(scores, key=scores.get)
+            self.features[page_number] = features
+            self.scores[page_number] = scores
+            self.labels[page_number] = best if scores[best] >= MIN_PAGE_SCORE else "unknown"
+        return self
+
+    def _page_features(self, page_number, page_size, segments, image):
+        rows = [row for row in self.text_layer.rows if row["page"] == page_number]
+        text = "\n".join(row["text"] for row in rows)
+        word_count = sum(len(row["words"]) for row in rows)
+
+        width, height = page_size
+        square_inches = max(width * height / 5184.0, 1.0)
+        total_length, h_share, v_share, d_share = _segment_stats(segments)
+        features = {
+            "text": text,
+            "aspect": width / max(height, 1.0),
+            "words_per_sq_in": word_count / square_inches,
+            # Drawn length per unit of page diagonal: ~3 for a bordered empty sheet
+            "line_density": total_length / max(np.hypot(width, height), 1.0),
+            "h_share": h_share,
+            "v_share": v_share,
+            "d_share": d_share,
+            "source": "vector",
+        }
+
+        if word_count < MIN_VECTOR_WORDS and len(segments) < MIN_VECTOR_SEGMENTS and image is not None:
+            raster = raster_features(image)
+            features.update({
+                "aspect": image.width / max(image.height, 1),
+                # Same rough scale as the vector density: ink share of a plan is a few percent
+                "line_density": raster["ink"] * 500.0,
+                "h_share": raster["h_share"],
+                "v_share": raster["v_share"],
+                "d_share": 0.0,
+                "source": "raster",
+            })
+        return features
+
+    @staticmethod
+    def _score(features):
+        scores = dict.fromkeys(PAGE_TYPES, 0.0)
+        text = features["text"]
+        for page_type, keywords in TITLE_KEYWORDS.items():
+            if any(keyword in text for keyword in keywords):
+                scores[page_type] += TITLE_WEIGHT
+        for page_type, keywords in CONTENT_KEYWORDS.items():
+            for keyword in keywords:
+                scores[page_type] += CONTENT_WEIGHT * min(text.count(keyword), CONTENT_CAP)
+
+        density = features["line_density"]
+        h_share, v_share, d_share = features["h_share"], features["v_share"], features["d_share"]
+        orthogonal = h_share + v_share
+
+        # Area statements are tables: many words, little linework, portrait A4/A3
+        if features["words_per_sq_in"] > TABLE_WORDS_PER_SQ_IN and density < SPARSE_LINE_DENSITY:
+            scores["area_statement"] += 1.0
+        if features["aspect"] < 0.85:
+            scores["area_statement"] += 0.5
+        # Floor plans: dense orthogonal walls in both directions
+        if density > SPARSE_LINE_DENSITY and orthogonal > 0.8 and 0.3 < h_share / max(orthogonal, 1e-9) < 0.7:
+            scores["floor_plan"] += 1.5
+        # Sections and elevations: floor levels and slabs make horizontals dominate
+        if orthogonal > 0 and h_share / orthogonal > 0.65:
+            scores["section"] += 0.75
+            scores["elevation"] += 0.75
+        # Stairs and roof slopes are the diagonals of a section
+        if d_share > 0.1:
+            scores["section"] += 0.5
+        # Site plans: sparse linework, irregular plot boundaries
+        if 0 < density < SPARSE_LINE_DENSITY:
+            scores["site_plan"] += 0.5
+        if d_share > 0.05 and density < 2 * SPARSE_LINE_DENSITY:
+            scores["site_plan"] += 0.5
+        if features["aspect"] > 1.6:
+            scores["section"] += 0.25
+            scores["elevation"] += 0.25
+        return scores
+
+    def route(self, page_types):
+        """
+        Pages an extractor group should see: those labelled with one of
+        `page_types` plus unclassified pages. Falls back to every page when
+        none match, so a group is never left without input.
+        """
+        selected = [page for page, label in self.labels.items() if label in page_types or label == "unknown"]
+        return selected if selected else list(self.labels)
+
+    def summary(self):
+        return {page + 1: label for page, label in self.labels.items()}
@@ -0,0 +1,518 @@
+"""
+Local pre-extraction from the PDF text layer and vector drawings.
+
+CAD exports carry their area statements, setback notes, room labels and
+dimension strings as real text. This extractor reads them with PyMuPDF (words
+and drawing paths, with bounding boxes) before any model call. When a group's
+values are found unambiguously, analysis uses them instead of calling the model;
+otherwise the findings are added to that group's prompt as hints.
+
+read_page_content() is the only pass over the PDF: it collects each page's
+words and vector paths as plain tuples, so it can run in a render sandbox
+helper, and the geometry and page classification passes reuse its result
+instead of parsing the drawings again.
+"""
+
+import re
+
+import fitz  # PyMuPDF
+import numpy as np
+
+
+SQFT_PER_SQM = 10.7639
+SQFT_PER_SQYD = 9.0
+METERS_PER_FOOT = 0.3048
+
+# Fewer words than this on the selected pages means a scanned plan (no text layer)
+MIN_TEXT_LAYER_WORDS = 20
+
+# Horizontal gap, in word heights, beyond which words on one line form separate rows
+ROW_GAP_FACTOR = 30
+
+# Row labels of the area statement, most specific first
+AREA_LABELS = {
+    "total_plot_area": ("TOTAL PLOT AREA", "PLOT AREA", "SITE AREA", "AREA OF PLOT"),
+    "ground_covered_area": ("GROUND FLOOR COVERED AREA", "GROUND COVERED AREA", "GROUND COVERAGE", "GR. COV. AREA"),
+    "total_covered_area": ("TOTAL COVERED AREA", "TOTAL COV. AREA", "TOTAL BUILT UP AREA", "TOTAL BUILT-UP AREA"),
+    "far": ("F.A.R.", "F.A.R", "FAR"),
+}
+
+SETBACK_LABELS = {
+    "front_setback": ("FRONT SETBACK", "FRONT SET BACK", "SETBACK FRONT", "SETBACK (FRONT)"),
+    "rear_setback": ("REAR SETBACK", "REAR SET BACK", "BACK SETBACK", "SETBACK REAR", "SETBACK (REAR)"),
+    "left_side_setback": ("LEFT SIDE SETBACK", "LEFT SETBACK", "SIDE SETBACK (LEFT)", "SETBACK LEFT", "SETBACK (LEFT)"),
+    "right_side_setback": ("RIGHT SIDE SETBACK", "RIGHT SETBACK", "SIDE SETBACK (RIGHT)", "SETBACK RIGHT", "SETBACK (RIGHT)"),
+}
+
+FLOOR_COUNT_LABELS = ("NO. OF FLOORS", "NO OF FLOORS", "NUMBER OF FLOORS", "NO. OF STOREYS", "NO OF STOREYS")
+
+# Table column headers: values under "as per map" win over "permissible" ones
+PROPOSED_HEADERS = ("AS PER MAP", "PROPOSED", "PROVIDED", "ACHIEVED")
+
+# Labels whose nearby dimension strings are passed to each group as hints
+GROUP_LABELS = {
+    "room": ("BED ROOM", "BEDROOM", "DRAWING", "LIVING", "STUDY", "STORE"),
+    "staircase": ("STAIR", "STAIRCASE", "RISER", "TREAD"),
+    "height_kitchen_bathroom": ("KITCHEN", "DINING", "BATH", "TOILET", "W.C", "WC", "PLINTH", "HEIGHT"),
+}
+
+_AREA_VALUE = re.compile(
+    r"(\d[\d,]*(?:\.\d+)?)\s*"
+    r"(SQ\.?\s*M(?:TRS?|ETERS?|ETRES?|T)?\.?(?![A-Z])|SQM(?![A-Z])|M2(?![A-Z0-9])|M²"
+    r"|SQ\.?\s*F(?:T|EET)\.?(?![A-Z])|SFT(?![A-Z])|SQFT(?![A-Z])"
+    r"|SQ\.?\s*Y(?:D|DS|ARDS?)\.?(?![A-Z]))?"
+)
+_FAR_VALUE = re.compile(r"(\d+(?:\.\d+)?)\s*:\s*(\d+(?:\.\d+)?)|(\d+)\.(\d+\.\d+)|(\d+(?:\.\d+)?)")
+_FEET_INCHES = re.compile(r"(\d+(?:\.\d+)?)\s*'\s*(?:-\s*)?(?:(\d+(?:\.\d+)?)\s*\")?")
+_METERS = re.compile(r"(\d+(?:\.\d+)?)\s*(?:M|MT|MTR|MTRS|METERS?|METRES?)(?![A-Z])")
+_DIMENSION = re.compile(
+    r"\d+(?:\.\d+)?\s*'\s*(?:-\s*)?(?:\d+(?:\.\d+)?\s*\")?(?:\s*[X×]\s*\d+(?:\.\d+)?\s*'\s*(?:-\s*)?(?:\d+(?:\.\d+)?\s*\")?)?"
+    r"|\d+(?:\.\d+)?\s*[X×]\s*\d+(?:\.\d+)?(?:\s*M(?![A-Z]))?"
+    r"|\d+\.\d+\s*M(?![A-Z])"
+)
+_INTEGER = re.compile(r"\b(\d{1,2})\b")
+
+_NORMALIZE = str.maketrans({"′": "'", "’": "'", "″": '"', "”": '"', "“": '"', "½": ".5"})
+
+
+def _normalize(text):
+    return text.translate(_NORMALIZE).upper()
+
+
+def _label_pattern(label):
+    return re.compile(r"(?<![A-Z])" + re.escape(label) + r"(?![A-Z])")
+
+
+def _area_unit_factor(unit):
+    """Square-feet multiplier for an area unit token, or None when no unit is given."""
+    if not unit:
+        return None
+    unit = unit.replace(" ", "").replace(".", "")
+    if "F" in unit:
+        return 1.0
+    if "Y" in unit:
+        return SQFT_PER_SQYD
+    return SQFT_PER_SQM
+
+
+def _area_unit_kinds(text):
+    kinds = set()
+    for match in _AREA_VALUE.finditer(text):
+        if match.group(2):
+            kinds.add(_area_unit_factor(match.group(2)))
+    for token, factor in (("SQ.FT", 1.0), ("SQFT", 1.0), ("SQ.M", SQFT_PER_SQM), ("SQM", SQFT_PER_SQM), ("SQ.YD", SQFT_PER_SQYD)):
+        if token in text.replace(" ", ""):
+            kinds.add(factor)
+    return kinds
+
+
+def parse_length_meters(text):
+    """Parse a single length such as 10'6", 3.05M or 3.05 into meters; bare numbers return None."""
+    text = _normalize(text)
+    match = _FEET_INCHES.search(text)
+    if match:
+        feet = float(match.group(1))
+        inches = float(match.group(2)) if match.group(2) else 0.0
+        return round((feet + inches / 12.0) * METERS_PER_FOOT, 2)
+    match = _METERS.search(text)
+    if match:
+        return round(float(match.group(1)), 2)
+    return None
+
+
+def parse_far(text):
+    """Parse an FAR written as 0.8, 1:0.8 or 1.0.80 (the ratio's second number)."""
+    match = _FAR_VALUE.search(_normalize(text))
+    if not match:
+        return None
+    if match.group(2):
+        return float(match.group(2))
+    if match.group(4):
+        return float(match.group(4))
+    return float(match.group(5))
+
+
+def _path_items(path):
+    """A drawing path's items as plain tuples: ("l"/"c"/"re", x0, y0, x1, y1) or ("qu", 8 corner coordinates)."""
+    items = []
+    for item in path["items"]:
+        op = item[0]
+        if op in ("l", "c"):
+            # Curves are kept as their chord
+            start, end = item[1], item[-1]
+            items.append((op, start.x, start.y, end.x, end.y))
+        elif op == "re":
+            r = item[1]
+            items.append((op, r.x0, r.y0, r.x1, r.y1))
+        elif op == "qu":
+            q = item[1]
+            items.append((op, q.ul.x, q.ul.y, q.ur.x, q.ur.y, q.lr.x, q.lr.y, q.ll.x, q.ll.y))
+    return items
+
+
+def read_page_content(source, pages=None):
+    """
+    Words and vector paths of the selected pages in one pass per page:
+    {page: {"size": (width, height), "words": [(x0, y0, x1, y1, text, ...)],
+    "paths": [(closed, items)]}}, plain data only so the pass can run in a
+    sandbox helper (see _path_items for the item tuples).
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        doc = fitz.open(stream=bytes(source), filetype="pdf")
+    else:
+        doc = fitz.open(source)
+    content = {}
+    try:
+        page_numbers = pages if pages is not None else range(doc.page_count)
+        for page_number in page_numbers:
+            page = doc.load_page(page_number)
+            content[page_number] = {
+                "size": (page.rect.width, page.rect.height),
+                "words": [tuple(word) for word in page.get_text("words")],
+                "paths": [(bool(path.get("closePath")), _path_items(path)) for path in page.get_drawings()],
+            }
+    finally:
+        doc.close()
+    return content
+
+
+class TextLayerExtractor:
+    """
+    Reads words and drawing paths from the selected PDF pages and resolves the
+    area statement, setbacks and floor count where the text is unambiguous.
+    """
+
+    def __init__(self, source, pages=None, content=None):
+        """
+        Args:
+            source: PDF file path or in-memory PDF bytes
+            pages: 0-based page indexes to read (default: all pages)
+            content: read_page_content() of the same pages (read if omitted)
+        """
+        self.source = source
+        self.pages = pages
+        self.content = content    # page -> words, paths and size, shared with later passes
+        self.rows = []            # text rows: {"page", "text", "words", "spans"}
+        self.segments = {}        # page -> (N, 4) array of drawn line segments
+        self.dimensions = []      # dimension annotations with bbox and measured line
+        self.labels = {}          # group -> [(label text, page, bbox)]
+        self.values = {}          # variable -> resolved value
+        self.candidates = {}      # variable -> [(value, page, bbox)] for hints
+        self.word_count = 0
+
+    # ---------- reading ----------
+
+    def extract(self):
+        """Read the PDF and resolve what can be resolved. Returns self."""
+        if self.content is None:
+            self.content = read_page_content(self.source, self.pages)
+        for page_number, page in self.content.items():
+            self.word_count += len(page["words"])
+            self.rows.extend(self._build_rows(page_number, page["words"]))
+            self.segments[page_number] = self._line_segments(page["paths"])
+
+        if not self.has_text_layer():
+            return self
+
+        self._find_dimensions()
+        self._find_labels()
+        self._resolve_area_statement()
+        self._resolve_setbacks()
+        return self
+
+    def has_text_layer(self):
+        return self.word_count >= MIN_TEXT_LAYER_WORDS
+
+    @staticmethod
+    def _build_rows(page_number, words):
+        """Group words into visual rows by vertical centre, left to right."""
+        rows = []
+        for word in sorted(words, key=lambda w: ((w[1] + w[3]) / 2, w[0])):
+            x0, y0, x1, y1, text = word[:5]
+            center = (y0 + y1) / 2
+            if rows and abs(center - rows[-1]["center"]) <= max(y1 - y0, 1.0) / 2:
+                rows[-1]["words"].append((x0, y0, x1, y1, text))
+            else:
+                rows.append({"page": page_number, "center": center, "words": [(x0, y0, x1, y1, text)]})
+
+        # Words far apart on the same line belong to different notes or table blocks
+        split_rows = []
+        for row in rows:
+            row["words"].sort(key=lambda w: w[0])
+            current = None
+            for word in row["words"]:
+                gap_limit = ROW_GAP_FACTOR * max(word[3] - word[1], 1.0)
+                if current is None or word[0] - current["words"][-1][2] > gap_limit:
+                    current = {"page": page_number, "center": row["center"], "words": []}
+                    split_rows.append(current)
+                current["words"].append(word)
+        rows = split_rows
+
+        for row in rows:
+            spans, text = [], ""
+            for word in row["words"]:
+                if text:
+                    text += " "
+                spans.append((len(text), len(text) + len(word[4])))
+                text += word[4]
+            row["text"] = _normalize(text)
+            row["spans"] = spans
+        return rows
+
+    @staticmethod
+    def _line_segments(paths):
+        """Straight line segments of the page's vector drawings as an (N, 4) array."""
+        segments = [item[1:] for _, items in paths for item in items if item[0] == "l"]
+        return np.array(segments, dtype=np.float64).reshape(-1, 4)
+
+    @staticmethod
+    def _span_bbox(row, start, end):
+        """Bounding box of the row's words overlapping characters [start, end)."""
+        boxes = [word[:4] for word, (s, e) in zip(row["words"], row["spans"]) if s < end and e > start]
+        if not boxes:
+            return None
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes), max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+    def _nearest_line(self, page_number, bbox):
+        """Length (points) of the drawn line an annotation labels, or None."""
+        segments = self.segments.get(page_number)
+        if segments is None or not len(segments):
+            return None
+        width, height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        cx, cy = (bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2
+        dx = segments[:, 2] - segments[:, 0]
+        dy = segments[:, 3] - segments[:, 1]
+        lengths = np.hypot(dx, dy)
+        mx = (segments[:, 0] + segments[:, 2]) / 2
+        my = (segments[:, 1] + segments[:, 3]) / 2
+        # Text runs along its dimension line, so match segments parallel to the text
+        if width >= height:
+            parallel = np.abs(dy) <= 0.05 * lengths
+        else:
+            parallel = np.abs(dx) <= 0.05 * lengths
+        distance = np.hypot(mx - cx, my - cy)
+        mask = parallel & (lengths >= max(width, height)) & (distance <= 2.5 * min(width, height) + 0.5 * lengths)
+        if not mask.any():
+            return None
+        index = np.flatnonzero(mask)[np.argmin(distance[mask])]
+        return float(lengths[index])
+
+    # ---------- findings ----------
+
+    def _find_dimensions(self):
+        for row in self.rows:
+            for match in _DIMENSION.finditer(row["text"]):
+                bbox = self._span_bbox(row, match.start(), match.end())
+                if bbox is None:
+                    continue
+                self.dimensions.append({
+                    "text": match.group(0).strip(),
+                    "page": row["page"],
+                    "bbox": bbox,
+                    "line_length": self._nearest_line(row["page"], bbox),
+                })
+
+    def _find_labels(self):
+        for group, labels in GROUP_LABELS.items():
+            found = []
+            for row in self.rows:
+                for label in labels:
+                    for match in _label_pattern(label).finditer(row["text"]):
+                        bbox = self._span_bbox(row, match.start(), match.end())
+                        if bbox:
+                            found.append((label, row["page"], bbox))
+            self.labels[group] = found
+
+    def _proposed_column(self, page_number, row_center):
+        """x-centre of the nearest "as per map" style header above the row, if any."""
+        best = None
+        for row in self.rows:
+            if row["page"] != page_number or row["center"] > row_center:
+                continue
+            for header in PROPOSED_HEADERS:
+                match = _label_pattern(header).search(row["text"])
+                if match:
+                    bbox = self._span_bbox(row, match.start(), match.end())
+                    if bbox and (best is None or row["center"] > best[0]):
+                        best = (row["center"], (bbox[0] + bbox[2]) / 2)
+        return best[1] if best else None
+
+    def _labelled_values(self, labels, value_pattern):
+        """Yield (row, [(match, x_centre, bbox)]) for rows carrying one of the labels."""
+        patterns = [_label_pattern(label) for label in labels]
+        for row in self.rows:
+            for pattern in patterns:
+                label_match = pattern.search(row["text"])
+                if not label_match:
+                    continue
+                tail = row["text"][label_match.end():]
+                values = []
+                for match in value_pattern.finditer(tail):
+                    if not match.group(0).strip():
+                        continue
+                    start, end = label_match.end() + match.start(), label_match.end() + match.end()
+                    if row["text"][end:].lstrip()[:1] == "%":
+                        continue
+                    bbox = self._span_bbox(row, start, end)
+                    if bbox:
+                        values.append((match, (bbox[0] + bbox[2]) / 2, bbox))
+                if values:
+                    yield row, values
+                break
+
+    def _pick(self, row, values):
+        """Choose the row's value: the only distinct one, or the one under an "as per map" header."""
+        if len(values) == 1:
+            return values[0]
+        column = self._proposed_column(row["page"], row["center"])
+        if column is None:
+            return None
+        return min(values, key=lambda v: abs(v[1] - column))
+
+    def _resolve(self, variable, resolved):
+        """Store a variable's value when every labelled row was readable and agrees on it."""
+        self.candidates[variable] = resolved
+        if any(value is None for value, _, _ in resolved):
+            return
+        distinct = {round(value, 2) for value, _, _ in resolved}
+        if len(distinct) == 1:
+            self.values[variable] = distinct.pop()
+
+    def _resolve_area_statement(self):
+        page_units = {}
+        for row in self.rows:
+            page_units.setdefault(row["page"], set()).update(_area_unit_kinds(row["text"]))
+
+        for variable, labels in AREA_LABELS.items():
+            resolved = []
+            for row, values in self._labelled_values(labels, _FAR_VALUE if variable == "far" else _AREA_VALUE):
+                picked = self._pick(row, values)
+                if picked is None:
+                    for match, _, bbox in values:
+                        resolved.append((None, row["page"], bbox))
+                    continue
+                match, _, bbox = picked
+                if variable == "far":
+                    resolved.append((parse_far(match.group(0)), row["page"], bbox))
+                    continue
+                factor = _area_unit_factor(match.group(2))
+                if factor is None:
+                    # Fall back to the unit stated in the row, then on the page, when it is the only one
+                    kinds = _area_unit_kinds(row["text"]) or page_units.get(row["page"], set())
+                    factor = kinds.pop() if len(kinds) == 1 else None
+                value = float(match.group(1).replace(",", ""))
+                resolved.append((round(value * factor, 2) if factor else None, row["page"], bbox))
+            if resolved:
+                self._resolve(variable, resolved)
+
+    def _resolve_setbacks(self):
+        length = re.compile(_FEET_INCHES.pattern + "|" + _METERS.pattern)
+        for variable, labels in SETBACK_LABELS.items():
+            resolved = []
+            for row, values in self._labelled_values(labels, length):
+                picked = self._pick(row, values)
+                if picked is not None:
+                    resolved.append((parse_length_meters(picked[0].group(0)), row["page"], picked[2]))
+            if resolved:
+                self._resolve(variable, resolved)
+
+        resolved = []
+        for row, values in self._labelled_values(FLOOR_COUNT_LABELS, _INTEGER):
+            picked = self._pick(row, values)
+            if picked is not None:
+                resolved.append((float(picked[0].group(1)), row["page"], picked[2]))
+        if resolved:
+            self._resolve("no_of_floors", resolved)
+
+    # ---------- results ----------
+
+    def group_result(self, group_name):
+        """
+        Extractor-compatible output for a group answered confidently from the
+        text layer, or None when the model should be called.
+        """
+        if group_name == "area":
+            needed = ("total_plot_area", "ground_covered_area", "total_covered_area")
+            if not all(self.values.get(v, 0) > 0 for v in needed):
+                return None
+            plot, covered = self.values["total_plot_area"], self.values["total_covered_area"]
+            far = self.values.get("far")
+            computed_far = round(covered / plot, 2)
+            # A stated FAR that disagrees with the areas means a misread table
+            if far is not None and abs(far - computed_far) > 0.05:
+                return None
+            return {
+                "floor_data": [],
+                "plot_data": {
+                    "total_plot_area": plot,
+                    "ground_covered_area": self.values["ground_covered_area"],
+                    "total_covered_area": covered,
+                    "far": far if far is not None else computed_far,
+                },
+            }
+
+        if group_name == "setback_floors":
+            needed = ("no_of_floors",) + tuple(SETBACK_LABELS)
+            if not all(v in self.values for v in needed):
+                return None
+            result = {"no_of_floors": [str(int(self.values["no_of_floors"]))]}
+            for variable in SETBACK_LABELS:
+                result[variable] = [f"{self.values[variable]:.2f}"]
+            return [result]
+
+        return None
+
+    def hints(self, group_name, limit=30):
+        """Prompt text describing what the text layer shows for a group ("" when nothing)."""
+        lines = []
+        if group_name == "area":
+            for variable in AREA_LABELS:
+                lines.extend(self._candidate_lines(variable, "sq. ft." if variable != "far" else ""))
+        elif group_name == "setback_floors":
+            for variable in ("no_of_floors",) + tuple(SETBACK_LABELS):
+                lines.extend(self._candidate_lines(variable, "" if variable == "no_of_floors" else "m"))
+        else:
+            for label, page, bbox in self.labels.get(group_name, []):
+                nearby = self._dimensions_near(page, bbox)
+                if nearby:
+                    texts = ", ".join(d["text"] for d in nearby)
+                    lines.append(f"- \"{label}\" on page {page + 1} at {self._format_bbox(bbox)}: nearby dimensions {texts}")
+
+        if not lines:
+            return ""
+        return (
+            "\n\nTEXT LAYER HINTS (read from the PDF's embedded text; verify them against the drawing "
+            "and prefer what the drawing shows if they disagree):\n" + "\n".join(lines[:limit])
+        )
+
+    def _candidate_lines(self, variable, unit):
+        lines = []
+        for value, page, bbox in self.candidates.get(variable, []):
+            shown = "unreadable or ambiguous" if value is None else f"{value:g} {unit}".strip()
+            lines.append(f"- {variable}: {shown} (page {page + 1} at {self._format_bbox(bbox)})")
+        return lines
+
+    def _dimensions_near(self, page_number, bbox, max_count=2):
+        height = max(bbox[3] - bbox[1], 1.0)
+        cx, cy = (bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2
+        nearby = []
+        for dimension in self.dimensions:
+            if dimension["page"] != page_number:
+                continue
+            d = dimension["bbox"]
+            distance = ((d[0] + d[2]) / 2 - cx) ** 2 + ((d[1] + d[3]) / 2 - cy) ** 2
+            if distance <= (4 * height) ** 2:
+                nearby.append((distance, dimension))
+        return [dimension for _, dimension in sorted(nearby, key=lambda item: item[0])[:max_count]]
+
+    @staticmethod
+    def _format_bbox(bbox):
+        return "(" + ", ".join(f"{v:.0f}" for v in bbox) + ")"
+
+    def summary(self):
+        return {
+            "words": self.word_count,
+            "dimensions": len(self.dimensions),
+            "resolved": dict(self.values),
+            "segments": int(sum(len(s) for s in self.segments.values())),
+        }
@@ -0,0 +1,43 @@
+import os
+import sqlite3
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "web"))
+sys.path.insert(0, ROOT)
+
+# Settings read at import time; the tests never reach a real key or bucket
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+_STORAGE = tempfile.mkdtemp(prefix="bpw-tests-")
+os.environ.setdefault("BLOB_STORE_DIR", os.path.join(_STORAGE, "blobs"))
+os.environ.setdefault("ORIGINALS_STORE_DIR", os.path.join(_STORAGE, "originals"))
+os.environ.pop("DATABASE_URL", None)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """The database module on a fresh SQLite file with the current schema."""
+    import database
+
+    def connect():
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        conn.execute("PRAGMA foreign_keys = ON")
+        return database.SQLiteConnectionAdapter(conn)
+
+    database.close_pool()
+    monkeypatch.setattr(database, "_connect_sqlite", connect)
+    database.init_db()
+    yield database
+    database.close_pool()
+
+
+@pytest.fixture
+def user_id(db):
+    db.create_user("tester", "tester@example.com", "hash", "Test User", "0000000000", "Lahore")
+    with db.db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT id FROM users WHERE username = %s", ("tester",))
+        return c.fetchone()[0]
@@ -0,0 +1,29 @@
+import pytest
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    monkeypatch.setattr(db, "ADMIN_USERNAMES", {"admin"})
+    import app as webapp
+    return webapp.app.test_client()
+
+
+def _log_in(client, user_id):
+    with client.session_transaction() as session:
+        session["user_id"] = user_id
+
+
+def test_dead_letter_pages_are_admin_only(db, client, user_id):
+    _log_in(client, user_id)
+    assert client.get("/admin/analysis_jobs").status_code == 403
+    assert client.post("/admin/analysis_jobs/requeue", data={"job_ids": ["1"]}).status_code == 403
+
+    admin_id = db.create_user("admin", "admin@example.com", "hash", "Admin", "0000000000", "Lahore")
+    _log_in(client, admin_id)
+    assert client.get("/admin/analysis_jobs").status_code == 200
+
+
+def test_dead_letter_pages_require_login(client):
+    response = client.get("/admin/analysis_jobs")
+    assert response.status_code == 302
+    assert "/login" in response.headers["Location"]
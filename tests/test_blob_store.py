@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+import blob_store
+from src.core import config_map as config
+
+
+@pytest.fixture
+def fresh_store(monkeypatch, tmp_path):
+    """get_blob_store() rebuilt from the monkeypatched config on next use."""
+    monkeypatch.setattr(config, "BLOB_STORE_DIR", str(tmp_path / "blobs"))
+    monkeypatch.setattr(blob_store, "_store", None)
+    yield
+    blob_store._store = None
+
+
+def test_production_refuses_local_store(fresh_store, monkeypatch):
+    monkeypatch.setattr(config, "PRODUCTION", True)
+    monkeypatch.setattr(config, "BLOB_STORE", "local")
+    with pytest.raises(blob_store.BlobStoreNotDurable):
+        blob_store.get_blob_store()
+
+    monkeypatch.setattr(config, "BLOB_STORE_LOCAL_DURABLE", True)
+    assert blob_store.get_blob_store().durable
+
+
+def _insert_legacy_map(db, user_id, image):
+    with db.db_connection() as conn:
+        c = conn.cursor()
+        c.execute('''INSERT INTO maps (user_id, image, filename, file_type, report, status, payment_status, analysis_status)
+                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s) RETURNING id''',
+                  (user_id, image, "legacy.png", "png", "", "pending", "pending", "pending"))
+        return c.fetchone()[0]
+
+
+def test_backfill_keeps_column_for_local_store(db, user_id, fresh_store, monkeypatch):
+    map_id = _insert_legacy_map(db, user_id, b"legacy plan bytes")
+    monkeypatch.setattr(config, "BLOB_BACKFILL", True)
+    db.backfill_map_blobs()
+
+    with db.db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT image, blob_sha256 FROM maps WHERE id = %s", (map_id,))
+        image, blob_sha256 = c.fetchone()
+    assert bytes(image) == b"legacy plan bytes"
+    assert blob_sha256
+
+    # A redeploy wiped the local store: the column still serves the file
+    blob_store.get_blob_store().delete(blob_sha256)
+    assert db.get_map_file(map_id)[0] == b"legacy plan bytes"
+
+
+def test_backfill_is_opt_in(db, user_id, fresh_store):
+    map_id = _insert_legacy_map(db, user_id, b"legacy plan bytes")
+    db.backfill_map_blobs()
+    with db.db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT blob_sha256 FROM maps WHERE id = %s", (map_id,))
+        assert c.fetchone()[0] is None
+
+
+def test_s3_read_through_copies_are_bounded(tmp_path):
+    store = blob_store.S3BlobStore("bucket", cache_dir=str(tmp_path / "copies"), client=object(), cache_max_bytes=2500)
+    digests = []
+    for age, fill in enumerate((b"a", b"b", b"c")):
+        digest, _ = store.cache.put(fill * 1000)
+        path = store.cache.local_path(digest)
+        os.utime(path, (1000 + age, 1000 + age))
+        digests.append(digest)
+    # The oldest copy was read most recently
+    os.utime(store.cache.local_path(digests[0]), (2000, 2000))
+
+    store._trim_cache(keep=digests[2])
+
+    assert store.cache.exists(digests[0]) and store.cache.exists(digests[2])
+    assert not store.cache.exists(digests[1])
@@ -0,0 +1,26 @@
+import io
+
+from PIL import Image
+
+
+def _plan_png():
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 32), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_bulk_backlog_at_the_cap_does_not_block_other_users(db, user_id):
+    image = _plan_png()
+    for n in range(60):
+        db.enqueue_analysis_job(db.insert_map(user_id, image, f"bulk-{n}.png", "png"))
+    with db.db_connection() as conn:
+        conn.cursor().execute(
+            "UPDATE analysis_jobs SET schedule_key = datetime(schedule_key, '-600 seconds') WHERE user_id = %s",
+            (user_id,))
+    assert len(db.claim_analysis_jobs(db.ANALYSIS_USER_MAX_RUNNING)) == db.ANALYSIS_USER_MAX_RUNNING
+
+    other_id = db.create_user("other", "other@example.com", "hash", "Other User", "0000000000", "Lahore")
+    other_job = db.enqueue_analysis_job(db.insert_map(other_id, image, "plan.png", "png"))
+
+    assert [job_id for job_id, _ in db.claim_analysis_jobs(2)] == [other_job]
+    assert db.claim_analysis_jobs(2) == []
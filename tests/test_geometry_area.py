@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+from src.extractors.geometry_extraction import SQFT_PER_SQM, GeometryExtractor
+
+
+def _measured(floors):
+    geometry = GeometryExtractor(b"", text_layer=SimpleNamespace(values={} if floors is None else {"no_of_floors": floors}))
+    geometry.page_results = {0: {"plot_area_m2": 200.0, "footprint_area_m2": 100.0, "rooms": {}}}
+    return geometry.area_result()["plot_data"]
+
+
+def test_area_result_has_no_placeholder_far():
+    plot_data = _measured(None)
+    assert plot_data["total_covered_area"] is None
+    assert plot_data["far"] is None
+
+
+def test_area_result_uses_text_layer_floor_count():
+    plot_data = _measured(3)
+    assert plot_data["total_covered_area"] == round(round(100.0 * SQFT_PER_SQM, 2) * 3, 2)
+    assert plot_data["far"] == 1.5
@@ -0,0 +1,41 @@
+import socket
+
+import pytest
+
+import job_wakeup
+
+
+@pytest.fixture
+def wakeup(db, monkeypatch):
+    """A SQLite-mode listener on a free port, with pending announcements drained."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.bind((job_wakeup.JOB_WAKEUP_HOST, 0))
+        port = probe.getsockname()[1]
+    monkeypatch.setattr(job_wakeup, "JOB_WAKEUP_PORT", port)
+    listener = job_wakeup.JobWakeup(None)
+    yield listener
+    listener.close()
+
+
+def test_finished_job_lets_the_users_next_job_be_claimed(db, user_id, wakeup, monkeypatch):
+    monkeypatch.setattr(db, "ANALYSIS_USER_MAX_RUNNING", 1)
+    first = db.enqueue_analysis_job(db.insert_map(user_id, b"plan one", "one.png", "png"))
+    second = db.enqueue_analysis_job(db.insert_map(user_id, b"plan two", "two.png", "png"))
+    assert [job_id for job_id, _ in db.claim_analysis_jobs(2, "owner")] == [first]
+    wakeup.wait(0)
+
+    # The held-back job's worker hears about the freed share instead of waiting for its poll
+    assert db.mark_analysis_job_completed(first, "owner")
+    assert wakeup.wait(1.0)
+    assert [job_id for job_id, _ in db.claim_analysis_jobs(2, "owner")] == [second]
+
+    wakeup.wait(0)
+    assert db.retry_analysis_job(second, "model overloaded", "owner") == "pending"
+    assert wakeup.wait(1.0)
+
+
+def test_interrupt_wakes_the_waiting_worker(wakeup):
+    assert not wakeup.wait(0)
+    wakeup.interrupt()
+    assert wakeup.wait(1.0)
+    assert not wakeup.wait(0)
@@ -0,0 +1,37 @@
+import pytest
+
+from src.core import metrics
+
+
+@pytest.fixture
+def client(db):
+    import app as webapp
+    return webapp.app.test_client()
+
+
+def test_metrics_endpoint_needs_a_token(client, monkeypatch):
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setenv("METRICS_TOKEN", "secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+    assert response.status_code == 200
+    assert b"# TYPE db_pool_events gauge" in response.data
+
+
+def test_api_key_label_uses_rotation_position():
+    keys = ["AIza-first-abcd", "AIza-second-wxyz"]
+    assert metrics.api_key_label("AIza-second-wxyz", keys) == "key1"
+    assert metrics.api_key_label(None, keys) == "none"
+
+
+def test_mirrored_totals_stay_out_of_drain(db):
+    import worker
+
+    worker.rate_limit_waits.set(3)
+    db.pool_totals.set(5, event="checkouts")
+    drained = metrics.REGISTRY.drain()
+    assert "gemini_rate_limit_waits" not in drained
+    assert "db_pool_events" not in drained
@@ -0,0 +1,40 @@
+import fitz
+
+from src.core import config_map as config
+
+
+def _plan_set(path):
+    doc = fitz.open()
+    for title in ("GROUND FLOOR PLAN SCALE 1:100", "AREA STATEMENT"):
+        page = doc.new_page(width=842, height=595)
+        page.insert_text((40, 40), title, fontsize=12)
+        for i in range(25):
+            page.insert_text((40, 80 + i * 15), f"BED ROOM {i} KITCHEN TOTAL SQ.M", fontsize=8)
+        page.draw_rect(fitz.Rect(300, 100, 600, 400))
+    doc.save(path)
+
+
+def test_drawings_are_parsed_once_per_page(tmp_path, monkeypatch):
+    import analysis
+
+    pdf_path = str(tmp_path / "plans.pdf")
+    _plan_set(pdf_path)
+    parses = []
+    get_drawings = fitz.Page.get_drawings
+
+    def counting_get_drawings(page, *args, **kwargs):
+        parses.append(page.number)
+        return get_drawings(page, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "get_drawings", counting_get_drawings)
+    monkeypatch.setattr(config, "RENDER_SANDBOX", False)
+    monkeypatch.setattr(config, "ANALYSIS_PDF_PAGES", "all")
+
+    content = analysis.read_pdf_content(pdf_path)
+    text_layer = analysis.read_text_layer(pdf_path, content)
+    analysis.read_geometry(pdf_path, text_layer)
+    classes = analysis.read_page_classes(pdf_path, content, text_layer, [None, None])
+
+    assert text_layer is not None
+    assert classes.labels == {0: "floor_plan", 1: "area_statement"}
+    assert sorted(parses) == [0, 1]
@@ -0,0 +1,11 @@
+import pytest
+
+import migrations
+
+
+@pytest.mark.parametrize(
+    "name, query, params, index", migrations.HOT_QUERIES, ids=[query[0] for query in migrations.HOT_QUERIES])
+def test_hot_query_uses_its_index(db, name, query, params, index):
+    with db.db_connection() as conn:
+        plan = migrations.explain(conn, True, query, params)
+    assert index in plan, f"{name} does not use {index}:\n{plan}"
@@ -0,0 +1,20 @@
+import os
+
+from raster_cache import RasterCache
+
+
+def _disk_bytes(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def test_bound_holds_across_processes_sharing_the_directory(tmp_path):
+    # Two caches on one directory stand in for the web app and a worker
+    web, worker = RasterCache(str(tmp_path), 2500), RasterCache(str(tmp_path), 2500)
+    for n in range(4):
+        web.put("a" * 64, f"preview-p{n}", b"w" * 1000)
+        worker.put("b" * 64, f"analysis-p{n}", b"k" * 1000)
+        assert _disk_bytes(str(tmp_path)) <= 2500
+
+    # The most recent entry survives
+    assert worker.get("b" * 64, "analysis-p3") is not None
+    assert web.stats()["bytes"] <= 2500
@@ -0,0 +1,14 @@
+from src.core import config_map as config
+from src.core.rate_limiter import RateLimiter, gemini_rate_limiter
+
+
+def test_split_divides_rate_and_burst():
+    limiter = RateLimiter(120, 10)
+    limiter.split(4)
+    assert limiter.stats()["rate_per_minute"] == 30
+    assert limiter.burst == 2
+
+
+def test_gemini_limit_is_divided_between_processes():
+    expected = config.GEMINI_REQUESTS_PER_MINUTE / config.GEMINI_RATE_LIMIT_PROCESSES
+    assert gemini_rate_limiter.stats()["rate_per_minute"] == expected
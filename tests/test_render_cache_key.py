@@ -0,0 +1,21 @@
+import render_service
+from src.core import config_map as config
+
+
+def test_page_cache_key_follows_effective_settings(monkeypatch):
+    gray = render_service._page_cache_key("analysis-gray", 0)
+    bilevel = render_service._page_cache_key("analysis-bilevel", 0)
+
+    monkeypatch.setattr(config, "RENDER_PIXEL_BUDGET_MP", config.RENDER_PIXEL_BUDGET_MP + 10)
+    assert render_service._page_cache_key("analysis-gray", 0) != gray
+    monkeypatch.undo()
+
+    monkeypatch.setattr(config, "BILEVEL_THRESHOLD", config.BILEVEL_THRESHOLD - 20)
+    assert render_service._page_cache_key("analysis-bilevel", 0) != bilevel
+    assert render_service._page_cache_key("analysis-gray", 0) == gray
+
+
+def test_rendition_key_changes_with_pixel_budget(monkeypatch):
+    preview = render_service._profile_cache_key("preview")
+    monkeypatch.setattr(config, "RENDER_PIXEL_BUDGET_MP", config.RENDER_PIXEL_BUDGET_MP / 2)
+    assert render_service._profile_cache_key("preview") != preview
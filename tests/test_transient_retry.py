@@ -0,0 +1,64 @@
+import io
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+from PIL import Image
+
+from src.core import config_map as config
+
+
+class UnavailableModel:
+    """A Gemini model whose every call fails the way an overloaded backend does."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, content):
+        self.calls += 1
+        raise google_exceptions.ServiceUnavailable("model overloaded")
+
+
+def _plan_png():
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def unavailable_model(monkeypatch, tmp_path):
+    model = UnavailableModel()
+    monkeypatch.chdir(tmp_path)  # analysis appends to ./debug_prompts.log
+    monkeypatch.setattr(config, "configure_gemini_api", lambda: model)
+    monkeypatch.setattr(config, "ANALYSIS_ISOLATION", False)
+    return model
+
+
+def test_transient_model_error_schedules_retry(db, user_id, unavailable_model):
+    import worker
+
+    map_id = db.insert_map(user_id, _plan_png(), "plan.png", "png")
+    db.enqueue_analysis_job(map_id)
+    [(job_id, claimed_map_id)] = db.claim_analysis_jobs(1, "test-owner")
+    assert claimed_map_id == map_id
+
+    class Lease:
+        owner = "test-owner"
+
+        def confirm(self, job_id):
+            return True
+
+    worker.process_analysis_job(job_id, map_id, Lease())
+
+    assert unavailable_model.calls >= 1
+    with db.db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT status, attempts, run_after, last_error FROM analysis_jobs WHERE id = %s", (job_id,))
+        status, attempts, run_after, last_error = c.fetchone()
+        c.execute("SELECT analysis_status FROM maps WHERE id = %s", (map_id,))
+        (analysis_status,) = c.fetchone()
+    # Rescheduled with backoff, not completed with empty extractions or failed for good
+    assert status == "pending"
+    assert attempts == 1
+    assert run_after is not None
+    assert "model overloaded" in last_error
+    assert analysis_status == "pending"
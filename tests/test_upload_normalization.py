@@ -0,0 +1,66 @@
+import io
+
+from PIL import Image
+
+import blob_store
+import upload_normalization
+
+
+def _photo_jpeg():
+    buffer = io.BytesIO()
+    Image.effect_noise((800, 600), 40).convert("RGB").save(buffer, format="JPEG", quality=100)
+    return buffer.getvalue()
+
+
+def _map_blob(db, map_id):
+    with db.db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT blob_sha256, original_ref, file_type FROM maps WHERE id = %s", (map_id,))
+        return c.fetchone()
+
+
+def test_normalization_moves_original_to_cold_store(db, user_id, monkeypatch):
+    upload = _photo_jpeg()
+    map_id = db.insert_map(user_id, upload, "photo.jpg", "jpg")
+    uploaded_sha256, _, _ = _map_blob(db, map_id)
+    stale_row = db.get_map_blob(map_id)
+
+    upload_normalization.normalize_map_upload(map_id, upload, "jpg")
+
+    blob_sha256, original_ref, file_type = _map_blob(db, map_id)
+    assert file_type == "webp"
+    assert blob_sha256 != uploaded_sha256
+    assert original_ref == uploaded_sha256
+    assert blob_store.get_originals_store().read(uploaded_sha256) == upload
+    assert not blob_store.get_blob_store().exists(uploaded_sha256)
+
+    # An analysis that looked up the map before the swap still reads its file
+    monkeypatch.setattr(db, "get_map_blob", lambda map_id, user_id=None: stale_row)
+    assert db.get_map_file(map_id) == (upload, "photo.jpg", "jpg")
+
+
+def test_shared_upload_stays_hot_while_referenced(db, user_id):
+    upload = _photo_jpeg()
+    map_id = db.insert_map(user_id, upload, "photo.jpg", "jpg")
+    twin_id = db.insert_map(user_id, upload, "copy.jpg", "jpg")
+    uploaded_sha256, _, _ = _map_blob(db, map_id)
+
+    upload_normalization.normalize_map_upload(map_id, upload, "jpg")
+
+    assert blob_store.get_blob_store().exists(uploaded_sha256)
+    assert db.get_map_file(twin_id)[0] == upload
+
+
+def test_full_backlog_keeps_upload_as_stored(monkeypatch):
+    backlog = upload_normalization.threading.BoundedSemaphore(1)
+    backlog.acquire()
+    monkeypatch.setattr(upload_normalization, "_backlog", backlog)
+    assert not upload_normalization.submit_map_upload(1, b"", "png")
+
+
+def test_replace_skips_a_map_whose_file_changed(db, user_id):
+    map_id = db.insert_map(user_id, b"first upload", "plan.png", "png")
+    stale_sha256, _ = blob_store.get_blob_store().put(b"an earlier file")
+
+    assert not db.replace_map_image(map_id, stale_sha256, b"normalized", "webp")
+    assert _map_blob(db, map_id)[2] == "png"
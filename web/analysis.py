@@ -5,6 +5,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 's
 import tempfile
 import json
 import shutil
+import threading
+import time
 import traceback
 import psutil
 from PIL import Image
@@ -12,12 +14,23 @@ import google.generativeai as genai
 from src.core import utils
 from src.core import check_rules
 from src.core import config_map as config
+from src.core.errors import TransientAnalysisError
 
 # Import from buildplanwizard - handle both relative and absolute imports
 try:
-    from .buildplanwizard import rule_verifier, Extractor, get_extractor_func, get_image_for_var, get_examples_for_var, get_prompt_for_var, read_pdf, create_segments
+    from .buildplanwizard import rule_verifier, Extractor, get_extractor_func, get_image_for_var, get_examples_for_var, get_prompt_for_var, read_pdf_pages, create_segments
+    from .raster_cache import file_sha256
+    from .render_sandbox import get_render_sandbox
+    from .render_service import parse_page_selection, pdf_page_count
 except ImportError:
-    from buildplanwizard import rule_verifier, Extractor, get_extractor_func, get_image_for_var, get_examples_for_var, get_prompt_for_var, read_pdf, create_segments
+    from buildplanwizard import rule_verifier, Extractor, get_extractor_func, get_image_for_var, get_examples_for_var, get_prompt_for_var, read_pdf_pages, create_segments
+    from raster_cache import file_sha256
+    from render_sandbox import get_render_sandbox
+    from render_service import parse_page_selection, pdf_page_count
+
+from src.extractors.text_layer_extraction import TextLayerExtractor, read_page_content
+from src.extractors.geometry_extraction import GeometryExtractor
+from src.extractors.page_classification import PageClassifier
 
 import evals
 
@@ -28,14 +41,182 @@ def print_memory_usage(label=""):
     prefix = f"{label} " if label else ""
     print(f"{prefix}Memory usage: {mem / (1024 ** 2):.2f} MB", flush=True)
 
-def analyze_map_with_ai(file_data, filename, file_type):
+# Rules fed by each extractor group; used to report skipped groups in fail-fast mode
+GROUP_RULES = {
+    "area": ["Rule 1: Ground Coverage", "Rule 2: FAR"],
+    "room": ["Rule 3: Habitable Rooms", "Rule 6: Store"],
+    "setback_floors": ["Rule 10: Floor Count"],
+    "staircase": ["Rule 7: Staircase"],
+    "height_kitchen_bathroom": ["Rule 4: Kitchen", "Rule 5: Bathroom Categories", "Rule 8: Plinth Level", "Rule 9: Building Height"],
+}
+
+# Process-wide fail-fast counters (one model call per skipped group)
+FAIL_FAST_STATS = {"analyses": 0, "short_circuited": 0, "calls_saved": 0}
+FAIL_FAST_STATS_LOCK = threading.Lock()
+
+
+def get_fail_fast_stats():
+    """Return a snapshot of the fail-fast counters."""
+    with FAIL_FAST_STATS_LOCK:
+        return dict(FAIL_FAST_STATS)
+
+
+def _record_fail_fast(calls_saved):
+    with FAIL_FAST_STATS_LOCK:
+        FAIL_FAST_STATS["analyses"] += 1
+        if calls_saved:
+            FAIL_FAST_STATS["short_circuited"] += 1
+            FAIL_FAST_STATS["calls_saved"] += calls_saved
+        snapshot = dict(FAIL_FAST_STATS)
+    print(f"[FailFast] Calls saved this analysis: {calls_saved}, totals: {snapshot}", flush=True)
+
+
+def area_rule_entries(area_result):
+    """
+    Convert AreaExtractor output into the plot_area_far entries expected by check_rules.
+    Returns an empty list when the plot or covered area could not be read.
+    """
+    if not isinstance(area_result, dict):
+        return []
+    plot_data = area_result.get("plot_data", {})
+    if not isinstance(plot_data, dict):
+        return []
+
+    total_plot_area = plot_data.get("total_plot_area", 0.0)
+    total_covered_area = plot_data.get("total_covered_area", 0.0)
+    if not isinstance(total_plot_area, (int, float)) or not isinstance(total_covered_area, (int, float)):
+        return []
+    if total_plot_area <= 0 or total_covered_area <= 0:
+        return []
+
+    return [{
+        "total_plot_area": [total_plot_area],
+        "ground_covered_area": [plot_data.get("ground_covered_area", 0.0)],
+        "total_covered_area": [total_covered_area],
+        "far": [plot_data.get("far", 0.0)]
+    }]
+
+
+def _area_hard_failure(result):
+    entries = area_rule_entries(result)
+    if not entries:
+        return None
+    if not check_rules.check_ground_coverage(entries)[0]:
+        return "Rule 1: Ground Coverage"
+    if not check_rules.check_far(entries)[0]:
+        return "Rule 2: FAR"
+    return None
+
+
+# Groups whose rules can be decided as soon as their extraction returns.
+# Each check returns the name of a definitively failed rule, or None.
+FAIL_FAST_CHECKS = {
+    "area": _area_hard_failure,
+}
+
+
+def order_extractor_groups(group_names, fail_fast):
+    """Return group names in execution order (configured order first in fail-fast mode)."""
+    if not fail_fast:
+        return list(group_names)
+    ordered = [name for name in config.FAIL_FAST_GROUP_ORDER if name in group_names]
+    return ordered + [name for name in group_names if name not in ordered]
+
+
+def read_pdf_content(file_path):
+    """
+    Words and vector paths of the analysed PDF pages, read in one pass that
+    the text layer, geometry and page classification passes share. The pass
+    runs in the render sandbox, whose memory and CPU limits and deadline also
+    bound a page with millions of vector paths. Returns None when the PDF
+    cannot be read within them.
+    """
+    try:
+        started = time.perf_counter()
+        pages = parse_page_selection(config.ANALYSIS_PDF_PAGES, pdf_page_count(file_path))
+        if config.RENDER_SANDBOX:
+            content = get_render_sandbox().run(read_page_content, file_path, pages)
+        else:
+            content = read_page_content(file_path, pages)
+        paths = sum(len(page["paths"]) for page in content.values())
+        print(f"[PageContent] {len(content)} page(s), {paths} vector paths in {time.perf_counter() - started:.3f}s")
+        return content
+    except Exception as e:
+        print(f"[PageContent] Could not read the text layer and drawings, using the model only: {e}")
+        return None
+
+
+def read_text_layer(file_path, content):
+    """
+    Run the local text-layer pre-extraction on the analysed PDF pages.
+    Returns None when the PDF has no usable text layer or it cannot be read.
+    """
+    try:
+        started = time.perf_counter()
+        text_layer = TextLayerExtractor(file_path, pages=list(content), content=content).extract()
+        print(f"[TextLayer] {text_layer.summary()} in {time.perf_counter() - started:.3f}s")
+        return text_layer if text_layer.has_text_layer() else None
+    except Exception as e:
+        print(f"[TextLayer] Pre-extraction failed, using the model only: {e}")
+        return None
+
+
+def read_geometry(file_path, text_layer):
+    """
+    Measure plot, footprint and rooms from the PDF's vector drawings.
+    Returns None when no page has a usable scale or the drawings cannot be read.
+    """
+    try:
+        started = time.perf_counter()
+        geometry = GeometryExtractor(file_path, pages=text_layer.pages, text_layer=text_layer).extract()
+        print(f"[Geometry] {geometry.summary()} in {time.perf_counter() - started:.3f}s")
+        return geometry if geometry.page_results else None
+    except Exception as e:
+        print(f"[Geometry] Measurement failed, skipping the cross-check: {e}")
+        return None
+
+
+def read_page_classes(file_path, content, text_layer, page_images):
+    """
+    Label each analysed PDF page (site plan, floor plan, section, ...) so the
+    extractor groups only receive the sheets they read.
+    Returns None for single-page documents or when classification fails.
+    """
+    if len(page_images) < 2 or content is None:
+        return None
+    try:
+        started = time.perf_counter()
+        pages = list(content)
+        if len(pages) != len(page_images):
+            return None
+        if text_layer is None:
+            # Scanned sheets: the shared pass still has their (few) words and paths
+            text_layer = TextLayerExtractor(file_path, pages=pages, content=content).extract()
+        classifier = PageClassifier(file_path, pages=pages, text_layer=text_layer, images=page_images).classify()
+        print(f"[Pages] {classifier.summary()} in {time.perf_counter() - started:.3f}s")
+        return classifier
+    except Exception as e:
+        print(f"[Pages] Classification failed, sending every page to every group: {e}")
+        return None
+
+
+def analyze_map_with_ai(file_data, filename, file_type, fail_fast=None):
     """
     Enhanced map analysis function with simplified structure using buildplanwizard
+
+    When `fail_fast` is enabled (defaults to config.ANALYSIS_FAIL_FAST) the extractor
+    groups run in config.FAIL_FAST_GROUP_ORDER and the remaining groups are skipped as
+    soon as a rule definitively fails; their rules are reported as "Not Evaluated".
+
+    Raises TransientAnalysisError when a model call fails for a retryable reason
+    (rate limit, timeout, unavailable service); other failures return an error result.
     """
     validation_text = ""
     raw_validation = None
     mem_after_pdf = None  # Track memory after PDF conversion
-    
+    if fail_fast is None:
+        fail_fast = config.ANALYSIS_FAIL_FAST
+
     try:
         print(f"Starting analysis for {filename} (type: {file_type})")
         
@@ -53,20 +234,36 @@ def analyze_map_with_ai(file_data, filename, file_type):
         try:
             print("Processing file...")
             
-            # Convert PDF to image if needed or load image directly
+            # Convert PDF pages to images if needed or load image directly.
+            # Each page becomes its own image handle for the extractors.
             if file_type.lower() == 'pdf':
-                print("Converting PDF to image...")
-                input_map_image = read_pdf(temp_file_path)
-                print("PDF converted successfully")
+                print("Converting PDF to images...")
+                input_map_image = read_pdf_pages(temp_file_path, pages=config.ANALYSIS_PDF_PAGES, file_hash=file_sha256(file_data))
+                print(f"PDF converted successfully ({len(input_map_image)} page(s))")
             else:
                 # Load image directly
                 try:
-                    input_map_image = Image.open(temp_file_path)
+                    input_map_image = [Image.open(temp_file_path)]
                     print("Image loaded successfully")
                 except Exception as e:
                     print(f"Image loading error: {e}")
                     raise Exception(f"Image loading failed: {str(e)}")
             
+            # One sandboxed pass over the words and drawings, shared by the local passes
+            page_content = None
+            if file_type.lower() == 'pdf' and (config.TEXT_LAYER_EXTRACTION or config.PAGE_CLASSIFICATION):
+                page_content = read_pdf_content(temp_file_path)
+            # Text-layer pre-extraction (CAD exports): confident groups skip the model
+            text_layer = None
+            if page_content is not None and config.TEXT_LAYER_EXTRACTION:
+                text_layer = read_text_layer(temp_file_path, page_content)
+            geometry = None
+            if text_layer and config.GEOMETRY_EXTRACTION:
+                geometry = read_geometry(temp_file_path, text_layer)
+            page_classes = None
+            if page_content is not None and config.PAGE_CLASSIFICATION:
+                page_classes = read_page_classes(temp_file_path, page_content, text_layer, input_map_image)
+
             # Capture memory usage after PDF conversion for tracking through final result
             process = psutil.Process(os.getpid())
             mem_after_pdf = process.memory_info().rss
@@ -100,35 +297,57 @@ def analyze_map_with_ai(file_data, filename, file_type):
                 "area": {
                     "extractor_class": "AreaExtractor",
                     "variables": ["total_plot_area", "ground_covered_area", "total_covered_area", "far"],
-                    "prompt_key": "area"
+                    "prompt_key": "area",
+                    "page_types": ["area_statement", "site_plan"]
                 },
                 "room": {
                     "extractor_class": "RoomExtractor", 
                     "variables": ["bedroom", "drawingroom", "studyroom", "store"],
-                    "prompt_key": "room"
+                    "prompt_key": "room",
+                    "page_types": ["floor_plan"]
                 },
                 "setback_floors": {
                     "extractor_class": "SetbackFloorsExtractor",
                     "variables": ["no_of_floors", "front_setback", "rear_setback", "left_side_setback", "right_side_setback"],
-                    "prompt_key": "setback_floors"
+                    "prompt_key": "setback_floors",
+                    "page_types": ["site_plan", "area_statement", "elevation", "section"]
                 },
                 "staircase": {
                     "extractor_class": "StaircaseExtractor",
                     "variables": ["staircase_riser", "staircase_tread", "staircase_width"], 
-                    "prompt_key": "staircase"
+                    "prompt_key": "staircase",
+                    "page_types": ["section", "floor_plan"]
                 },
                 "height_kitchen_bathroom": {
                     "extractor_class": "HeightKitchenBathroomExtractor",
                     "variables": ["bathroom", "water_closet", "combined_bath_wc", "kitchen_only", "kitchen_with_separate_dining", "kitchen_with_separate_store", "kitchen_with_dining", "plinth_height", "building_height"],
-                    "prompt_key": "height_kitchen_bathroom"
+                    "prompt_key": "height_kitchen_bathroom",
+                    "page_types": ["floor_plan", "section", "elevation"]
                 }
             }
             
             # Initialize results dictionary
             all_var_dict = {}
-            
+
+            # Fail-fast bookkeeping: rules skipped and the rule that triggered the skip
+            skip_rules = {}
+            hard_failure = None
+            calls_saved = 0
+
                 # Extract each GROUP using single call per extractor
-            for group_name, group_config in extractor_groups.items():
+            for group_name in order_extractor_groups(extractor_groups.keys(), fail_fast):
+                group_config = extractor_groups[group_name]
+
+                if hard_failure:
+                    print(f"[FailFast] Skipping {group_name}: {hard_failure} already failed")
+                    for rule_name in GROUP_RULES.get(group_name, []):
+                        skip_rules[rule_name] = f"Not evaluated: skipped after {hard_failure} failed (fail-fast mode)"
+                    # An empty result dict takes the "no data" fallbacks below
+                    for variable in group_config['variables']:
+                        all_var_dict[variable] = {}
+                    calls_saved += 1
+                    continue
+
                 print(f"Extracting {group_name} variables: {group_config['variables']}")
                 
                 # Always write to debug log for web app debugging
@@ -145,6 +364,12 @@ def analyze_map_with_ai(file_data, filename, file_type):
                     print(f"DEBUG: Using first variable '{first_variable}' for group {group_name}")
                     
                     var_image = get_image_for_var(processed_image, boxs, first_variable)
+                    if page_classes:
+                        # processed_image follows the classifier's page order
+                        page_order = list(page_classes.labels)
+                        routed = page_classes.route(group_config["page_types"])
+                        var_image = [var_image[page_order.index(page)] for page in routed]
+                        print(f"[Pages] {group_name} gets page(s) {[page + 1 for page in routed]} of {len(page_order)}")
                     var_extractor_class = get_extractor_func(first_variable)
                     var_examples = get_examples_for_var(first_variable)
                     var_prompt = get_prompt_for_var(first_variable)
@@ -172,17 +397,27 @@ def analyze_map_with_ai(file_data, filename, file_type):
                         except:
                             pass
                         
-                        # Create Extractor and run ONCE for the entire group
-                        # Pass the extractor CLASS, not an instance - buildplanwizard will instantiate it
-                        var_dict = Extractor(
-                            model=gemini_model,
-                            extractor=var_extractor_class,  # Pass class, not instance
-                            image=var_image,
-                            examples=var_examples,
-                            prompt=var_prompt
-                        )
-                        
-                        result = var_dict.run()
+                        local_result = text_layer.group_result(group_name) if text_layer else None
+                        if local_result is not None:
+                            print(f"[TextLayer] {group_name} answered from the PDF text layer - model call skipped")
+                            result = local_result
+                        else:
+                            if text_layer:
+                                var_prompt += text_layer.hints(group_name)
+                            if geometry:
+                                var_prompt += geometry.hints(group_name)
+
+                            # Create Extractor and run ONCE for the entire group
+                            # Pass the extractor CLASS, not an instance - buildplanwizard will instantiate it
+                            var_dict = Extractor(
+                                model=gemini_model,
+                                extractor=var_extractor_class,  # Pass class, not instance
+                                image=var_image,
+                                examples=var_examples,
+                                prompt=var_prompt
+                            )
+
+                            result = var_dict.run()
                         
                         # Write result debug info to file  
                         try:
@@ -191,11 +426,24 @@ def analyze_map_with_ai(file_data, filename, file_type):
                         except:
                             pass
                         
+                        if geometry:
+                            for message in geometry.cross_check(group_name, result):
+                                print(f"[Geometry] Cross-check {group_name}: {message}")
+
                         # Distribute the single result to all variables in the group
                         for variable in group_config['variables']:
                             all_var_dict[variable] = result
-                            
+
+                        # Area rules read plot_area_far entries, not the raw extractor dict
+                        if group_name == "area":
+                            all_var_dict["plot_area_far"] = area_rule_entries(result)
+
                         print(f"{group_name} extraction completed - distributed to {len(group_config['variables'])} variables")
+
+                        if fail_fast and group_name in FAIL_FAST_CHECKS:
+                            hard_failure = FAIL_FAST_CHECKS[group_name](result)
+                            if hard_failure:
+                                print(f"[FailFast] {hard_failure} failed definitively - skipping remaining groups")
                     else:
                         print(f"Warning: No extractor or prompt found for {group_name}")
                         try:
@@ -209,6 +457,8 @@ def analyze_map_with_ai(file_data, filename, file_type):
                         for variable in group_config['variables']:
                             all_var_dict[variable] = []
                         
+                except TransientAnalysisError:
+                    raise
                 except Exception as e:
                     print(f"Error extracting {group_name}: {e}")
                     try:
@@ -367,8 +617,8 @@ def analyze_map_with_ai(file_data, filename, file_type):
                     all_var_dict["plinth_height"] = ["Not Sure"]
                     all_var_dict["building_height"] = ["Not Sure"]
                     
-                    # Extract plot data (height info)
-                    plot_data = height_kb_result.get("plot_data", {})
+                    # Extract plot data (height info); skipped or failed groups leave a list here
+                    plot_data = height_kb_result.get("plot_data", {}) if isinstance(height_kb_result, dict) else {}
                     all_var_dict["plinth_height"] = plot_data.get("plinth_height", ["Not Sure"])
                     all_var_dict["building_height"] = plot_data.get("building_height", ["Not Sure"])
                     
@@ -485,8 +735,10 @@ def analyze_map_with_ai(file_data, filename, file_type):
             # Run validation WITHOUT changing directory
             print("Running rule validation...")
             
-            validation_results = check_rules.run_validation(base_path=temp_dir)
+            validation_results = check_rules.run_validation(base_path=temp_dir, skip_rules=skip_rules)
             raw_validation = validation_results
+            if fail_fast:
+                _record_fail_fast(calls_saved)
             
             print("Validation completed")
 
@@ -512,10 +764,12 @@ def analyze_map_with_ai(file_data, filename, file_type):
                         elif rule_name.lower().startswith("rule"):
                             # This is one of the 10 rules - check if it passed
                             rule_passed = False
+                            not_evaluated = False
                             
                             # Handle structured list of dicts correctly
                             if isinstance(rule_result, list) and rule_result:
                                 rule_passed = rule_result[0].get("status", "").lower() == "pass"
+                                not_evaluated = rule_result[0].get("status") == check_rules.NOT_EVALUATED
                             elif isinstance(rule_result, dict):
                                 rule_passed = rule_result.get("status", "").lower() == "pass"
                             else:
@@ -528,6 +782,8 @@ def analyze_map_with_ai(file_data, filename, file_type):
                                 "passed": rule_passed,
                                 "message": rule_result  # keep full JSON/dict instead of just string
                             }
+                            if not_evaluated:
+                                results[rule_name]["not_evaluated"] = True
 
                 # Only approve if ALL 10 rules are passed
                 if rules_passed == total_rules:
@@ -568,6 +824,9 @@ def analyze_map_with_ai(file_data, filename, file_type):
                 print(f"Cleanup error: {cleanup_error}")
                 pass
                 
+    except TransientAnalysisError:
+        # Left to the caller, which retries the job (see worker.process_analysis_job)
+        raise
     except Exception as e:
         print(f"Error in map analysis: {str(e)}")
         traceback.print_exc()
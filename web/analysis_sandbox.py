@@ -0,0 +1,462 @@
+"""
+Isolated analysis processes.
+
+An analysis holds a rasterized plan set, model responses and the rule
+checker's state at once, and the allocator rarely gives that memory back to
+the OS, so a long-lived worker that runs analyses in-process grows until the
+instance runs out of memory. The worker therefore runs each analysis in one of
+its pre-forked child processes:
+
+- the parent samples each busy child's RSS (the child and its render helpers)
+  and kills a child above ANALYSIS_CHILD_MAX_RSS_MB or past
+  ANALYSIS_CHILD_TIMEOUT_SECONDS;
+- a child is replaced after ANALYSIS_CHILD_MAX_JOBS analyses, or as soon as it
+  is above ANALYSIS_CHILD_RECYCLE_RSS_MB after a job, which returns whatever
+  the job left behind to the OS;
+- admit() lets the worker claim a job only while the memory of its process
+  tree (PSS, so pages shared with the fork server count once) plus the projected peak growth of every running and new analysis fits
+  ANALYSIS_MEMORY_BUDGET_MB.
+
+Model-call metrics and rate-limiter counts recorded in a child are sent back
+with each result, so the worker's /metrics still covers every call.
+"""
+
+import atexit
+import collections
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import time
+import traceback
+
+import psutil
+
+try:
+    import resource
+except ImportError:  # Windows: no ru_maxrss, peaks come from sampling only
+    resource = None
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.core import config_map as config
+from src.core.errors import TransientAnalysisError, is_transient_error
+from src.core.metrics import REGISTRY
+from src.core.rate_limiter import gemini_rate_limiter
+
+try:
+    from .analysis import analyze_map_with_ai
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from analysis import analyze_map_with_ai
+
+
+MB = 1024 * 1024
+# How often a busy child's RSS is sampled
+WATCH_INTERVAL_SECONDS = 0.25
+# Peak growths remembered for the admission projection
+PEAK_HISTORY = 20
+# How long a child gets to start, and to exit when retired
+CHILD_START_SECONDS = 60
+CHILD_EXIT_SECONDS = 5
+
+
+class AnalysisSandboxError(RuntimeError):
+    """An isolated analysis exceeded its limits."""
+
+
+def _tree_rss(pid, proportional=False):
+    """
+    RSS of a process and all of its descendants, in bytes (0 once it is gone).
+    Children share the fork server's imported modules, which every child's
+    RSS counts in full; `proportional` sums PSS instead (where available),
+    which splits shared pages between their users and so adds up to what
+    the processes actually occupy.
+    """
+    try:
+        process = psutil.Process(pid)
+        processes = [process] + process.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return 0
+    total = 0
+    for proc in processes:
+        try:
+            if proportional:
+                info = proc.memory_full_info()
+                total += getattr(info, "pss", info.rss)
+            else:
+                total += proc.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied:
+            total += proc.memory_info().rss
+    return total
+
+
+def _portable_error(exc):
+    """The child's exception in a form that survives pickling and keeps its transient/permanent class."""
+    if is_transient_error(exc):
+        if isinstance(exc, TransientAnalysisError):
+            return exc
+        return TransientAnalysisError(f"{type(exc).__name__}: {exc}")
+    try:
+        pickle.loads(pickle.dumps(exc))
+        return exc
+    except Exception:
+        return AnalysisSandboxError(f"{type(exc).__name__}: {exc}")
+
+
+def _portable_result(result):
+    results, overall_status, raw_validation, validation_text = result
+    try:
+        pickle.dumps(raw_validation)
+    except Exception:
+        # The worker only reads results and status; the raw validation is debugging output
+        raw_validation = None
+    return results, overall_status, raw_validation, validation_text
+
+
+def _child_main(conn, rate_share):
+    """
+    Child loop: receive (file_data, filename, file_type), reply
+    ("ok", result, stats) or ("error", exception, stats); None or a closed
+    pipe ends the child.
+    """
+    # One render helper instead of one per core: this process is already the sandbox
+    config.RENDER_SANDBOX_WORKERS = config.RENDER_SANDBOX_WORKERS or 1
+    # The children of a worker share its Gemini key budget
+    gemini_rate_limiter.split(rate_share)
+    process = psutil.Process(os.getpid())
+    conn.send(("ready", os.getpid()))
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+
+        limiter_before = gemini_rate_limiter.stats()
+        try:
+            reply = ("ok", _portable_result(analyze_map_with_ai(*task)))
+        except Exception as exc:
+            traceback.print_exc()
+            reply = ("error", _portable_error(exc))
+
+        limiter_after = gemini_rate_limiter.stats()
+        stats = {
+            "rss": process.memory_info().rss,
+            "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource else 0,
+            "metrics": REGISTRY.drain(),
+            "limiter": {key: limiter_after[key] - limiter_before[key] for key in ("calls", "waits", "wait_seconds")},
+        }
+        try:
+            conn.send(reply + (stats,))
+        except Exception as exc:
+            conn.send(("error", AnalysisSandboxError(f"Analysis result could not be sent back: {exc}"), stats))
+
+
+class AnalysisChild:
+    """One pre-forked analysis process and the parent's end of its pipe."""
+
+    def __init__(self, context, rate_share):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_child_main, args=(child_conn, rate_share), name="analysis-child", daemon=False)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self.max_rss = 0
+        self.job_rss_start = 0
+        if not self.conn.poll(CHILD_START_SECONDS):
+            self.kill()
+            raise AnalysisSandboxError(f"Analysis process did not start within {CHILD_START_SECONDS}s")
+        self.conn.recv()
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def rss(self):
+        return _tree_rss(self.pid)
+
+    def kill(self):
+        """Kill the child and anything it started (render helpers, their fork server)."""
+        try:
+            processes = psutil.Process(self.pid).children(recursive=True)
+        except psutil.NoSuchProcess:
+            processes = []
+        if self.process.is_alive():
+            self.process.kill()
+        for proc in processes:
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+        self.process.join(CHILD_EXIT_SECONDS)
+        self.conn.close()
+
+    def retire(self):
+        """Let an idle child exit on its own, killing it if it lingers."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(CHILD_EXIT_SECONDS)
+        self.kill()
+
+
+analysis_children = REGISTRY.gauge("analysis_children", "Isolated analysis processes by state", ("state",))
+analysis_children_rss = REGISTRY.gauge("analysis_children_resident_memory_bytes", "RSS of the analysis processes and their helpers")
+analysis_child_recycles = REGISTRY.counter(
+    "analysis_child_recycles_total", "Analysis processes replaced, by reason (jobs, memory, killed)", ("reason",))
+analysis_projected_peak = REGISTRY.gauge(
+    "analysis_projected_peak_bytes", "Memory growth reserved for each analysis when admitting jobs")
+analysis_admission_deferrals = REGISTRY.counter(
+    "analysis_admission_deferrals_total", "Claims held back because the memory budget was full")
+
+
+class AnalysisSandbox:
+    """Pre-forked analysis processes, recycled by job count and memory, behind a memory-budget admission check."""
+
+    def __init__(self, size, max_jobs, max_rss_mb, recycle_rss_mb, timeout_seconds, budget_mb, job_peak_mb):
+        self.size = max(1, size)
+        self.max_jobs = max_jobs
+        self.max_rss_bytes = max_rss_mb * MB
+        self.recycle_rss_bytes = recycle_rss_mb * MB
+        self.timeout_seconds = timeout_seconds
+        self.budget_bytes = budget_mb * MB
+        self.job_peak_bytes = job_peak_mb * MB
+        self._lock = threading.Lock()
+        self._context = None
+        self._idle = []
+        self._busy = set()
+        self._reserved = 0
+        self._peaks = collections.deque(maxlen=PEAK_HISTORY)
+        self.jobs = 0
+        self.recycled = collections.Counter()
+        self.deferred = 0
+
+    def _get_context(self):
+        # Children fork from a clean single-threaded server that has already imported the analysis stack
+        if self._context is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(["fitz", "numpy", "PIL.Image", __name__])
+                self._context = context
+            else:
+                self._context = multiprocessing.get_context()
+        return self._context
+
+    def _spawn(self):
+        return AnalysisChild(self._get_context(), self.size)
+
+    def start(self):
+        """Fork every child now so the first analysis does not pay for the start-up."""
+        started = time.perf_counter()
+        # Registered after multiprocessing's own exit hook, so it runs first
+        atexit.register(self.shutdown)
+        children = [self._spawn() for _ in range(self.size - len(self._idle) - len(self._busy))]
+        with self._lock:
+            self._idle.extend(children)
+        print(
+            f"[Isolation] Started {len(children)} analysis process(es) in {time.perf_counter() - started:.2f}s; "
+            f"budget {self.budget_bytes // MB} MB, child limit {self.max_rss_bytes // MB} MB",
+            flush=True,
+        )
+
+    def projected_growth(self):
+        """Memory an analysis is expected to add to its child at peak."""
+        with self._lock:
+            return max([self.job_peak_bytes] + list(self._peaks))
+
+    def admit(self, wanted):
+        """
+        Reserve room for up to `wanted` new analyses and return how many fit.
+        Running analyses are charged whatever of their projected growth they
+        have not reached yet. One job is always admitted when none is running,
+        so a budget below a single analysis slows the worker down instead of
+        stopping it. Pass unused reservations back to release().
+        """
+        if wanted <= 0:
+            return 0
+        with self._lock:
+            busy = list(self._busy)
+            reserved = self._reserved
+        if not self.budget_bytes:
+            admitted = wanted
+        else:
+            growth = self.projected_growth()
+            used = _tree_rss(os.getpid(), proportional=True)
+            pending = reserved * growth + sum(max(0, growth - (child.rss() - child.job_rss_start)) for child in busy)
+            headroom = self.budget_bytes - used - pending
+            admitted = min(wanted, max(0, int(headroom // growth)))
+            if not admitted and not busy and not reserved:
+                admitted = 1
+            if admitted < wanted:
+                self.deferred += 1
+                analysis_admission_deferrals.inc()
+        with self._lock:
+            self._reserved += admitted
+        return admitted
+
+    def release(self, count):
+        """Return reservations from admit() that were not used."""
+        with self._lock:
+            self._reserved = max(0, self._reserved - count)
+
+    def _acquire(self):
+        with self._lock:
+            self._reserved = max(0, self._reserved - 1)
+            child = self._idle.pop() if self._idle else None
+        if child is None or not child.process.is_alive():
+            if child is not None:
+                child.kill()
+            child = self._spawn()
+        with self._lock:
+            self._busy.add(child)
+        return child
+
+    def _release(self, child, reason=None, stats=None):
+        """Put the child back, or replace it when it was killed or has reached a recycling threshold."""
+        with self._lock:
+            self._busy.discard(child)
+        if reason is None and self.max_jobs and child.jobs >= self.max_jobs:
+            reason = "jobs"
+        if reason is None and stats and self.recycle_rss_bytes and stats["rss"] > self.recycle_rss_bytes:
+            reason = "memory"
+        if reason is None:
+            with self._lock:
+                self._idle.append(child)
+            return
+
+        if reason == "killed":
+            child.kill()
+        else:
+            child.retire()
+        analysis_child_recycles.inc(reason=reason)
+        with self._lock:
+            self.recycled[reason] += 1
+        print(f"[Isolation] Recycled analysis process {child.pid} after {child.jobs} job(s) ({reason})", flush=True)
+        try:
+            replacement = self._spawn()
+        except Exception as exc:
+            # The next job forks one on demand
+            print(f"[Isolation] Could not replace analysis process: {exc}", flush=True)
+            return
+        with self._lock:
+            self._idle.append(replacement)
+
+    def _wait(self, child):
+        """Wait for the child's reply while enforcing the RSS ceiling and deadline; return (reply, peak RSS)."""
+        deadline = time.monotonic() + self.timeout_seconds if self.timeout_seconds else None
+        peak = child.job_rss_start
+        while not child.conn.poll(WATCH_INTERVAL_SECONDS):
+            rss = child.rss()
+            peak = max(peak, rss)
+            if self.max_rss_bytes and rss > self.max_rss_bytes:
+                raise AnalysisSandboxError(
+                    f"Analysis exceeded the {self.max_rss_bytes // MB} MB memory limit ({rss / MB:.0f} MB)")
+            if deadline is not None and time.monotonic() > deadline:
+                raise AnalysisSandboxError(f"Analysis exceeded the {self.timeout_seconds:.0f}s deadline")
+            if not child.process.is_alive():
+                break
+        try:
+            return child.conn.recv(), peak
+        except (EOFError, OSError):
+            # Killed from outside (the OOM killer) or crashed; another attempt may well succeed
+            child.process.join(CHILD_EXIT_SECONDS)
+            raise TransientAnalysisError(f"Analysis process died (exit code {child.process.exitcode})")
+
+    def run(self, file_data, filename, file_type):
+        """Run analyze_map_with_ai in a child; returns its result or raises its exception."""
+        child = self._acquire()
+        child.job_rss_start = child.rss()
+        try:
+            child.conn.send((file_data, filename, file_type))
+            (outcome, payload, stats), peak = self._wait(child)
+        except BaseException:
+            self._release(child, "killed")
+            raise
+
+        child.jobs += 1
+        REGISTRY.absorb(stats["metrics"])
+        gemini_rate_limiter.absorb(stats["limiter"])
+        if stats["max_rss"] > child.max_rss:
+            # ru_maxrss only moves when this job set a new high for the child process itself
+            peak = max(peak, stats["max_rss"])
+            child.max_rss = stats["max_rss"]
+        growth = max(0, peak - child.job_rss_start)
+        with self._lock:
+            self.jobs += 1
+            self._peaks.append(growth)
+        print(
+            f"[Isolation] Analysis in process {child.pid} (job {child.jobs}): start {child.job_rss_start / MB:.0f} MB, "
+            f"peak {peak / MB:.0f} MB, end {stats['rss'] / MB:.0f} MB",
+            flush=True,
+        )
+        self._release(child, stats=stats)
+
+        if outcome == "error":
+            raise payload
+        return payload
+
+    def stats(self):
+        with self._lock:
+            children = list(self._idle) + list(self._busy)
+            busy = len(self._busy)
+            return {
+                "children": len(children),
+                "busy": busy,
+                "jobs": self.jobs,
+                "recycled": dict(self.recycled),
+                "deferred": self.deferred,
+                "projected_peak": max([self.job_peak_bytes] + list(self._peaks)),
+                "pids": [child.pid for child in children],
+            }
+
+    def collect_metrics(self):
+        stats = self.stats()
+        analysis_children.set(stats["busy"], state="busy")
+        analysis_children.set(stats["children"] - stats["busy"], state="idle")
+        analysis_children_rss.set(sum(_tree_rss(pid) for pid in stats["pids"]))
+        analysis_projected_peak.set(stats["projected_peak"])
+
+    def shutdown(self):
+        """Stop every child; runs at exit, before multiprocessing would wait for them."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            busy = list(self._busy)
+        for child in idle:
+            child.retire()
+        for child in busy:
+            child.kill()
+
+
+_sandbox = None
+_sandbox_lock = threading.Lock()
+
+
+def get_analysis_sandbox(size=None):
+    """Process-wide analysis sandbox with `size` children (default: ANALYSIS_WORKER_SLOTS), created on first use."""
+    global _sandbox
+    with _sandbox_lock:
+        if _sandbox is None:
+            _sandbox = AnalysisSandbox(
+                size=size or int(os.environ.get("ANALYSIS_WORKER_SLOTS", "4")),
+                max_jobs=config.ANALYSIS_CHILD_MAX_JOBS,
+                max_rss_mb=config.ANALYSIS_CHILD_MAX_RSS_MB,
+                recycle_rss_mb=config.ANALYSIS_CHILD_RECYCLE_RSS_MB,
+                timeout_seconds=config.ANALYSIS_CHILD_TIMEOUT_SECONDS,
+                budget_mb=config.ANALYSIS_MEMORY_BUDGET_MB,
+                job_peak_mb=config.ANALYSIS_JOB_PEAK_MB,
+            )
+        return _sandbox
+
+
+def run_analysis(file_data, filename, file_type):
+    """analyze_map_with_ai, in an isolated child unless ANALYSIS_ISOLATION is off."""
+    if config.ANALYSIS_ISOLATION:
+        return get_analysis_sandbox().run(file_data, filename, file_type)
+    return analyze_map_with_ai(file_data, filename, file_type)
@@ -5,12 +5,12 @@ import sys
 # Handle both relative and absolute imports
 try:
     from .routes import register_routes
-    from .database import init_db
+    from .database import close_connection_scope, init_db, open_connection_scope
 except ImportError:
     # Fallback for direct execution
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from routes import register_routes
-    from database import init_db
+    from database import close_connection_scope, init_db, open_connection_scope
 
 app = Flask(__name__)
 app.secret_key = os.getenv("SECRET_KEY", "your_secret_key_change_this_in_production") #change1
@@ -19,8 +19,20 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 # Initialize the database
 init_db()
 
+# At most one pooled database connection per request, checked out on first use
+app.before_request(open_connection_scope)
+app.teardown_request(lambda exc: close_connection_scope())
+
 # Register all Flask routes
 register_routes(app)
 
+# Single-service deploys: run analyses in this process instead of a separate worker
+if os.getenv("ANALYSIS_EMBEDDED_WORKER", "false").lower() == "true":
+    try:
+        from .worker import start_embedded_worker
+    except ImportError:
+        from worker import start_embedded_worker
+    start_embedded_worker()
+
 if __name__ == '__main__':
     app.run(debug=False, use_reloader=False)
\ No newline at end of file
@@ -0,0 +1,314 @@
+"""
+Content-addressed storage for uploaded plan files.
+
+Uploads used to live in the `maps.image` column, so every query touching a
+map row dragged the whole file into Python. Files are now stored once under
+their SHA-256 digest (identical uploads share one blob) and the row keeps
+only `blob_sha256` and `blob_size`. Readers stream the blob or map it into
+memory instead of materialising a bytes copy per request.
+
+Two backends share the BlobStore interface: LocalBlobStore (a sharded
+directory tree) and S3BlobStore (any S3-compatible endpoint, via boto3,
+with a local read-through directory for mmap access).
+
+In production only a durable store is accepted: get_blob_store() refuses a
+local directory unless it is declared to be on a persistent disk.
+
+get_originals_store() is a second, cold store of the same kind holding the
+untouched originals of normalized uploads (its own directory, or its own S3
+prefix written with an infrequent-access storage class). The hot store keeps
+only what analyses and previews read.
+"""
+
+import hashlib
+import mmap
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.core import config_map as config
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def _is_digest(digest):
+    return isinstance(digest, str) and len(digest) == 64 and all(ch in "0123456789abcdef" for ch in digest)
+
+
+class BlobStoreNotDurable(RuntimeError):
+    """The configured blob store would lose files on redeploy in production."""
+
+
+class BlobStore:
+    """Interface of a content-addressed blob store; see the module docstring."""
+
+    # Whether stored blobs outlive this machine's disk (a redeploy, another service)
+    durable = False
+
+    def put(self, data):
+        """Store bytes; return (sha256, size). Storing existing content is a no-op."""
+        raise NotImplementedError
+
+    def put_file(self, path):
+        """Store a file's content, hashing it in chunks; return (sha256, size)."""
+        raise NotImplementedError
+
+    def exists(self, digest):
+        raise NotImplementedError
+
+    def open(self, digest):
+        """Binary file-like object streaming the blob."""
+        raise NotImplementedError
+
+    def local_path(self, digest):
+        """Path of a local file holding the blob (fetched first for remote backends)."""
+        raise NotImplementedError
+
+    def delete(self, digest):
+        raise NotImplementedError
+
+    def read(self, digest):
+        """The whole blob as bytes."""
+        with self.mapped(digest) as view:
+            return bytes(view)
+
+    @contextmanager
+    def mapped(self, digest):
+        """Read-only mmap of the blob; pages are loaded lazily by the kernel."""
+        with open(self.local_path(digest), "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                yield b""
+                return
+            view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield view
+            finally:
+                view.close()
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files under root/<aa>/<bb>/<sha256>, written atomically."""
+
+    def __init__(self, root, durable=False):
+        self.root = root
+        self.durable = durable
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, digest):
+        if not _is_digest(digest):
+            raise ValueError(f"Not a SHA-256 digest: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def _commit(self, tmp_path, digest):
+        path = self._path(digest)
+        if os.path.exists(path):
+            os.unlink(tmp_path)  # same content already stored
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+
+    def put(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        if not self.exists(digest):
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            self._commit(tmp_path, digest)
+        return digest, len(data)
+
+    def put_file(self, path):
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as out, open(path, "rb") as source:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        digest = hasher.hexdigest()
+        self._commit(tmp_path, digest)
+        return digest, size
+
+    def exists(self, digest):
+        return os.path.exists(self._path(digest))
+
+    def open(self, digest):
+        return open(self._path(digest), "rb")
+
+    def local_path(self, digest):
+        path = self._path(digest)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Blob {digest} not found")
+        return path
+
+    def delete(self, digest):
+        try:
+            os.unlink(self._path(digest))
+        except FileNotFoundError:
+            pass
+
+
+class S3BlobStore(BlobStore):
+    """
+    Blobs as objects <prefix><sha256> in an S3-compatible bucket. local_path()
+    and mapped() read through a LocalBlobStore, so repeated reads of the same
+    plan (analysis retries, renditions) fetch it once. The local copies are
+    bounded by cache_max_bytes: each download deletes the least recently read
+    ones, by file mtime, so every process sharing the directory agrees.
+    """
+
+    durable = True
+
+    def __init__(self, bucket, prefix="", endpoint_url=None, cache_dir=None, client=None, storage_class=None,
+                 cache_max_bytes=0):
+        if client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise RuntimeError("BLOB_STORE=s3 requires boto3 (pip install boto3)")
+            client = boto3.client("s3", endpoint_url=endpoint_url or None)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.storage_class = storage_class or None
+        self.cache_max_bytes = cache_max_bytes
+        self.cache = LocalBlobStore(cache_dir or os.path.join(tempfile.gettempdir(), "buildplanwizard_blobs"))
+
+    def _key(self, digest):
+        if not _is_digest(digest):
+            raise ValueError(f"Not a SHA-256 digest: {digest!r}")
+        return f"{self.prefix}{digest}"
+
+    def exists(self, digest):
+        from botocore.exceptions import ClientError
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(digest))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def put(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        if not self.exists(digest):
+            extra = {"StorageClass": self.storage_class} if self.storage_class else {}
+            self.client.put_object(Bucket=self.bucket, Key=self._key(digest), Body=data, **extra)
+        return digest, len(data)
+
+    def put_file(self, path):
+        digest, size = self.cache.put_file(path)
+        if not self.exists(digest):
+            # upload_file streams in multipart chunks
+            extra = {"StorageClass": self.storage_class} if self.storage_class else None
+            self.client.upload_file(self.cache.local_path(digest), self.bucket, self._key(digest), ExtraArgs=extra)
+        self._trim_cache(keep=digest)
+        return digest, size
+
+    def open(self, digest):
+        if self.cache.exists(digest):
+            return self.cache.open(digest)
+        return self.client.get_object(Bucket=self.bucket, Key=self._key(digest))["Body"]
+
+    def local_path(self, digest):
+        if self.cache.exists(digest):
+            path = self.cache.local_path(digest)
+            try:
+                os.utime(path)  # mtime is the LRU clock of the local copies
+                return path
+            except FileNotFoundError:
+                pass  # evicted by another process meanwhile
+        if not self.cache.exists(digest):
+            from botocore.exceptions import ClientError
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache.root, suffix=".tmp")
+            os.close(fd)
+            try:
+                self.client.download_file(self.bucket, self._key(digest), tmp_path)
+            except ClientError as e:
+                os.unlink(tmp_path)
+                if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                    raise FileNotFoundError(f"Blob {digest} not found") from e
+                raise
+            self.cache._commit(tmp_path, digest)
+            self._trim_cache(keep=digest)
+        return self.cache.local_path(digest)
+
+    def _trim_cache(self, keep):
+        """Delete the least recently read local copies, other than `keep`, beyond cache_max_bytes."""
+        if not self.cache_max_bytes:
+            return
+        entries, total = [], 0
+        for directory, _, names in os.walk(self.cache.root):
+            for name in names:
+                if not _is_digest(name):
+                    continue  # downloads in progress
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                total += stat.st_size
+                if name != keep:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        for _, size, path in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                os.unlink(path)  # readers holding it open or mapped keep their copy
+            except OSError:
+                pass
+            total -= size
+
+    def delete(self, digest):
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(digest))
+        self.cache.delete(digest)
+
+
+_store = None
+_originals_store = None
+_store_lock = threading.Lock()
+
+
+def _configured_store(local_dir, s3_prefix, storage_class=None):
+    if config.BLOB_STORE == "s3":
+        if not config.BLOB_S3_BUCKET:
+            raise RuntimeError("BLOB_STORE=s3 requires BLOB_S3_BUCKET")
+        return S3BlobStore(
+            config.BLOB_S3_BUCKET,
+            prefix=s3_prefix,
+            endpoint_url=config.BLOB_S3_ENDPOINT_URL,
+            cache_dir=local_dir,
+            storage_class=storage_class,
+            cache_max_bytes=config.BLOB_CACHE_MAX_MB * 1024 * 1024,
+        )
+    store = LocalBlobStore(local_dir, durable=config.BLOB_STORE_LOCAL_DURABLE)
+    if config.PRODUCTION and not store.durable:
+        raise BlobStoreNotDurable(
+            f"BLOB_STORE=local keeps uploads in {local_dir}, which is lost on redeploy and "
+            "not shared with other services. Set BLOB_STORE=s3 (BLOB_S3_BUCKET, credentials), or "
+            f"BLOB_STORE_LOCAL_DURABLE=true if {local_dir} is on a persistent disk."
+        )
+    return store
+
+
+def get_blob_store():
+    """Return the process-wide blob store configured from config_map."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = _configured_store(config.BLOB_STORE_DIR, config.BLOB_S3_PREFIX)
+        return _store
+
+
+def get_originals_store():
+    """Return the process-wide cold store for the originals of normalized uploads."""
+    global _originals_store
+    with _store_lock:
+        if _originals_store is None:
+            _originals_store = _configured_store(
+                config.ORIGINALS_STORE_DIR, config.ORIGINALS_S3_PREFIX, config.ORIGINALS_S3_STORAGE_CLASS)
+        return _originals_store
@@ -4,13 +4,12 @@
 import os
 import sys
 import psutil
-import fitz  # PyMuPDF
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
 from src.core import config_map as config
+from src.core.errors import TransientAnalysisError
 from PIL import Image
-from pdf2image import convert_from_path
 
 from src.extractors.area_extraction import AreaExtractor
 from src.extractors.room_extraction import RoomExtractor
@@ -23,12 +22,12 @@ from src.core import utils
 # Import rule_verifier from separate file - handle both relative and absolute imports
 try:
     from .rule_verifier import rule_verifier
+    from .render_service import render_pdf_pages
 except ImportError:
     from rule_verifier import rule_verifier
+    from render_service import render_pdf_pages
 
 
-import platform
-
 def print_memory_usage(label=""):
     """Print current process RAM usage in MB for debugging on Render logs."""
     process = psutil.Process(os.getpid())
@@ -36,55 +35,13 @@ def print_memory_usage(label=""):
     prefix = f"{label} " if label else ""
     print(f"{prefix}Memory usage: {mem / (1024 ** 2):.2f} MB", flush=True)
 
+def read_pdf_pages(file_path, pages=None, max_workers=None, file_hash=None):
+    """Rasterize the selected pages of a PDF with the configured analysis render profile."""
+    return render_pdf_pages(file_path, pages=pages, profile=config.ANALYSIS_RENDER_PROFILE, max_workers=max_workers, file_hash=file_hash)
+
 def read_pdf(file_path):
     """Convert PDF to image and return the first page"""
-    try:
-        process = psutil.Process(os.getpid())
-        mem_before = process.memory_info().rss
-        print_memory_usage("[PDF->Image] Before conversion")
-
-        # Current logic: Use PyMuPDF for lower RAM usage.
-        doc = fitz.open(file_path)
-        try:
-            page = doc.load_page(0)  # first page only
-
-            # Lower resolution for better memory efficiency.
-            zoom = 1.5
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            mode = "RGBA" if pix.alpha else "RGB"
-            image = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-            if mode == "RGBA":
-                image = image.convert("RGB")
-        finally:
-            doc.close()
-
-        # Previous logic (pdf2image) kept for easy rollback.
-        # On Windows use bundled poppler
-        # if platform.system() == "Windows":
-        #     poppler_path = os.path.join(config.MAIN_PATH, "poppler-24.08.0", "Library", "bin")
-        #     images = convert_from_path(file_path, dpi=300, poppler_path=poppler_path)
-        # else:
-        #     # On Linux (Render) poppler is installed in system PATH
-        #     images = convert_from_path(file_path, dpi=300)
-
-        # if not images:
-        #     raise Exception("Failed to convert PDF to image")
-
-        # image = images[0]
-
-        mem_after = process.memory_info().rss
-        print_memory_usage("[PDF->Image] After conversion")
-        print(
-            f"[PDF->Image] RAM delta: {(mem_after - mem_before) / (1024 ** 2):.2f} MB",
-            flush=True,
-        )
-
-        return image
-
-    except Exception as e:
-        raise Exception(f"PDF conversion failed: {str(e)}")
+    return read_pdf_pages(file_path, pages="1")[0]
 
 def create_segments(input_map_image, model="WHOLE_IMAGE"):
     """Process image for whole-image extraction (no YOLO segmentation needed)"""
@@ -114,6 +71,9 @@ class Extractor():
             # Run extraction with whole image
             self.result = extractor_instance.extraction(self.image, self.prompt, [], self.model)
             return self.result
+        except TransientAnalysisError:
+            # Rate limits and outages must reach the worker so the job is retried, not reported empty
+            raise
         except Exception as e:
             print(f"Extraction error: {e}")
             self.result = {}
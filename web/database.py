@@ -1,7 +1,31 @@
+import base64
+import json
 import sqlite3
 import os
+import random
+import socket
+import sys
+import threading
+from contextlib import contextmanager
+
 import psycopg2
 
+# Handle both relative and absolute imports
+try:
+    from .blob_store import get_blob_store, get_originals_store
+    from .db_pool import ConnectionPool, PoolTimeout
+    from .job_wakeup import JOB_CHANNEL, notify_local_workers
+    from .migrations import apply_migrations
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from blob_store import get_blob_store, get_originals_store
+    from db_pool import ConnectionPool, PoolTimeout
+    from job_wakeup import JOB_CHANNEL, notify_local_workers
+    from migrations import apply_migrations
+
+from src.core import config_map as config
+from src.core.metrics import REGISTRY
+
 
 # -------------------------------
 # SQLite Adapters (unchanged)
@@ -45,33 +69,230 @@ class SQLiteConnectionAdapter:
 
 
 def _is_sqlite_connection(conn):
+    if isinstance(conn, PooledConnection):
+        conn = conn.raw
     return isinstance(conn, SQLiteConnectionAdapter) or isinstance(conn, sqlite3.Connection)
 
 
 # -------------------------------
-# 🔥 FIXED DATABASE CONNECTION
+# CONNECTION POOLING
 # -------------------------------
-def get_connection():
+# PostgreSQL connections come from a process-wide pool instead of a new TLS
+# handshake per helper; SQLite keeps one persistent connection per thread.
+# Inside connection_scope() (one web request, one worker job) every
+# get_connection() reuses a single connection checked out on first use.
+DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.environ.get("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_HEALTH_CHECK_IDLE_SECONDS = float(os.environ.get("DB_POOL_HEALTH_CHECK_IDLE_SECONDS", "30"))
+
+_pool = None
+_pool_lock = threading.Lock()
+_local = threading.local()
+_stats_lock = threading.Lock()
+_sqlite_stats = {"connects": 0, "checkouts": 0}
+_scope_stats = {"scopes": 0, "scoped_checkouts": 0}
+
+
+class PooledConnection:
+    """
+    A connection borrowed from the pool. close() hands it back (rolling back
+    anything uncommitted, as closing a fresh connection used to) instead of
+    closing the socket, so existing get_connection()/close() call sites pool
+    transparently.
+    """
+
+    def __init__(self, connection, release):
+        self.raw = connection
+        self._release = release
+
+    def cursor(self):
+        return self.raw.cursor()
+
+    def commit(self):
+        return self.raw.commit()
+
+    def rollback(self):
+        return self.raw.rollback()
+
+    def close(self):
+        if self._release is not None:
+            release, self._release = self._release, None
+            release(self.raw)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
+def database_url():
+    """The PostgreSQL URL from DATABASE_URL, or None in SQLite mode."""
     db_url = os.environ.get("DATABASE_URL")
+    # Fix for Render (sometimes uses postgres://)
+    if db_url and db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    return db_url
+
+
+def _connect_postgres():
+    return psycopg2.connect(database_url(), sslmode="require")
+
+
+def _connect_sqlite():
+    # ✅ ABSOLUTE PATH FIX (CRITICAL)
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    db_path = os.path.join(BASE_DIR, "database.db")
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    with _stats_lock:
+        _sqlite_stats["connects"] += 1
+    return SQLiteConnectionAdapter(conn)
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        # A forked child must not share its parent's sockets: start a fresh pool
+        if _pool is None or _pool.pid != os.getpid():
+            _pool = ConnectionPool(
+                _connect_postgres,
+                min_size=DB_POOL_MIN,
+                max_size=DB_POOL_MAX,
+                timeout=DB_POOL_TIMEOUT_SECONDS,
+                health_check_idle=DB_POOL_HEALTH_CHECK_IDLE_SECONDS,
+            )
+        return _pool
 
-    # ✅ PostgreSQL (Render / Production)
-    if db_url:
-        # Fix for Render (sometimes uses postgres://)
-        if db_url.startswith("postgres://"):
-            db_url = db_url.replace("postgres://", "postgresql://", 1)
 
-        return psycopg2.connect(db_url, sslmode="require")
+def _release_sqlite(conn):
+    # The thread keeps its connection; the last holder ends any open transaction
+    _local.sqlite_holders -= 1
+    if _local.sqlite_holders > 0:
+        return
+    try:
+        conn.rollback()
+    except sqlite3.Error:
+        _local.sqlite = None
 
-    # ⚠️ SQLite (LOCAL ONLY)
-    else:
-        # ✅ ABSOLUTE PATH FIX (CRITICAL)
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(BASE_DIR, "database.db")
 
-        conn = sqlite3.connect(db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
+def _checkout():
+    """Borrow a raw connection and the function that gives it back."""
+    if database_url():
+        pool = _get_pool()
+        return pool.acquire(), pool.release
+
+    conn = getattr(_local, "sqlite", None)
+    if conn is None:
+        conn = _local.sqlite = _connect_sqlite()
+        _local.sqlite_holders = 0
+    # Nested holders on one thread share the connection (and its transaction)
+    _local.sqlite_holders += 1
+    with _stats_lock:
+        _sqlite_stats["checkouts"] += 1
+    return conn, _release_sqlite
+
+
+# -------------------------------
+# 🔥 FIXED DATABASE CONNECTION
+# -------------------------------
+def get_connection():
+    """
+    A pooled connection; close() returns it. Inside connection_scope() the
+    scope's connection is handed out, unless a caller up the stack is still
+    holding it, in which case a second one is borrowed so transactions never mix.
+    """
+    scope = getattr(_local, "scope", None)
+    if scope is not None and not scope["lent"]:
+        if scope["conn"] is None:
+            scope["conn"], scope["release"] = _checkout()
+            with _stats_lock:
+                _scope_stats["scoped_checkouts"] += 1
+        scope["lent"] = True
+
+        def give_back(conn):
+            try:
+                conn.rollback()
+            finally:
+                scope["lent"] = False
+        return PooledConnection(scope["conn"], give_back)
+
+    conn, release = _checkout()
+    return PooledConnection(conn, release)
+
+
+def open_connection_scope():
+    """Start sharing one connection across get_connection() calls on this thread."""
+    scope = getattr(_local, "scope", None)
+    if scope is not None:
+        scope["depth"] += 1
+        return
+    _local.scope = {"conn": None, "release": None, "lent": False, "depth": 1}
+    with _stats_lock:
+        _scope_stats["scopes"] += 1
+
+
+def close_connection_scope():
+    """End the scope opened by open_connection_scope() and return its connection."""
+    scope = getattr(_local, "scope", None)
+    if scope is None:
+        return
+    scope["depth"] -= 1
+    if scope["depth"] > 0:
+        return
+    _local.scope = None
+    if scope["conn"] is not None:
+        scope["release"](scope["conn"])
+
+
+@contextmanager
+def connection_scope():
+    """One connection (checked out lazily, so possibly none) for the enclosed block."""
+    open_connection_scope()
+    try:
+        yield
+    finally:
+        close_connection_scope()
+
+
+@contextmanager
+def db_connection():
+    """
+    with db_connection() as conn: ... commits on success, rolls back on error
+    and returns the connection to the pool either way.
+    """
+    conn = get_connection()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
 
-        return SQLiteConnectionAdapter(conn)
+def get_pool_stats():
+    """Checkout, wait and connect counters of this process's database connections."""
+    if database_url():
+        stats = dict(_get_pool().get_stats(), backend="postgresql")
+    else:
+        with _stats_lock:
+            stats = dict(_sqlite_stats, backend="sqlite")
+    with _stats_lock:
+        stats.update(_scope_stats)
+    return stats
+
+
+def close_pool():
+    """Close idle pooled connections (e.g. at worker shutdown)."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None and pool.pid == os.getpid():
+        pool.close_all()
+    conn = getattr(_local, "sqlite", None)
+    if conn is not None:
+        _local.sqlite = None
+        conn.close()
 
 
 # -------------------------------
@@ -91,78 +312,18 @@ def safe_print(message):
 # INIT DB
 # -------------------------------
 def init_db():
+    """
+    Bring the schema up to date (see migrations.py), check that the blob
+    store is usable (in production: durable) and copy legacy files into it.
+    """
+    get_blob_store()
     conn = get_connection()
-    c = conn.cursor()
-    using_sqlite = _is_sqlite_connection(conn)
-
-    id_col = "INTEGER PRIMARY KEY AUTOINCREMENT" if using_sqlite else "SERIAL PRIMARY KEY"
-    image_col = "BLOB" if using_sqlite else "BYTEA"
-
-    c.execute(f'''CREATE TABLE IF NOT EXISTS users (
-        id {id_col},
-        username VARCHAR(50) UNIQUE NOT NULL,
-        email VARCHAR(100) UNIQUE NOT NULL,
-        password_hash TEXT NOT NULL,
-        full_name VARCHAR(100) NOT NULL,
-        phone VARCHAR(15),
-        city VARCHAR(50),
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )''')
-
-    c.execute(f'''CREATE TABLE IF NOT EXISTS maps (
-        id {id_col},
-        user_id INTEGER NOT NULL,
-        image {image_col} NULL,
-        filename VARCHAR(255),
-        file_type VARCHAR(10),
-        report TEXT,
-        status VARCHAR(20) DEFAULT 'pending',
-        payment_status VARCHAR(20) DEFAULT 'pending',
-        analysis_status VARCHAR(20) DEFAULT 'pending',
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (user_id) REFERENCES users (id)
-    )''')
-
-    c.execute(f'''CREATE TABLE IF NOT EXISTS payments (
-        id {id_col},
-        user_id INTEGER NOT NULL,
-        map_id INTEGER NOT NULL,
-        amount DECIMAL(10,2) DEFAULT 50.00,
-        status VARCHAR(20) DEFAULT 'pending',
-        transaction_id VARCHAR(100),
-        payment_method VARCHAR(50) DEFAULT 'qr_code',
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (user_id) REFERENCES users (id),
-        FOREIGN KEY (map_id) REFERENCES maps (id)
-    )''')
-
-    c.execute(f'''CREATE TABLE IF NOT EXISTS feedback (
-        id {id_col},
-        user_id INTEGER NOT NULL,
-        map_id INTEGER NOT NULL,
-        rule_name TEXT NOT NULL,
-        was_correct BOOLEAN NOT NULL,
-        remark TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (user_id) REFERENCES users(id),
-        FOREIGN KEY (map_id) REFERENCES maps(id)
-    )''')
-
-    c.execute(f'''CREATE TABLE IF NOT EXISTS analysis_jobs (
-        id {id_col},
-        map_id INTEGER NOT NULL,
-        status VARCHAR(20) DEFAULT 'pending',
-        attempts INTEGER DEFAULT 0,
-        last_error TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        started_at TIMESTAMP,
-        finished_at TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (map_id) REFERENCES maps(id)
-    )''')
+    try:
+        apply_migrations(conn, _is_sqlite_connection(conn))
+    finally:
+        conn.close()
 
-    conn.commit()
-    conn.close()
+    backfill_map_blobs()
 
 
 # -------------------------------
@@ -203,17 +364,35 @@ def verify_user(username_or_email, password):
     return None
 
 
+# Accounts allowed on the /admin pages: comma-separated usernames (none by default)
+ADMIN_USERNAMES = {name.strip() for name in os.environ.get("ADMIN_USERNAMES", "").split(",") if name.strip()}
+
+
+def is_admin_user(user_id):
+    """Whether the account is listed in ADMIN_USERNAMES (looked up, not taken from the session)."""
+    if not ADMIN_USERNAMES or user_id is None:
+        return False
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute('SELECT username FROM users WHERE id = %s', (user_id,))
+    row = c.fetchone()
+    conn.close()
+    return bool(row) and row[0] in ADMIN_USERNAMES
+
+
 # -------------------------------
 # MAP FUNCTIONS
 # -------------------------------
 def insert_map(user_id, image_data, filename, file_type):
+    blob_sha256, blob_size = get_blob_store().put(image_data)
+
     conn = get_connection()
     c = conn.cursor()
 
-    c.execute('''INSERT INTO maps (user_id, image, filename, file_type, report, status, payment_status, analysis_status)
-                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    c.execute('''INSERT INTO maps (user_id, blob_sha256, blob_size, filename, file_type, report, status, payment_status, analysis_status)
+                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
                  RETURNING id''',
-              (user_id, image_data, filename, file_type, 'Analysis pending...', 'pending', 'pending', 'pending'))
+              (user_id, blob_sha256, blob_size, filename, file_type, 'Analysis pending...', 'pending', 'pending', 'pending'))
 
     map_id = c.fetchone()[0]
     conn.commit()
@@ -224,6 +403,108 @@ def insert_map(user_id, image_data, filename, file_type):
     return map_id
 
 
+def replace_map_image(map_id, original_sha256, image_data, file_type):
+    """
+    Point a map at the normalized version of its upload and drop the upload
+    from the hot store. The caller has copied it to the originals store
+    (original_ref) first, and a reader that looked the map up before the swap
+    falls back to that copy (get_map_file). The swap only applies while the map
+    still points at original_sha256, and the hot copy stays while another map
+    (an identical upload) points at it. Returns whether the swap applied.
+    """
+    blob_sha256, blob_size = get_blob_store().put(image_data)
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute('''UPDATE maps SET image = NULL, blob_sha256 = %s, blob_size = %s, file_type = %s, original_ref = %s
+                     WHERE id = %s AND blob_sha256 = %s''',
+                  (blob_sha256, blob_size, file_type, original_sha256, map_id, original_sha256))
+        swapped = c.rowcount == 1
+        still_referenced = False
+        if swapped:
+            c.execute('''SELECT 1 FROM maps WHERE blob_sha256 = %s LIMIT 1''', (original_sha256,))
+            still_referenced = c.fetchone() is not None
+
+    if swapped and not still_referenced and get_originals_store().exists(original_sha256):
+        get_blob_store().delete(original_sha256)
+    return swapped
+
+
+def get_map_blob(map_id, user_id=None):
+    """
+    (blob_sha256, blob_size, filename, file_type) of a map without reading the
+    file itself, or None. Restricted to the owner when user_id is given.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    if user_id is None:
+        c.execute('''SELECT blob_sha256, blob_size, filename, file_type FROM maps WHERE id = %s''', (map_id,))
+    else:
+        c.execute('''SELECT blob_sha256, blob_size, filename, file_type FROM maps WHERE id = %s AND user_id = %s''',
+                  (map_id, user_id))
+    row = c.fetchone()
+    conn.close()
+    return row
+
+
+def get_map_file(map_id, user_id=None):
+    """(file bytes, filename, file_type) of a map, read from the blob store, or None."""
+    row = get_map_blob(map_id, user_id)
+    if not row:
+        return None
+    blob_sha256, _, filename, file_type = row
+    if blob_sha256:
+        try:
+            return get_blob_store().read(blob_sha256), filename, file_type
+        except FileNotFoundError:
+            pass
+        try:
+            # Normalized since the row was read: the upload moved to the originals store
+            return get_originals_store().read(blob_sha256), filename, file_type
+        except FileNotFoundError:
+            # Backfilled into a store that did not survive; the column still holds the file
+            safe_print(f"Blob {blob_sha256} of map_id={map_id} missing, reading the legacy image column")
+
+    # Row not yet moved out of the legacy image column
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute('''SELECT image FROM maps WHERE id = %s''', (map_id,))
+    image = c.fetchone()
+    conn.close()
+    if not image or image[0] is None:
+        return None
+    return bytes(image[0]), filename, file_type
+
+
+def backfill_map_blobs():
+    """
+    Copy files still stored in maps.image into the blob store, one row at a
+    time (opt-in with BLOB_BACKFILL). The column is cleared only when the
+    store is durable; otherwise it stays as the copy get_map_file() falls
+    back to once the store's files are gone.
+    """
+    if not config.BLOB_BACKFILL:
+        return
+    store = get_blob_store()
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute('''SELECT id FROM maps WHERE image IS NOT NULL AND blob_sha256 IS NULL''')
+    map_ids = [row[0] for row in c.fetchall()]
+    conn.close()
+
+    for map_id in map_ids:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute('''SELECT image FROM maps WHERE id = %s''', (map_id,))
+            image = c.fetchone()[0]
+            blob_sha256, blob_size = store.put(bytes(image))
+            image_clause = "image = NULL, " if store.durable else ""
+            c.execute(f'''UPDATE maps SET {image_clause}blob_sha256 = %s, blob_size = %s WHERE id = %s''',
+                      (blob_sha256, blob_size, map_id))
+    if map_ids:
+        kept = "" if store.durable else " (kept in maps.image too: the store is not durable)"
+        safe_print(f"Copied {len(map_ids)} map file(s) into the blob store{kept}")
+
+
 def update_map_analysis(map_id, report, status):
     conn = get_connection()
     c = conn.cursor()
@@ -241,31 +522,181 @@ def update_map_analysis(map_id, report, status):
         safe_print(f"✅ Updated map_id: {map_id}")
 
 
-def get_user_maps(user_id):
+HISTORY_PAGE_SIZE = int(os.environ.get("HISTORY_PAGE_SIZE", "25"))
+HISTORY_MAX_PAGE_SIZE = 100
+
+
+def encode_history_cursor(created_at, map_id):
+    """Opaque cursor pointing just past the (created_at, id) of a history row."""
+    raw = json.dumps([str(created_at), map_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_history_cursor(cursor):
+    """(created_at, id) of an encode_history_cursor() value; ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, map_id = json.loads(raw)
+        return str(created_at), int(map_id)
+    except Exception:
+        raise ValueError(f"Invalid history cursor: {cursor!r}")
+
+
+def get_user_maps_page(user_id, limit=None, cursor=None, status=None):
+    """
+    One page of a user's maps, newest first, as summary rows
+    (id, status, payment_status, analysis_status, created_at, filename) and
+    the cursor of the next page (None on the last page). Keyset pagination on
+    (created_at, id) walks idx_maps_user_created, so a page costs the same
+    however long the history; reports are fetched per map by get_map_report().
+    """
+    limit = max(1, min(limit or HISTORY_PAGE_SIZE, HISTORY_MAX_PAGE_SIZE))
+    conditions = ['user_id = %s']
+    params = [user_id]
+    if status:
+        conditions.append('status = %s')
+        params.append(status)
+    if cursor:
+        created_at, map_id = decode_history_cursor(cursor)
+        conditions.append('(created_at < %s OR (created_at = %s AND id < %s))')
+        params += [created_at, created_at, map_id]
+
     conn = get_connection()
     c = conn.cursor()
+    c.execute(f'''SELECT id, status, payment_status, analysis_status, created_at, filename
+                  FROM maps WHERE {' AND '.join(conditions)}
+                  ORDER BY created_at DESC, id DESC
+                  LIMIT %s''',
+              (*params, limit + 1))
+    rows = c.fetchall()
+    conn.close()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_history_cursor(rows[-1][4], rows[-1][0])
+    return rows, next_cursor
 
-    c.execute('''SELECT id, status, payment_status, analysis_status, created_at, report, filename
-                 FROM maps WHERE user_id = %s ORDER BY created_at DESC''',
-              (user_id,))
 
-    maps = c.fetchall()
+def get_map_report(map_id, user_id):
+    """(report, status, filename) of one of the user's maps, or None."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute('''SELECT report, status, filename FROM maps WHERE id = %s AND user_id = %s''', (map_id, user_id))
+    row = c.fetchone()
     conn.close()
-    return maps
+    return row
 
 
 # -------------------------------
 # ANALYSIS JOB QUEUE FUNCTIONS
 # -------------------------------
 def set_map_analysis_status(map_id, analysis_status):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute('''UPDATE maps SET analysis_status = %s WHERE id = %s''', (analysis_status, map_id))
-    conn.commit()
-    conn.close()
+    with db_connection() as conn:
+        conn.cursor().execute('''UPDATE maps SET analysis_status = %s WHERE id = %s''', (analysis_status, map_id))
 
-
-def enqueue_analysis_job(map_id):
+
+# The web tier stops queueing new analyses (HTTP 503 with Retry-After) at this many pending jobs
+ANALYSIS_QUEUE_MAX_DEPTH = int(os.environ.get("ANALYSIS_QUEUE_MAX_DEPTH", "100"))
+ANALYSIS_QUEUE_RETRY_AFTER_SECONDS = int(os.environ.get("ANALYSIS_QUEUE_RETRY_AFTER_SECONDS", "30"))
+
+# Jobs are claimed in schedule_key order. A job's key is its enqueue time
+# plus (the user's active jobs + 1) * ANALYSIS_FAIR_SHARE_SECONDS / lane
+# weight, so one user's backlog is spread out behind other users' first
+# jobs, and faster lanes move ahead. A user runs at most
+# ANALYSIS_USER_MAX_RUNNING jobs at once.
+ANALYSIS_LANE_WEIGHTS = {"express": 4, "interactive": 2, "batch": 1}
+ANALYSIS_FAIR_SHARE_SECONDS = int(os.environ.get("ANALYSIS_FAIR_SHARE_SECONDS", "60"))
+ANALYSIS_USER_MAX_RUNNING = int(os.environ.get("ANALYSIS_USER_MAX_RUNNING", "2"))
+# Due jobs examined per claimed job when skipping users at their cap
+CLAIM_SCAN_FACTOR = 4
+
+# A claimed job is leased to one worker for ANALYSIS_LEASE_SECONDS and kept
+# alive by heartbeats; a job whose lease runs out (the worker died) is
+# requeued, or dead-lettered once it has used ANALYSIS_MAX_ATTEMPTS attempts.
+ANALYSIS_LEASE_SECONDS = int(os.environ.get("ANALYSIS_LEASE_SECONDS", "120"))
+ANALYSIS_MAX_ATTEMPTS = int(os.environ.get("ANALYSIS_MAX_ATTEMPTS", "3"))
+# Transient failures are retried after ANALYSIS_RETRY_BASE_SECONDS * 2^(attempt-1),
+# capped at ANALYSIS_RETRY_MAX_SECONDS; jobs out of attempts go to 'dead'.
+ANALYSIS_RETRY_BASE_SECONDS = int(os.environ.get("ANALYSIS_RETRY_BASE_SECONDS", "30"))
+ANALYSIS_RETRY_MAX_SECONDS = int(os.environ.get("ANALYSIS_RETRY_MAX_SECONDS", "900"))
+DEAD_LETTER_PAGE_SIZE = 100
+
+
+jobs_enqueued = REGISTRY.counter("analysis_jobs_enqueued_total", "Analysis jobs queued, by lane", ("lane",))
+queue_rejections = REGISTRY.counter("analysis_queue_rejections_total", "Enqueues refused at ANALYSIS_QUEUE_MAX_DEPTH")
+job_outcomes = REGISTRY.counter(
+    "analysis_job_attempts_total",
+    "Finished analysis attempts: completed, failed, retried, dead, lease_expired, lease_lost", ("outcome",))
+job_stage_seconds = REGISTRY.histogram(
+    "analysis_job_stage_seconds",
+    "Job timings: queued (enqueue to start of an attempt), running (start to finish), total (enqueue to finish)",
+    ("stage",))
+
+
+def lease_owner_id():
+    """Identifies this process as the holder of a job lease."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _timestamp_after(using_sqlite, seconds):
+    """SQL expression (and its parameter) for the current time plus `seconds`."""
+    if using_sqlite:
+        return "datetime('now', %s)", f"{seconds:+d} seconds"
+    return "CURRENT_TIMESTAMP + %s * INTERVAL '1 second'", seconds
+
+
+def retry_delay_seconds(attempts):
+    """Backoff before attempt `attempts + 1`, with up to 20% jitter so retries of one outage spread out."""
+    delay = min(ANALYSIS_RETRY_MAX_SECONDS, ANALYSIS_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1))
+    return int(delay * random.uniform(0.8, 1.0))
+
+
+def _seconds_since(using_sqlite, timestamp_sql):
+    """SQL expression: seconds from `timestamp_sql` to now."""
+    if using_sqlite:
+        return f"(julianday('now') - julianday({timestamp_sql})) * 86400.0"
+    return f"EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - {timestamp_sql}))"
+
+
+def _announce_jobs(c, using_sqlite, job_ids):
+    """
+    PostgreSQL: announce jobs that became pending, or that ended and so make
+    room for jobs held back by the per-user cap; delivered when the
+    transaction commits. SQLite callers send notify_local_workers() after it.
+    """
+    if not using_sqlite:
+        for job_id in job_ids:
+            c.execute('SELECT pg_notify(%s, %s)', (JOB_CHANNEL, str(job_id)))
+
+
+class AnalysisQueueFull(RuntimeError):
+    """The analysis queue is at ANALYSIS_QUEUE_MAX_DEPTH pending jobs."""
+
+    def __init__(self, depth):
+        super().__init__(f"Analysis queue full: {depth} job(s) pending")
+        self.depth = depth
+
+
+def _pending_job_count(c):
+    c.execute("SELECT COUNT(*) FROM analysis_jobs WHERE status = 'pending'")
+    return c.fetchone()[0]
+
+
+def get_analysis_queue_depth():
+    with db_connection() as conn:
+        return _pending_job_count(conn.cursor())
+
+
+def enqueue_analysis_job(map_id, max_depth=None, lane='interactive'):
+    """
+    Queue an analysis of the map in `lane` (a key of ANALYSIS_LANE_WEIGHTS)
+    and return the job id; a map that already has an active job gets that
+    job's id. With `max_depth`, a new job is refused with AnalysisQueueFull
+    while that many jobs are pending.
+    """
+    if lane not in ANALYSIS_LANE_WEIGHTS:
+        raise ValueError(f"Unknown analysis lane: {lane!r}")
     conn = get_connection()
     c = conn.cursor()
 
@@ -283,11 +714,29 @@ def enqueue_analysis_job(map_id):
             conn.commit()
             return existing_job[0]
 
+        if max_depth:
+            depth = _pending_job_count(c)
+            if depth >= max_depth:
+                conn.commit()
+                queue_rejections.inc()
+                raise AnalysisQueueFull(depth)
+
+        using_sqlite = _is_sqlite_connection(conn)
+        c.execute('SELECT user_id FROM maps WHERE id = %s', (map_id,))
+        user_id = c.fetchone()[0]
         c.execute('''
-            INSERT INTO analysis_jobs (map_id, status, attempts, updated_at)
-            VALUES (%s, 'pending', 0, CURRENT_TIMESTAMP)
+            SELECT COUNT(*) FROM analysis_jobs
+            WHERE user_id = %s AND status IN ('pending', 'processing')
+        ''', (user_id,))
+        user_backlog = c.fetchone()[0]
+        key_sql, key_param = _timestamp_after(
+            using_sqlite, round((user_backlog + 1) * ANALYSIS_FAIR_SHARE_SECONDS / ANALYSIS_LANE_WEIGHTS[lane]))
+
+        c.execute(f'''
+            INSERT INTO analysis_jobs (map_id, user_id, lane, schedule_key, status, attempts, updated_at)
+            VALUES (%s, %s, %s, {key_sql}, 'pending', 0, CURRENT_TIMESTAMP)
             RETURNING id
-        ''', (map_id,))
+        ''', (map_id, user_id, lane, key_param))
         job_id = c.fetchone()[0]
 
         c.execute('''
@@ -296,7 +745,12 @@ def enqueue_analysis_job(map_id):
             WHERE id = %s
         ''', (map_id,))
 
+        # Delivered to LISTENing workers when this transaction commits
+        _announce_jobs(c, using_sqlite, [job_id])
         conn.commit()
+        jobs_enqueued.inc(lane=lane)
+        if using_sqlite:
+            notify_local_workers(job_id)
         return job_id
     except Exception:
         conn.rollback()
@@ -305,61 +759,84 @@ def enqueue_analysis_job(map_id):
         conn.close()
 
 
-def claim_next_analysis_job():
+def claim_analysis_jobs(limit=1, owner=None):
+    """
+    Claim up to `limit` due jobs (run_after passed) in schedule_key order,
+    skipping users already running ANALYSIS_USER_MAX_RUNNING jobs, and lease
+    them to `owner` (this process by default). One statement: the first
+    `limit * CLAIM_SCAN_FACTOR` due jobs of users below the cap come off
+    idx_analysis_jobs_schedule (the running count per user is read from
+    idx_analysis_jobs_user_active), so a bulk backlog of a user at the cap
+    cannot fill the window; a window then ranks each user's jobs among them
+    and the cap filters the ranks. Returns [(job_id, map_id), ...]. On PostgreSQL, FOR UPDATE
+    SKIP LOCKED lets concurrent workers claim disjoint batches (the cap can
+    then be overshot by one job per racing worker); on SQLite the single
+    UPDATE is atomic on its own.
+    """
+    owner = owner or lease_owner_id()
     conn = get_connection()
     c = conn.cursor()
 
+    ranked_jobs = '''
+        ranked AS (
+            SELECT candidates.id, candidates.schedule_key,
+                   ROW_NUMBER() OVER (PARTITION BY candidates.user_id ORDER BY candidates.schedule_key, candidates.id) AS user_rank,
+                   -- the IN list matches the partial idx_analysis_jobs_user_active
+                   (SELECT COUNT(*) FROM analysis_jobs running
+                    WHERE running.user_id = candidates.user_id
+                      AND running.status IN ('pending', 'processing') AND running.status = 'processing') AS user_running
+            FROM candidates
+        ),
+        next_jobs AS (
+            SELECT id FROM ranked
+            WHERE user_running + user_rank <= %s
+            ORDER BY schedule_key, id
+            LIMIT %s
+        )
+    '''
+    candidates = '''
+        candidates AS (
+            SELECT id, user_id, schedule_key
+            FROM analysis_jobs queued
+            WHERE status = 'pending' AND (run_after IS NULL OR run_after <= CURRENT_TIMESTAMP)
+              AND (SELECT COUNT(*) FROM analysis_jobs running
+                   WHERE running.user_id = queued.user_id
+                     AND running.status IN ('pending', 'processing') AND running.status = 'processing') < %s
+            ORDER BY schedule_key, id
+            LIMIT %s
+            {lock}
+        ),
+    '''
     try:
-        if _is_sqlite_connection(conn):
-            c.execute('''
-                SELECT id, map_id
-                FROM analysis_jobs
-                WHERE status = 'pending'
-                ORDER BY created_at ASC
-                LIMIT 1
-            ''')
-            next_job = c.fetchone()
-
-            if not next_job:
-                conn.commit()
-                return None
-
-            job_id, map_id = next_job
-            c.execute('''
+        using_sqlite = _is_sqlite_connection(conn)
+        lease_sql, lease_param = _timestamp_after(using_sqlite, ANALYSIS_LEASE_SECONDS)
+        ranking_params = (ANALYSIS_USER_MAX_RUNNING, limit * CLAIM_SCAN_FACTOR, ANALYSIS_USER_MAX_RUNNING, limit)
+        if using_sqlite:
+            c.execute(f'''
                 UPDATE analysis_jobs
-                SET status = 'processing', attempts = attempts + 1, started_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s AND status = 'pending'
-            ''', (job_id,))
-
-            if c.rowcount == 0:
-                conn.commit()
-                return None
-
-            conn.commit()
-            return job_id, map_id
-
-        c.execute('''
-            WITH next_job AS (
-                SELECT id, map_id
-                FROM analysis_jobs
-                WHERE status = 'pending'
-                ORDER BY created_at ASC
-                FOR UPDATE SKIP LOCKED
-                LIMIT 1
-            )
-            UPDATE analysis_jobs AS aj
-            SET status = 'processing', attempts = aj.attempts + 1, started_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-            FROM next_job
-            WHERE aj.id = next_job.id
-            RETURNING aj.id, aj.map_id
-        ''')
-        claimed_job = c.fetchone()
+                SET status = 'processing', attempts = attempts + 1, started_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP,
+                    lease_owner = %s, lease_expires_at = {lease_sql}
+                WHERE status = 'pending' AND id IN (
+                    WITH {candidates.format(lock="")} {ranked_jobs}
+                    SELECT id FROM next_jobs
+                )
+                RETURNING id, map_id, {_seconds_since(using_sqlite, 'created_at')}
+            ''', (owner, lease_param, *ranking_params))
+        else:
+            c.execute(f'''
+                WITH {candidates.format(lock="FOR UPDATE SKIP LOCKED")} {ranked_jobs}
+                UPDATE analysis_jobs AS aj
+                SET status = 'processing', attempts = aj.attempts + 1, started_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP,
+                    lease_owner = %s, lease_expires_at = {lease_sql}
+                FROM next_jobs
+                WHERE aj.id = next_jobs.id
+                RETURNING aj.id, aj.map_id, {_seconds_since(using_sqlite, 'aj.created_at')}
+            ''', (*ranking_params, owner, lease_param))
+        rows = c.fetchall()
         conn.commit()
-
-        if not claimed_job:
-            return None
-
-        return claimed_job[0], claimed_job[1]
+        for row in rows:
+            job_stage_seconds.observe(float(row[2]), stage="queued")
+        return sorted((row[0], row[1]) for row in rows)
     except Exception:
         conn.rollback()
         raise
@@ -367,29 +844,292 @@ def claim_next_analysis_job():
         conn.close()
 
 
-def mark_analysis_job_completed(job_id):
-    conn = get_connection()
-    c = conn.cursor()
-    try:
-        c.execute('''
+def claim_next_analysis_job():
+    claimed_jobs = claim_analysis_jobs(1)
+    return claimed_jobs[0] if claimed_jobs else None
+
+
+def renew_analysis_job_leases(job_ids, owner=None):
+    """Heartbeat: extend the leases `owner` holds on job_ids; return the ids still held."""
+    if not job_ids:
+        return set()
+    owner = owner or lease_owner_id()
+    with db_connection() as conn:
+        c = conn.cursor()
+        lease_sql, lease_param = _timestamp_after(_is_sqlite_connection(conn), ANALYSIS_LEASE_SECONDS)
+        placeholders = ", ".join(["%s"] * len(job_ids))
+        c.execute(f'''
             UPDATE analysis_jobs
-            SET status = 'completed', finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP, last_error = NULL
+            SET lease_expires_at = {lease_sql}, updated_at = CURRENT_TIMESTAMP
+            WHERE id IN ({placeholders}) AND status = 'processing' AND lease_owner = %s
+            RETURNING id
+        ''', (lease_param, *job_ids, owner))
+        return {row[0] for row in c.fetchall()}
+
+
+def requeue_expired_analysis_jobs():
+    """
+    Reaper: jobs whose lease ran out (their worker died or hung) go back to
+    pending, or to the dead letters once they have used ANALYSIS_MAX_ATTEMPTS
+    attempts.
+    Rows claimed before leases existed count as expired a lease period after
+    they started. Returns [(job_id, map_id, new_status), ...].
+    """
+    with db_connection() as conn:
+        c = conn.cursor()
+        using_sqlite = _is_sqlite_connection(conn)
+        started_before_sql, started_before = _timestamp_after(using_sqlite, -ANALYSIS_LEASE_SECONDS)
+        c.execute(f'''
+            UPDATE analysis_jobs
+            SET status = CASE WHEN attempts >= %s THEN 'dead' ELSE 'pending' END,
+                finished_at = CASE WHEN attempts >= %s THEN CURRENT_TIMESTAMP ELSE NULL END,
+                last_error = 'Lease expired: the worker stopped sending heartbeats',
+                lease_owner = NULL, lease_expires_at = NULL, run_after = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE status = 'processing'
+              AND (lease_expires_at < CURRENT_TIMESTAMP
+                   OR (lease_expires_at IS NULL AND started_at < {started_before_sql}))
+            RETURNING id, map_id, status
+        ''', (ANALYSIS_MAX_ATTEMPTS, ANALYSIS_MAX_ATTEMPTS, started_before))
+        reaped = [(row[0], row[1], row[2]) for row in c.fetchall()]
+
+        for job_id, map_id, status in reaped:
+            if status == 'pending':
+                c.execute('''UPDATE maps SET analysis_status = 'pending' WHERE id = %s''', (map_id,))
+            else:
+                c.execute('''UPDATE maps SET analysis_status = 'completed', status = 'error', report = %s WHERE id = %s''',
+                          ("Analysis Error: the analysis was interrupted too many times\n"
+                           "Please try uploading again or contact support.", map_id))
+        requeued = [job_id for job_id, _, status in reaped if status == 'pending']
+        _announce_jobs(c, using_sqlite, requeued)
+
+    if requeued and using_sqlite:
+        for job_id in requeued:
+            notify_local_workers(job_id)
+    for job_id, map_id, status in reaped:
+        job_outcomes.inc(outcome='lease_expired')
+        safe_print(f"[Lease] job_id={job_id} map_id={map_id} lease expired -> {status}")
+    return reaped
+
+
+def _finish_analysis_job(job_id, status, error_message, owner):
+    """Close a job; with `owner`, only while that owner still holds its lease. Returns True if applied."""
+    with db_connection() as conn:
+        c = conn.cursor()
+        query = '''
+            UPDATE analysis_jobs
+            SET status = %s, finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP, last_error = %s,
+                lease_owner = NULL, lease_expires_at = NULL
             WHERE id = %s
-        ''', (job_id,))
-        conn.commit()
-    finally:
-        conn.close()
+        '''
+        params = [status, error_message, job_id]
+        if owner:
+            query += " AND status = 'processing' AND lease_owner = %s"
+            params.append(owner)
+        using_sqlite = _is_sqlite_connection(conn)
+        query += f" RETURNING {_seconds_since(using_sqlite, 'started_at')}, {_seconds_since(using_sqlite, 'created_at')}"
+        c.execute(query, params)
+        timings = c.fetchone()
+        if timings:
+            # A slot and the user's running share are free again: let workers claim held-back jobs now
+            _announce_jobs(c, using_sqlite, [job_id])
+    if timings and using_sqlite:
+        notify_local_workers(job_id)
+    if not timings:
+        job_outcomes.inc(outcome="lease_lost")
+        safe_print(f"[Lease] job_id={job_id}: lease lost, {status} result not recorded on the job")
+        return False
+    job_outcomes.inc(outcome=status)
+    if timings[0] is not None:
+        job_stage_seconds.observe(float(timings[0]), stage="running")
+    job_stage_seconds.observe(float(timings[1]), stage="total")
+    return True
+
+
+def mark_analysis_job_completed(job_id, owner=None):
+    return _finish_analysis_job(job_id, 'completed', None, owner)
+
+
+def mark_analysis_job_failed(job_id, error_message, owner=None):
+    return _finish_analysis_job(job_id, 'failed', error_message, owner)
+
+
+def retry_analysis_job(job_id, error_message, owner=None):
+    """
+    Record a transient failure: the job goes back to pending with run_after
+    pushed out by retry_delay_seconds(), or to 'dead' once it has used
+    ANALYSIS_MAX_ATTEMPTS attempts. Returns the new status, or None when
+    `owner` no longer holds the job's lease.
+    """
+    with db_connection() as conn:
+        c = conn.cursor()
+        using_sqlite = _is_sqlite_connection(conn)
+        owner_clause = " AND status = 'processing' AND lease_owner = %s" if owner else ""
+        owner_params = (owner,) if owner else ()
+        c.execute(f'SELECT map_id, attempts FROM analysis_jobs WHERE id = %s{owner_clause}', (job_id, *owner_params))
+        job = c.fetchone()
+        if not job:
+            safe_print(f"[Lease] job_id={job_id}: lease lost, retry not scheduled")
+            return None
+        map_id, attempts = job
+
+        if attempts >= ANALYSIS_MAX_ATTEMPTS:
+            c.execute('''
+                UPDATE analysis_jobs
+                SET status = 'dead', finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP, last_error = %s,
+                    lease_owner = NULL, lease_expires_at = NULL, run_after = NULL
+                WHERE id = %s
+            ''', (error_message, job_id))
+            c.execute('''UPDATE maps SET analysis_status = 'completed', status = 'error', report = %s WHERE id = %s''',
+                      (f"Analysis Error: {error_message}\nPlease try again later or contact support.", map_id))
+            new_status = 'dead'
+        else:
+            delay = retry_delay_seconds(attempts)
+            run_after_sql, run_after_param = _timestamp_after(using_sqlite, delay)
+            c.execute(f'''
+                UPDATE analysis_jobs
+                SET status = 'pending', run_after = {run_after_sql}, updated_at = CURRENT_TIMESTAMP, last_error = %s,
+                    lease_owner = NULL, lease_expires_at = NULL
+                WHERE id = %s
+            ''', (run_after_param, error_message, job_id))
+            c.execute('''UPDATE maps SET analysis_status = 'pending' WHERE id = %s''', (map_id,))
+            new_status = 'pending'
+        # The job no longer counts against its user's running cap: the user's next job may be claimable now
+        _announce_jobs(c, using_sqlite, [job_id])
+    if using_sqlite:
+        notify_local_workers(job_id)
+
+    if new_status == 'dead':
+        job_outcomes.inc(outcome='dead')
+        safe_print(f"[Retry] job_id={job_id} map_id={map_id} dead after {attempts} attempt(s): {error_message}")
+    else:
+        job_outcomes.inc(outcome='retried')
+        safe_print(f"[Retry] job_id={job_id} map_id={map_id} attempt {attempts} failed, retrying in {delay}s: {error_message}")
+    return new_status
 
 
-def mark_analysis_job_failed(job_id, error_message):
-    conn = get_connection()
-    c = conn.cursor()
-    try:
+def get_dead_analysis_jobs(status='dead', limit=DEAD_LETTER_PAGE_SIZE):
+    """Most recently failed jobs of `status` ('dead' or 'failed') for the admin page."""
+    if status not in ('dead', 'failed'):
+        raise ValueError(f"Not a terminal job status: {status!r}")
+    with db_connection() as conn:
+        c = conn.cursor()
         c.execute('''
+            SELECT aj.id, aj.map_id, m.user_id, m.filename, aj.attempts, aj.last_error, aj.created_at, aj.updated_at
+            FROM analysis_jobs aj
+            JOIN maps m ON m.id = aj.map_id
+            -- the literal IN list lets the planner use the partial idx_analysis_jobs_dead
+            WHERE aj.status IN ('dead', 'failed') AND aj.status = %s
+            ORDER BY aj.updated_at DESC, aj.id DESC
+            LIMIT %s
+        ''', (status, limit))
+        return c.fetchall()
+
+
+def requeue_analysis_jobs(job_ids):
+    """
+    Put dead or failed jobs back in the batch lane with a fresh attempt
+    budget. Jobs whose map already has an active job are skipped. Returns the ids
+    requeued.
+    """
+    if not job_ids:
+        return []
+    with db_connection() as conn:
+        c = conn.cursor()
+        using_sqlite = _is_sqlite_connection(conn)
+        placeholders = ", ".join(["%s"] * len(job_ids))
+        # Requeued in bulk, so behind interactive work
+        key_sql, key_param = _timestamp_after(
+            using_sqlite, round(ANALYSIS_FAIR_SHARE_SECONDS / ANALYSIS_LANE_WEIGHTS['batch']))
+        c.execute(f'''
             UPDATE analysis_jobs
-            SET status = 'failed', finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP, last_error = %s
-            WHERE id = %s
-        ''', (error_message, job_id))
-        conn.commit()
-    finally:
-        conn.close()
+            SET status = 'pending', attempts = 0, run_after = NULL, finished_at = NULL, started_at = NULL,
+                lane = 'batch', schedule_key = {key_sql}, updated_at = CURRENT_TIMESTAMP
+            WHERE id IN ({placeholders}) AND status IN ('dead', 'failed')
+              AND NOT EXISTS (
+                  SELECT 1 FROM analysis_jobs active
+                  WHERE active.map_id = analysis_jobs.map_id AND active.status IN ('pending', 'processing')
+              )
+            RETURNING id, map_id
+        ''', (key_param, *job_ids))
+        requeued = [(row[0], row[1]) for row in c.fetchall()]
+        for _, map_id in requeued:
+            c.execute('''
+                UPDATE maps
+                SET analysis_status = 'pending', status = 'pending', report = 'Analysis pending...'
+                WHERE id = %s
+            ''', (map_id,))
+        _announce_jobs(c, using_sqlite, [job_id for job_id, _ in requeued])
+    if using_sqlite:
+        for job_id, _ in requeued:
+            notify_local_workers(job_id)
+    return [job_id for job_id, _ in requeued]
+
+
+# -------------------------------
+# Metrics gauges, computed per scrape
+# -------------------------------
+QUEUE_RECENT_WINDOW_SECONDS = 300
+
+queue_jobs = REGISTRY.gauge("analysis_queue_jobs", "Analysis jobs by status (pending, processing, dead, failed)", ("status",))
+queue_oldest_pending = REGISTRY.gauge("analysis_queue_oldest_pending_seconds", "Age of the oldest pending analysis job")
+jobs_finished_recent = REGISTRY.gauge(
+    "analysis_jobs_finished_recent", f"Jobs finished in the last {QUEUE_RECENT_WINDOW_SECONDS}s, by status", ("status",))
+pool_connections = REGISTRY.gauge("db_pool_connections", "Open database connections by state", ("state",))
+# Running totals kept by the pool, mirrored at scrape time
+pool_totals = REGISTRY.gauge(
+    "db_pool_events", "Database pool connects, checkouts, waits and timeouts of this process so far", ("event",))
+pool_wait_seconds = REGISTRY.gauge("db_pool_wait_seconds", "Time spent waiting for a pooled connection so far")
+
+
+def get_queue_metrics():
+    """Queue gauges from analysis_jobs; each query is served by a partial or finished_at index."""
+    with db_connection() as conn:
+        c = conn.cursor()
+        using_sqlite = _is_sqlite_connection(conn)
+        c.execute(f'''
+            SELECT COUNT(*), {_seconds_since(using_sqlite, 'MIN(created_at)')}
+            FROM analysis_jobs WHERE status = 'pending'
+        ''')
+        pending, oldest = c.fetchone()
+        c.execute("SELECT COUNT(*) FROM analysis_jobs WHERE status = 'processing'")
+        processing = c.fetchone()[0]
+        c.execute("SELECT status, COUNT(*) FROM analysis_jobs WHERE status IN ('dead', 'failed') GROUP BY status")
+        terminal = dict(c.fetchall())
+        since_sql, since_param = _timestamp_after(using_sqlite, -QUEUE_RECENT_WINDOW_SECONDS)
+        c.execute(f'''
+            SELECT status, COUNT(*) FROM analysis_jobs
+            WHERE finished_at >= {since_sql}
+            GROUP BY status
+        ''', (since_param,))
+        recent = dict(c.fetchall())
+    return {
+        "pending": pending,
+        "processing": processing,
+        "dead": terminal.get("dead", 0),
+        "failed": terminal.get("failed", 0),
+        "oldest_pending_seconds": float(oldest or 0),
+        "finished_recent": recent,
+    }
+
+
+def _collect_database_metrics():
+    queue = get_queue_metrics()
+    for status in ("pending", "processing", "dead", "failed"):
+        queue_jobs.set(queue[status], status=status)
+    queue_oldest_pending.set(queue["oldest_pending_seconds"])
+    for status in ("completed", "failed", "dead"):
+        jobs_finished_recent.set(queue["finished_recent"].get(status, 0), status=status)
+
+    pool = get_pool_stats()
+    for event in ("connects", "checkouts", "waits", "timeouts", "health_check_failures", "discarded"):
+        if event in pool:
+            pool_totals.set(pool[event], event=event)
+    if "wait_seconds" in pool:
+        pool_wait_seconds.set(pool["wait_seconds"])
+    if "size" in pool:
+        pool_connections.set(pool["idle"], state="idle")
+        pool_connections.set(pool["in_use"], state="in_use")
+        pool_connections.set(pool["max_size"], state="max")
+
+
+REGISTRY.register_collector(_collect_database_metrics)
@@ -0,0 +1,161 @@
+"""
+Thread-safe database connection pool.
+
+Opening a PostgreSQL connection costs a TCP and TLS handshake plus backend
+start-up, which used to be paid by every helper in database.py. The pool keeps
+between `min_size` and `max_size` connections open, hands them out one thread
+at a time, checks a connection that has sat idle before giving it out again,
+and blocks (up to `timeout` seconds) when every connection is in use.
+Checkout counts and wait times are kept for get_stats().
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(RuntimeError):
+    """No connection became free within the pool's checkout timeout."""
+
+
+class ConnectionPool:
+    """Bounded pool of DB-API connections made by `factory`."""
+
+    def __init__(self, factory, min_size=1, max_size=10, timeout=30.0, health_check_idle=30.0):
+        self.factory = factory
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.timeout = timeout
+        # Connections idle longer than this get a "SELECT 1" before checkout
+        self.health_check_idle = health_check_idle
+        self.pid = os.getpid()
+        self._cond = threading.Condition()
+        self._idle = deque()        # (connection, returned_at), most recent last
+        self._size = 0              # open connections, idle or checked out
+        self._stats = {
+            "connects": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "timeouts": 0,
+            "health_check_failures": 0,
+            "discarded": 0,
+        }
+        for _ in range(self.min_size):
+            self._idle.append((self._connect(), time.monotonic()))
+            self._size += 1
+
+    def _connect(self):
+        conn = self.factory()
+        self._stats["connects"] += 1
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn):
+        if getattr(conn, "closed", 0):
+            return False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """Check out a healthy connection, opening one if the pool is below max_size."""
+        started = time.monotonic()
+        waited = False
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn, returned_at = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    conn, returned_at = None, None
+                    self._size += 1
+                    break
+                remaining = self.timeout - (time.monotonic() - started) if self.timeout else None
+                if remaining is not None and remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeout(f"No database connection free within {self.timeout}s ({self.max_size} in use)")
+                waited = True
+                self._cond.wait(remaining)
+
+            wait_seconds = time.monotonic() - started
+            self._stats["checkouts"] += 1
+            if waited:
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += wait_seconds
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait_seconds)
+
+        # Connecting and health checks happen outside the lock
+        try:
+            if conn is not None and time.monotonic() - returned_at > self.health_check_idle and not self._is_healthy(conn):
+                with self._cond:
+                    self._stats["health_check_failures"] += 1
+                self._close_quietly(conn)
+                conn = None
+            if conn is None:
+                conn = self.factory()
+                with self._cond:
+                    self._stats["connects"] += 1
+            return conn
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn, discard=False):
+        """
+        Return a connection. Any transaction left open is rolled back so the
+        next user starts clean; a connection that cannot roll back is closed.
+        """
+        if not discard:
+            try:
+                if getattr(conn, "closed", 0):
+                    discard = True
+                else:
+                    conn.rollback()
+            except Exception:
+                discard = True
+        with self._cond:
+            if discard:
+                self._size -= 1
+                self._stats["discarded"] += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+        if discard:
+            self._close_quietly(conn)
+
+    def close_all(self):
+        """Close idle connections; checked-out ones are closed when released."""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def get_stats(self):
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+            })
+        return stats
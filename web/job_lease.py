@@ -0,0 +1,109 @@
+"""
+Heartbeats for leased analysis jobs.
+
+A claimed job carries `lease_expires_at`; while it runs, a LeaseKeeper thread
+in the same process pushes the expiry forward every quarter lease. If the
+process dies the heartbeats stop, the lease runs out, and the reaper
+(requeue_expired_analysis_jobs, also run by every LeaseKeeper) puts the job
+back in the queue — so a crash delays a job by at most about one lease
+period instead of stranding it in 'processing'.
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+
+try:
+    from .database import (
+        ANALYSIS_LEASE_SECONDS,
+        lease_owner_id,
+        renew_analysis_job_leases,
+        requeue_expired_analysis_jobs,
+        safe_print,
+    )
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from database import (
+        ANALYSIS_LEASE_SECONDS,
+        lease_owner_id,
+        renew_analysis_job_leases,
+        requeue_expired_analysis_jobs,
+        safe_print,
+    )
+
+
+class LeaseKeeper:
+    """Renews the leases of this process's running jobs and reaps expired ones."""
+
+    def __init__(self, owner=None, interval=None):
+        self._owner = owner
+        self.interval = interval or max(1.0, ANALYSIS_LEASE_SECONDS / 4.0)
+        self._lock = threading.Lock()
+        self._held = set()
+        self._thread = None
+        self.renewals = 0
+        self.lost = 0
+        self.reaped = 0
+
+    @property
+    def owner(self):
+        # Resolved per call so a keeper created before a fork (gunicorn --preload) names the child
+        return self._owner or lease_owner_id()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="lease-keeper", daemon=True)
+                self._thread.start()
+
+    def add(self, job_id):
+        with self._lock:
+            self._held.add(job_id)
+        self.start()
+
+    def discard(self, job_id):
+        with self._lock:
+            self._held.discard(job_id)
+
+    def confirm(self, job_id):
+        """Renew one lease now; False if it was lost, in which case the job's result must not be written."""
+        if job_id in renew_analysis_job_leases([job_id], self.owner):
+            return True
+        self.discard(job_id)
+        safe_print(f"[Lease] job_id={job_id}: lease lost; discarding its result")
+        return False
+
+    def heartbeat(self):
+        with self._lock:
+            held = set(self._held)
+        if held:
+            renewed = renew_analysis_job_leases(sorted(held), self.owner)
+            lost = held - renewed
+            with self._lock:
+                self.renewals += len(renewed)
+                self.lost += len(lost)
+                self._held -= lost
+            for job_id in sorted(lost):
+                safe_print(f"[Lease] job_id={job_id}: lease lost; its result will be discarded")
+        self.reaped += len(requeue_expired_analysis_jobs())
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.heartbeat()
+            except Exception as exc:
+                # A missed heartbeat is covered by the lease; keep trying
+                traceback.print_exc()
+                safe_print(f"[Lease] Heartbeat failed: {str(exc)}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "held": len(self._held),
+                "renewals": self.renewals,
+                "lost": self.lost,
+                "reaped": self.reaped,
+            }
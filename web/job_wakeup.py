@@ -0,0 +1,143 @@
+"""
+Push wakeups for the analysis worker.
+
+enqueue_analysis_job() announces every new job: on PostgreSQL with
+pg_notify() on the JOB_CHANNEL channel (delivered when the enqueue commits),
+on SQLite with a UDP datagram to JOB_WAKEUP_PORT on localhost. The worker
+blocks in JobWakeup.wait() on a LISTEN connection or the bound socket and
+claims as soon as something arrives, so a job starts within milliseconds of
+being queued; the poll interval only bounds how long a lost wakeup can
+delay a job. Jobs that end are announced the same way, and a worker's own
+freed slots interrupt its wait, so jobs held back by the per-user running
+cap are claimed as soon as there is room for them.
+"""
+
+import os
+import select
+import socket
+
+import psycopg2
+import psycopg2.extensions
+
+JOB_CHANNEL = "analysis_jobs"
+JOB_WAKEUP_HOST = "127.0.0.1"
+JOB_WAKEUP_PORT = int(os.environ.get("JOB_WAKEUP_PORT", "47361"))
+
+
+def notify_local_workers(job_id):
+    """SQLite mode: wake a worker on this host. Best effort; polling covers a lost datagram."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(str(job_id).encode(), (JOB_WAKEUP_HOST, JOB_WAKEUP_PORT))
+    except OSError:
+        pass
+
+
+class JobWakeup:
+    """
+    Blocks until a job is announced or the timeout passes. Created before the
+    worker's first claim, so a job enqueued between an empty claim and wait()
+    still wakes it: notifications queue on the listening connection or socket.
+    """
+
+    def __init__(self, database_url=None):
+        self.database_url = database_url
+        self._conn = None
+        self._sock = None
+        self.wakeups = 0
+        # interrupt() writes here to wake this process's own wait()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._listen()
+
+    def interrupt(self):
+        """Wake wait() from another thread of this process (a worker slot freed up)."""
+        try:
+            os.write(self._wake_w, b"x")
+        except BlockingIOError:
+            pass  # a wakeup is already pending
+
+    def _drain_interrupts(self):
+        interrupted = False
+        while True:
+            try:
+                if not os.read(self._wake_r, 64):
+                    break
+                interrupted = True
+            except BlockingIOError:
+                break
+        return interrupted
+
+    def _listen(self):
+        if self.database_url:
+            try:
+                # A dedicated session: LISTEN belongs to the connection, so it stays out of the pool
+                self._conn = psycopg2.connect(self.database_url, sslmode="require")
+                self._conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                self._conn.cursor().execute(f"LISTEN {JOB_CHANNEL}")
+            except psycopg2.Error as e:
+                print(f"[Wakeup] LISTEN failed, falling back to polling: {e}", flush=True)
+                self._conn = None
+            return
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            # Several local workers share the port; the kernel hands each datagram to one of them
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        try:
+            sock.bind((JOB_WAKEUP_HOST, JOB_WAKEUP_PORT))
+            sock.setblocking(False)
+            self._sock = sock
+        except OSError as e:
+            sock.close()
+            print(f"[Wakeup] Could not bind {JOB_WAKEUP_HOST}:{JOB_WAKEUP_PORT}, falling back to polling: {e}", flush=True)
+
+    def wait(self, timeout):
+        """Return True when woken by an announcement, False on timeout."""
+        if self._conn is None and self._sock is None:
+            select.select([self._wake_r], [], [], timeout)
+            self._listen()  # re-establish the listener lost earlier
+            return self._drain_interrupts()
+
+        source = self._conn if self._conn is not None else self._sock
+        try:
+            ready, _, _ = select.select([source, self._wake_r], [], [], timeout)
+            if not ready:
+                return False
+            if self._wake_r in ready:
+                self._drain_interrupts()
+                self.wakeups += 1
+                return True
+            if self._conn is not None:
+                self._conn.poll()
+                woken = bool(self._conn.notifies)
+                self._conn.notifies.clear()
+            else:
+                woken = False
+                while True:
+                    try:
+                        self._sock.recv(64)
+                        woken = True
+                    except BlockingIOError:
+                        break
+        except (OSError, psycopg2.Error) as e:
+            print(f"[Wakeup] Listener failed, reconnecting on the next wait: {e}", flush=True)
+            self.close()
+            return False
+
+        if woken:
+            self.wakeups += 1
+        return woken
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                pass
+            self._conn = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
@@ -0,0 +1,333 @@
+"""
+Versioned schema migrations for PostgreSQL and SQLite.
+
+Each step in MIGRATIONS runs once per database and is recorded in the
+schema_migrations table, so booting the app no longer re-issues the whole
+schema. Steps receive a cursor and a `using_sqlite` flag for the few places
+where the dialects differ, and are written to be safe to re-run (IF NOT
+EXISTS), since SQLite commits DDL outside the step's transaction.
+
+Run `python web/migrations.py` to apply pending steps, or
+`python web/migrations.py --check-plans` to EXPLAIN the hot queries and fail
+when one of them does not use its index.
+"""
+
+import os
+import sys
+import time
+
+# Key of the PostgreSQL advisory lock that serialises concurrent boots
+MIGRATION_LOCK_KEY = 7041
+
+
+def _ensure_column(c, using_sqlite, table, column, definition):
+    """Add a column that CREATE TABLE IF NOT EXISTS cannot add to an existing table."""
+    if using_sqlite:
+        c.execute(f'PRAGMA table_info({table})')
+        if column not in [row[1] for row in c.fetchall()]:
+            c.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+    else:
+        c.execute(f'ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {definition}')
+
+
+def _baseline_schema(c, using_sqlite):
+    id_col = "INTEGER PRIMARY KEY AUTOINCREMENT" if using_sqlite else "SERIAL PRIMARY KEY"
+    image_col = "BLOB" if using_sqlite else "BYTEA"
+
+    c.execute(f'''CREATE TABLE IF NOT EXISTS users (
+        id {id_col},
+        username VARCHAR(50) UNIQUE NOT NULL,
+        email VARCHAR(100) UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        full_name VARCHAR(100) NOT NULL,
+        phone VARCHAR(15),
+        city VARCHAR(50),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )''')
+
+    c.execute(f'''CREATE TABLE IF NOT EXISTS maps (
+        id {id_col},
+        user_id INTEGER NOT NULL,
+        image {image_col} NULL,
+        filename VARCHAR(255),
+        file_type VARCHAR(10),
+        report TEXT,
+        status VARCHAR(20) DEFAULT 'pending',
+        payment_status VARCHAR(20) DEFAULT 'pending',
+        analysis_status VARCHAR(20) DEFAULT 'pending',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        original_ref TEXT,
+        blob_sha256 VARCHAR(64),
+        blob_size BIGINT,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )''')
+    # Databases created before these columns existed
+    _ensure_column(c, using_sqlite, 'maps', 'original_ref', 'TEXT')
+    _ensure_column(c, using_sqlite, 'maps', 'blob_sha256', 'VARCHAR(64)')
+    _ensure_column(c, using_sqlite, 'maps', 'blob_size', 'BIGINT')
+
+    c.execute(f'''CREATE TABLE IF NOT EXISTS payments (
+        id {id_col},
+        user_id INTEGER NOT NULL,
+        map_id INTEGER NOT NULL,
+        amount DECIMAL(10,2) DEFAULT 50.00,
+        status VARCHAR(20) DEFAULT 'pending',
+        transaction_id VARCHAR(100),
+        payment_method VARCHAR(50) DEFAULT 'qr_code',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id),
+        FOREIGN KEY (map_id) REFERENCES maps (id)
+    )''')
+
+    c.execute(f'''CREATE TABLE IF NOT EXISTS feedback (
+        id {id_col},
+        user_id INTEGER NOT NULL,
+        map_id INTEGER NOT NULL,
+        rule_name TEXT NOT NULL,
+        was_correct BOOLEAN NOT NULL,
+        remark TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id),
+        FOREIGN KEY (map_id) REFERENCES maps(id)
+    )''')
+
+    c.execute(f'''CREATE TABLE IF NOT EXISTS analysis_jobs (
+        id {id_col},
+        map_id INTEGER NOT NULL,
+        status VARCHAR(20) DEFAULT 'pending',
+        attempts INTEGER DEFAULT 0,
+        last_error TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        started_at TIMESTAMP,
+        finished_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (map_id) REFERENCES maps(id)
+    )''')
+
+
+def _hot_query_indexes(c, using_sqlite):
+    # History: WHERE user_id ORDER BY created_at DESC
+    c.execute('CREATE INDEX IF NOT EXISTS idx_maps_user_created ON maps (user_id, created_at DESC, id DESC)')
+    # Blob reference check when a normalized upload replaces its original
+    c.execute('CREATE INDEX IF NOT EXISTS idx_maps_blob ON maps (blob_sha256)')
+    # Job claim: only pending rows, oldest first
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_analysis_jobs_pending ON analysis_jobs (created_at, id)
+                 WHERE status = 'pending\'''')
+    # Enqueue duplicate check: the active job of a map
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_analysis_jobs_active_map ON analysis_jobs (map_id, created_at DESC)
+                 WHERE status IN ('pending', 'processing')''')
+    # view_feedback and all_feedback
+    c.execute('CREATE INDEX IF NOT EXISTS idx_feedback_user_map ON feedback (user_id, map_id, created_at DESC)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_feedback_created ON feedback (created_at DESC)')
+    # Payment confirmation
+    c.execute('CREATE INDEX IF NOT EXISTS idx_payments_user_map ON payments (user_id, map_id, status)')
+
+
+def _history_status_index(c, using_sqlite):
+    # History filtered by result status keeps its keyset walk
+    c.execute('CREATE INDEX IF NOT EXISTS idx_maps_user_status_created ON maps (user_id, status, created_at DESC, id DESC)')
+
+
+def _job_leases(c, using_sqlite):
+    _ensure_column(c, using_sqlite, 'analysis_jobs', 'lease_owner', 'VARCHAR(100)')
+    _ensure_column(c, using_sqlite, 'analysis_jobs', 'lease_expires_at', 'TIMESTAMP')
+    # Reaper: running jobs by lease expiry
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_analysis_jobs_lease ON analysis_jobs (lease_expires_at)
+                 WHERE status = 'processing\'''')
+
+
+def _job_retries(c, using_sqlite):
+    # Retried jobs wait in 'pending' until run_after; exhausted ones move to 'dead'
+    _ensure_column(c, using_sqlite, 'analysis_jobs', 'run_after', 'TIMESTAMP')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_analysis_jobs_dead ON analysis_jobs (updated_at DESC, id DESC)
+                 WHERE status IN ('dead', 'failed')''')
+
+
+def _job_scheduling(c, using_sqlite):
+    _ensure_column(c, using_sqlite, 'analysis_jobs', 'user_id', 'INTEGER')
+    _ensure_column(c, using_sqlite, 'analysis_jobs', 'lane', "VARCHAR(20) DEFAULT 'interactive'")
+    _ensure_column(c, using_sqlite, 'analysis_jobs', 'schedule_key', 'TIMESTAMP')
+    c.execute('''UPDATE analysis_jobs SET user_id = (SELECT user_id FROM maps WHERE maps.id = analysis_jobs.map_id)
+                 WHERE user_id IS NULL''')
+    c.execute("UPDATE analysis_jobs SET lane = 'interactive' WHERE lane IS NULL")
+    c.execute('UPDATE analysis_jobs SET schedule_key = created_at WHERE schedule_key IS NULL')
+    # Fair claim order replaces the FIFO one
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_analysis_jobs_schedule ON analysis_jobs (schedule_key, id)
+                 WHERE status = 'pending\'''')
+    c.execute('DROP INDEX IF EXISTS idx_analysis_jobs_pending')
+    # Per-user backlog at enqueue and running count at claim
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_analysis_jobs_user_active ON analysis_jobs (user_id, status)
+                 WHERE status IN ('pending', 'processing')''')
+
+
+def _job_finished_index(c, using_sqlite):
+    # Metrics: jobs finished in the recent window
+    c.execute('CREATE INDEX IF NOT EXISTS idx_analysis_jobs_finished ON analysis_jobs (finished_at)')
+
+
+# (version, name, step); append only, never renumber
+MIGRATIONS = [
+    (1, "baseline schema", _baseline_schema),
+    (2, "indexes for the hot queries", _hot_query_indexes),
+    (3, "history status filter index", _history_status_index),
+    (4, "job leases", _job_leases),
+    (5, "job retries and dead letters", _job_retries),
+    (6, "fair job scheduling", _job_scheduling),
+    (7, "finished jobs index", _job_finished_index),
+]
+
+
+def applied_versions(c):
+    c.execute('SELECT version FROM schema_migrations')
+    return {row[0] for row in c.fetchall()}
+
+
+def apply_migrations(conn, using_sqlite):
+    """Apply pending MIGRATIONS in version order; return the versions applied."""
+    c = conn.cursor()
+    c.execute('''CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )''')
+    conn.commit()
+
+    applied = []
+    for version, name, step in MIGRATIONS:
+        if not using_sqlite:
+            # Web and worker processes boot together; the lock is released at commit
+            c.execute('SELECT pg_advisory_xact_lock(%s)', (MIGRATION_LOCK_KEY,))
+        if version in applied_versions(c):
+            conn.commit()
+            continue
+        started = time.perf_counter()
+        try:
+            step(c, using_sqlite)
+            c.execute('INSERT INTO schema_migrations (version, name) VALUES (%s, %s)', (version, name))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(version)
+        print(f"[Migrations] Applied {version}: {name} in {time.perf_counter() - started:.2f}s", flush=True)
+    return applied
+
+
+# ---------- query-plan check ----------
+
+# (name, query, params, index the plan must use)
+HOT_QUERIES = [
+    ("user maps",
+     'SELECT id, status, created_at FROM maps WHERE user_id = %s ORDER BY created_at DESC, id DESC',
+     (1,), "idx_maps_user_created"),
+    ("history page",
+     'SELECT id, status, created_at FROM maps WHERE user_id = %s '
+     'AND (created_at < %s OR (created_at = %s AND id < %s)) ORDER BY created_at DESC, id DESC LIMIT 26',
+     (1, "2030-01-01 00:00:00", "2030-01-01 00:00:00", 10), "idx_maps_user_created"),
+    ("history page by status",
+     'SELECT id, status, created_at FROM maps WHERE user_id = %s AND status = %s ORDER BY created_at DESC, id DESC LIMIT 26',
+     (1, "approved"), "idx_maps_user_status_created"),
+    ("blob references",
+     'SELECT 1 FROM maps WHERE blob_sha256 = %s LIMIT 1',
+     ("0" * 64,), "idx_maps_blob"),
+    ("job claim",
+     "SELECT id, user_id, schedule_key FROM analysis_jobs queued WHERE status = 'pending' "
+     "AND (run_after IS NULL OR run_after <= CURRENT_TIMESTAMP) "
+     "AND (SELECT COUNT(*) FROM analysis_jobs running WHERE running.user_id = queued.user_id "
+     "AND running.status IN ('pending', 'processing') AND running.status = 'processing') < %s "
+     "ORDER BY schedule_key, id LIMIT 16",
+     (2,), "idx_analysis_jobs_schedule"),
+    ("user running jobs",
+     "SELECT COUNT(*) FROM analysis_jobs WHERE user_id = %s "
+     "AND status IN ('pending', 'processing') AND status = 'processing'",
+     (1,), "idx_analysis_jobs_user_active"),
+    ("user backlog",
+     "SELECT COUNT(*) FROM analysis_jobs WHERE user_id = %s AND status IN ('pending', 'processing')",
+     (1,), "idx_analysis_jobs_user_active"),
+    ("dead letters",
+     "SELECT id, map_id, attempts, last_error FROM analysis_jobs WHERE status IN ('dead', 'failed') "
+     "ORDER BY updated_at DESC, id DESC LIMIT 100",
+     (), "idx_analysis_jobs_dead"),
+    ("queue depth",
+     "SELECT COUNT(*) FROM analysis_jobs WHERE status = 'pending'",
+     (), "idx_analysis_jobs_schedule"),
+    ("metrics: processing jobs",
+     "SELECT COUNT(*) FROM analysis_jobs WHERE status = 'processing'",
+     (), "idx_analysis_jobs_lease"),
+    ("metrics: recently finished",
+     "SELECT status, COUNT(*) FROM analysis_jobs WHERE finished_at >= %s GROUP BY status",
+     ("2030-01-01 00:00:00",), "idx_analysis_jobs_finished"),
+    ("lease reaper",
+     "SELECT id FROM analysis_jobs WHERE status = 'processing' AND lease_expires_at < CURRENT_TIMESTAMP",
+     (), "idx_analysis_jobs_lease"),
+    ("enqueue duplicate check",
+     "SELECT id, status FROM analysis_jobs WHERE map_id = %s AND status IN ('pending', 'processing') "
+     "ORDER BY created_at DESC LIMIT 1",
+     (1,), "idx_analysis_jobs_active_map"),
+    ("view feedback",
+     'SELECT rule_name, was_correct, remark, created_at FROM feedback WHERE user_id = %s AND map_id = %s '
+     'ORDER BY created_at DESC',
+     (1, 1), "idx_feedback_user_map"),
+    ("all feedback",
+     'SELECT f.map_id, f.rule_name, u.full_name, m.file_type FROM feedback f '
+     'JOIN users u ON f.user_id = u.id JOIN maps m ON f.map_id = m.id ORDER BY f.created_at DESC',
+     (), "idx_feedback_created"),
+    ("payment confirmation",
+     "SELECT id FROM payments WHERE user_id = %s AND map_id = %s AND status = 'pending'",
+     (1, 1), "idx_payments_user_map"),
+]
+
+
+def explain(conn, using_sqlite, query, params=()):
+    """The query's plan as text."""
+    c = conn.cursor()
+    if using_sqlite:
+        c.execute(f'EXPLAIN QUERY PLAN {query}', params)
+        return "\n".join(str(row[-1]) for row in c.fetchall())
+    # Tiny tables favour sequential scans; ask whether the index is usable at all
+    c.execute('SET LOCAL enable_seqscan = off')
+    c.execute(f'EXPLAIN {query}', params)
+    plan = "\n".join(row[0] for row in c.fetchall())
+    conn.rollback()
+    return plan
+
+
+def check_query_plans(conn, using_sqlite):
+    """Return [(name, expected index, used, plan)] for HOT_QUERIES."""
+    results = []
+    for name, query, params, index in HOT_QUERIES:
+        plan = explain(conn, using_sqlite, query, params)
+        results.append((name, index, index in plan, plan))
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply schema migrations")
+    parser.add_argument("--check-plans", action="store_true", help="EXPLAIN the hot queries and verify their indexes")
+    args = parser.parse_args(argv)
+
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from database import _is_sqlite_connection, get_connection
+
+    conn = get_connection()
+    try:
+        using_sqlite = _is_sqlite_connection(conn)
+        apply_migrations(conn, using_sqlite)
+        print(f"[Migrations] Schema at version {max(applied_versions(conn.cursor()))}")
+        if not args.check_plans:
+            return 0
+        failures = 0
+        for name, index, used, plan in check_query_plans(conn, using_sqlite):
+            print(f"{'OK  ' if used else 'FAIL'} {name:<24} {index}")
+            if not used:
+                failures += 1
+                print("     " + plan.replace("\n", "\n     "))
+        return 1 if failures else 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Disk-backed raster cache shared by the analysis path and the preview routes.
+
+Entries are keyed by the SHA-256 of the uploaded file and a render profile
+key (the profile name and a digest of its settings, e.g.
+"preview-3f2a9c0d41be" or "analysis-gray-8d01c2e7a9f3-p1"), so identical
+uploads share renditions. The cache is bounded by total size and evicts the least
+recently used entries first. The web app, the worker and its analysis children
+all write to the same directory, so eviction re-scans it and uses file mtimes
+(refreshed on every hit) as the shared LRU clock.
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.core import config_map as config
+
+
+def file_sha256(file_data):
+    """Return the hex SHA-256 digest of the uploaded bytes."""
+    return hashlib.sha256(file_data).hexdigest()
+
+
+class RasterCache:
+    """Size-bounded LRU cache of rendered bytes stored as files in one directory."""
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = 0   # as of the last scan of the directory
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._evict()
+
+    @staticmethod
+    def _entry_name(file_hash, profile):
+        safe_profile = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in profile)
+        return f"{file_hash}.{safe_profile}"
+
+    def get(self, file_hash, profile):
+        """Return cached bytes for (file_hash, profile), or None on a miss."""
+        path = os.path.join(self.cache_dir, self._entry_name(file_hash, profile))
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # mtime doubles as the LRU clock across processes
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, file_hash, profile, data):
+        """Store bytes for (file_hash, profile), evicting old entries if needed."""
+        if len(data) > self.max_bytes:
+            return
+        name = self._entry_name(file_hash, profile)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(self.cache_dir, name))
+        except OSError as e:
+            print(f"[RasterCache] Could not write {name}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _evict(self):
+        """
+        Delete the least recently used entries beyond max_bytes. The directory
+        is re-scanned every time: other processes (web app, worker, analysis
+        children) add entries to it too, and only the files on disk count.
+        """
+        existing = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue  # evicted by another process meanwhile
+            existing.append((stat.st_mtime, name, stat.st_size))
+        existing.sort()
+
+        total = sum(size for _, _, size in existing)
+        evicted = 0
+        for _, name, size in existing:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._entries = len(existing) - evicted
+            self._total_bytes = total
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": self._entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_raster_cache():
+    """Return the process-wide raster cache configured from config_map."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = RasterCache(config.RASTER_CACHE_DIR, config.RASTER_CACHE_MAX_MB * 1024 * 1024)
+        return _cache
@@ -0,0 +1,188 @@
+"""
+Zero-copy handle over rendered page pixels.
+
+A RasterHandle wraps the memory a page was rendered into (a PyMuPDF pixmap,
+a shared-memory block filled by a render helper, or a bytes object) and
+exposes it as a read-only NumPy view with the pixmap's shape and row stride.
+Stages that only read pixels use `handle.array`; a PIL image is built with
+`handle.to_image()`, which shares the buffer for grayscale pages and copies
+only where PIL's own pixel layout requires it (RGB, 1-bit). Pages cross from
+a render helper to the caller through shared memory instead of being pickled.
+
+Every copy the handle has to make is counted; see get_copy_stats().
+"""
+
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+from PIL import Image
+
+
+_CHANNELS = {"L": 1, "RGB": 3}
+
+_copy_stats = {"copies": 0, "bytes": 0}
+_copy_stats_lock = threading.Lock()
+
+
+def record_copy(nbytes):
+    """Count one full copy of page pixels."""
+    with _copy_stats_lock:
+        _copy_stats["copies"] += 1
+        _copy_stats["bytes"] += nbytes
+
+
+def get_copy_stats():
+    """Return a snapshot of the pixel-copy counters."""
+    with _copy_stats_lock:
+        return dict(_copy_stats)
+
+
+def _row_bytes(mode, width):
+    # "1" pages are packed 8 pixels per byte, rows padded to whole bytes
+    return (width + 7) // 8 if mode == "1" else width * _CHANNELS[mode]
+
+
+class _PixmapBuffer:
+    """Array interface over a pixmap's samples that keeps the pixmap alive."""
+
+    def __init__(self, pix):
+        self.pix = pix
+        shape = (pix.height, pix.width) if pix.n == 1 else (pix.height, pix.width, pix.n)
+        strides = (pix.stride, 1) if pix.n == 1 else (pix.stride, pix.n, 1)
+        self.__array_interface__ = {
+            "shape": shape,
+            "typestr": "|u1",
+            "data": (pix.samples_ptr, True),
+            "strides": strides,
+            "version": 3,
+        }
+
+
+class RasterHandle:
+    """Read-only view of one rendered page; see the module docstring."""
+
+    def __init__(self, mode, size, view, shm=None):
+        self.mode = mode
+        self.width, self.height = size
+        self._view = view      # NumPy array whose base chain owns the memory
+        self._shm = shm        # SharedMemory block backing the view, if any
+
+    # ---------- construction ----------
+
+    @classmethod
+    def from_pixmap(cls, pix):
+        """Wrap a PyMuPDF pixmap (no alpha) without copying its samples."""
+        mode = "L" if pix.n == 1 else "RGB"
+        return cls(mode, (pix.width, pix.height), np.asarray(_PixmapBuffer(pix)))
+
+    @classmethod
+    def from_buffer(cls, mode, size, buffer):
+        """Wrap bytes laid out row by row (e.g. Image.tobytes()) without copying."""
+        width, height = size
+        flat = np.frombuffer(buffer, dtype=np.uint8)
+        return cls(mode, size, flat.reshape(cls._shape(mode, width, height)))
+
+    @classmethod
+    def allocate(cls, mode, size, shared=False, fill=255):
+        """
+        New writable page canvas, optionally in shared memory so a render helper
+        can hand it to its caller without pickling. Call freeze() when done.
+        """
+        width, height = size
+        shape = cls._shape(mode, width, height)
+        nbytes = int(np.prod(shape))
+        shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1)) if shared else None
+        view = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf) if shm else np.empty(shape, dtype=np.uint8)
+        view.fill(fill)
+        return cls(mode, size, view, shm)
+
+    @classmethod
+    def from_shared(cls, descriptor):
+        """Attach to a block described by to_shared() in another process."""
+        name, mode, size = descriptor
+        shm = shared_memory.SharedMemory(name=name)
+        # The name is only needed to attach; the mapping stays valid until closed
+        shm.unlink()
+        width, height = size
+        view = np.ndarray(cls._shape(mode, width, height), dtype=np.uint8, buffer=shm.buf)
+        view.flags.writeable = False
+        return cls(mode, size, view, shm)
+
+    @staticmethod
+    def _shape(mode, width, height):
+        if mode == "1":
+            return (height, _row_bytes(mode, width))
+        return (height, width) if mode == "L" else (height, width, _CHANNELS[mode])
+
+    # ---------- access ----------
+
+    @property
+    def __array_interface__(self):
+        # np.asarray(handle) views the pixels and keeps the handle (and its owner) alive
+        return self._view.__array_interface__
+
+    @property
+    def array(self):
+        """Read-only NumPy view of the pixels, shape (h, w) or (h, w, 3)."""
+        view = np.asarray(self)
+        view.flags.writeable = False
+        return view
+
+    @property
+    def writable_array(self):
+        """The canvas of an allocate()d handle, for filling in tiles."""
+        return self._view
+
+    def freeze(self):
+        self._view.flags.writeable = False
+        return self
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    @property
+    def nbytes(self):
+        return self._view.nbytes
+
+    def to_image(self):
+        """
+        PIL image over the pixels. Grayscale shares the buffer (read-only, PIL
+        copies on first write); RGB and 1-bit pages need one copy into PIL's layout.
+        """
+        if self.mode == "L" and self._view.strides[1] == 1:
+            return Image.frombuffer("L", self.size, self.array, "raw", "L", self._view.strides[0], 1)
+        record_copy(self.nbytes)
+        return Image.frombuffer(self.mode, self.size, np.ascontiguousarray(self._view), "raw", self.mode, 0, 1)
+
+    def to_shared(self):
+        """
+        Descriptor for handing the page to another process. Pages rendered into
+        shared memory are handed over as is; others are copied into a new block.
+        The receiving side unlinks the block; the sender only unmaps its view.
+        """
+        shm = self._shm
+        if shm is None:
+            canvas = RasterHandle.allocate(self.mode, self.size, shared=True)
+            np.copyto(canvas.writable_array, self._view)
+            record_copy(self.nbytes)
+            shm, canvas._shm = canvas._shm, None
+            self._view, self._shm = np.ndarray(self._view.shape, dtype=np.uint8, buffer=shm.buf), shm
+        return shm.name, self.mode, self.size
+
+    def release(self):
+        """Drop the view and unmap shared memory; other views must be gone."""
+        self._view = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                pass  # a PIL image or array still views the block; freed with it
+        self._shm = None
+
+    def __del__(self):
+        self.release()
+
+    def __repr__(self):
+        return f"RasterHandle({self.mode}, {self.width}x{self.height}, {self.nbytes / (1024 ** 2):.1f} MB)"
@@ -0,0 +1,266 @@
+"""
+Sandboxed PDF rasterization.
+
+A hostile or malformed PDF (a decompression bomb, a page with millions of
+vector paths) can keep PyMuPDF busy indefinitely and take the web worker down
+with it. Uploads are therefore validated structurally first (magic bytes,
+encryption, page and object counts), and every render runs in a pool of
+pre-forked helper processes with address-space and CPU-time rlimits and a
+wall-clock deadline. A helper that overruns is killed and the pool replaced;
+the caller gets a RenderSandboxError instead of a hung request.
+"""
+
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import fitz  # PyMuPDF
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, only the wall-clock deadline applies
+    resource = None
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.core import config_map as config
+
+
+PDF_MAGIC = b"%PDF-"
+# Readers accept a little junk before the header; more than this is not a PDF
+MAGIC_SEARCH_BYTES = 1024
+
+
+class PDFValidationError(ValueError):
+    """The upload is not a PDF this service is willing to render."""
+
+
+class RenderSandboxError(RuntimeError):
+    """A sandboxed render exceeded its limits or its helper process died."""
+
+
+def check_pdf_magic(data):
+    """Reject anything whose first bytes do not carry a PDF header."""
+    if PDF_MAGIC not in bytes(data[:MAGIC_SEARCH_BYTES]):
+        raise PDFValidationError("File is not a PDF (no %PDF- header)")
+
+
+def inspect_pdf_structure(source):
+    """
+    Open the document and return (page_count, object_count), raising
+    PDFValidationError for encrypted, empty or oversized documents. Runs
+    inside the sandbox: even opening a crafted file can be expensive.
+    """
+    try:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            doc = fitz.open(stream=bytes(source), filetype="pdf")
+        else:
+            doc = fitz.open(source)
+    except Exception as e:
+        raise PDFValidationError(f"PDF could not be parsed: {e}")
+    try:
+        if doc.needs_pass:
+            raise PDFValidationError("PDF is password protected")
+        page_count, object_count = doc.page_count, doc.xref_length()
+    finally:
+        doc.close()
+
+    if page_count == 0:
+        raise PDFValidationError("PDF has no pages")
+    if page_count > config.PDF_MAX_PAGES:
+        raise PDFValidationError(f"PDF has {page_count} pages (limit {config.PDF_MAX_PAGES})")
+    if object_count > config.PDF_MAX_OBJECTS:
+        raise PDFValidationError(f"PDF has {object_count} objects (limit {config.PDF_MAX_OBJECTS})")
+    return page_count, object_count
+
+
+def _limit_helper_memory(memory_bytes):
+    """Pool initializer: cap the helper's address space for its whole life."""
+    if resource is not None and memory_bytes:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+
+def _warm_up():
+    return os.getpid()
+
+
+def _run_limited(cpu_seconds, func, args):
+    """
+    Run one task in a helper. RLIMIT_CPU counts the process's whole lifetime,
+    so the soft limit is moved to the CPU time used so far plus this task's
+    allowance; the kernel sends SIGXCPU, which kills the helper, on overrun.
+    """
+    if resource is not None and cpu_seconds:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime) + 1
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = used + cpu_seconds
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    try:
+        return func(*args)
+    except MemoryError:
+        raise RenderSandboxError(f"Render exceeded the {config.RENDER_SANDBOX_MEMORY_MB} MB memory limit")
+    except Exception as e:
+        # PyMuPDF errors can carry unpicklable SWIG handles; send back the message only
+        try:
+            pickle.dumps(e)
+        except Exception:
+            raise RenderSandboxError(f"{type(e).__name__}: {e}")
+        raise
+
+
+class RenderSandbox:
+    """Pool of pre-forked helper processes that run render tasks under limits."""
+
+    def __init__(self, workers, memory_mb, cpu_seconds, timeout_seconds):
+        self.workers = max(1, workers)
+        self.memory_bytes = memory_mb * 1024 * 1024 if memory_mb else 0
+        self.cpu_seconds = cpu_seconds
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._pool = None
+        self.tasks = 0
+        self.killed = 0
+
+    def _context(self):
+        # Helpers fork from a clean single-threaded server, not from the threaded web process
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload(["fitz", "numpy", "PIL.Image"])
+            return context
+        return multiprocessing.get_context()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                started = time.perf_counter()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=self._context(),
+                    initializer=_limit_helper_memory,
+                    initargs=(self.memory_bytes,),
+                )
+                # Start every helper now so the first render does not pay for the fork
+                pids = {f.result() for f in [self._pool.submit(_warm_up) for _ in range(self.workers)]}
+                print(f"[Sandbox] Started {len(pids)} render helper(s) in {time.perf_counter() - started:.2f}s", flush=True)
+            return self._pool
+
+    def _discard_pool(self, pool):
+        """Kill the pool's helpers (a hung render cannot be cancelled) and start afresh next time."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        # ProcessPoolExecutor has no public API to kill running workers
+        for process in list(getattr(pool, "_processes", {}).values()):
+            if process.is_alive():
+                process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, func, *args):
+        """Schedule func(*args) in a helper; pass the future to result()."""
+        pool = self._get_pool()
+        self.tasks += 1
+        future = pool.submit(_run_limited, self.cpu_seconds, func, args)
+        future.sandbox_pool = pool
+        future.sandbox_started = time.monotonic()
+        return future
+
+    def result(self, future):
+        """Wait for a submitted task within the wall-clock deadline."""
+        remaining = self.timeout_seconds - (time.monotonic() - future.sandbox_started) if self.timeout_seconds else None
+        try:
+            return future.result(timeout=max(remaining, 0.0) if remaining is not None else None)
+        except FutureTimeoutError:
+            self.killed += 1
+            self._discard_pool(future.sandbox_pool)
+            raise RenderSandboxError(f"Render exceeded the {self.timeout_seconds}s deadline")
+        except BrokenProcessPool:
+            # SIGXCPU or the OOM killer took the helper down
+            self.killed += 1
+            self._discard_pool(future.sandbox_pool)
+            raise RenderSandboxError(
+                f"Render helper died (CPU limit {self.cpu_seconds}s, memory limit "
+                f"{self.memory_bytes // (1024 * 1024)} MB)"
+            )
+
+    def run(self, func, *args):
+        return self.result(self.submit(func, *args))
+
+    def run_many(self, func, arg_tuples):
+        """
+        Run func over several argument tuples, at most one per helper at a
+        time so each task's deadline only counts its own run. Results are
+        returned in input order.
+        """
+        arg_tuples = list(arg_tuples)
+        results = []
+        for start in range(0, len(arg_tuples), self.workers):
+            futures = [self.submit(func, *args) for args in arg_tuples[start:start + self.workers]]
+            results.extend(self.result(future) for future in futures)
+        return results
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+_sandbox = None
+_sandbox_lock = threading.Lock()
+
+
+def _cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_render_sandbox():
+    """Process-wide render sandbox, created on first use."""
+    global _sandbox
+    with _sandbox_lock:
+        if _sandbox is None:
+            if config.RENDER_SANDBOX_MEMORY_MB >= config.ANALYSIS_CHILD_MAX_RSS_MB:
+                print(
+                    f"[Sandbox] RENDER_SANDBOX_MEMORY_MB ({config.RENDER_SANDBOX_MEMORY_MB}) is not below "
+                    f"ANALYSIS_CHILD_MAX_RSS_MB ({config.ANALYSIS_CHILD_MAX_RSS_MB}): a runaway render kills the "
+                    "whole analysis instead of failing on its own limit",
+                    flush=True,
+                )
+            _sandbox = RenderSandbox(
+                workers=config.RENDER_SANDBOX_WORKERS or _cpu_count(),
+                memory_mb=config.RENDER_SANDBOX_MEMORY_MB,
+                cpu_seconds=config.RENDER_SANDBOX_CPU_SECONDS,
+                timeout_seconds=config.RENDER_SANDBOX_TIMEOUT_SECONDS,
+            )
+        return _sandbox
+
+
+def validate_pdf(source):
+    """
+    Fast structural validation of an uploaded or stored PDF (bytes or path):
+    header magic in-process, then page and object counts in the sandbox.
+    Returns the page count; raises PDFValidationError or RenderSandboxError.
+    """
+    started = time.perf_counter()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        check_pdf_magic(source)
+    else:
+        with open(source, "rb") as handle:
+            check_pdf_magic(handle.read(MAGIC_SEARCH_BYTES))
+
+    if config.RENDER_SANDBOX:
+        page_count, object_count = get_render_sandbox().run(inspect_pdf_structure, source)
+    else:
+        page_count, object_count = inspect_pdf_structure(source)
+    print(f"[Sandbox] PDF validated: {page_count} page(s), {object_count} objects in {(time.perf_counter() - started) * 1000:.1f} ms", flush=True)
+    return page_count
@@ -0,0 +1,443 @@
+"""
+Single PyMuPDF render service used by the analysis path and the preview routes.
+
+Every rasterization goes through a named profile ("analysis", "preview",
+"thumbnail") so the same document produces consistent output wherever it is
+rendered. Each render is recorded with its wall time and RSS delta; see
+get_render_stats(). PDFs are validated and rendered in the sandbox helpers of
+render_sandbox.py unless RENDER_SANDBOX is disabled.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+import psutil
+from PIL import Image
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.core import config_map as config
+
+try:
+    from .raster_cache import file_sha256, get_raster_cache
+    from .raster_handle import RasterHandle
+    from .render_sandbox import get_render_sandbox, validate_pdf
+except ImportError:
+    from raster_cache import file_sha256, get_raster_cache
+    from raster_handle import RasterHandle
+    from render_sandbox import get_render_sandbox, validate_pdf
+
+
+# zoom is relative to 72 dpi; max_size fits the page into a square box instead.
+# "L" renders one byte per pixel straight from PyMuPDF; "1" renders gray and
+# thresholds to one bit per pixel (rendered at a higher zoom to keep text legible).
+RENDER_PROFILES = {
+    "analysis": {"zoom": config.PDF_RENDER_ZOOM, "colorspace": "RGB"},
+    "analysis-gray": {"zoom": config.PDF_RENDER_ZOOM, "colorspace": "L"},
+    "analysis-bilevel": {"zoom": config.BILEVEL_RENDER_ZOOM, "colorspace": "1"},
+    "preview": {"zoom": config.PREVIEW_DPI / 72.0, "colorspace": "RGB"},
+    "thumbnail": {"max_size": config.THUMBNAIL_MAX_SIZE, "colorspace": "RGB"},
+}
+
+_COLORSPACES = {"RGB": fitz.csRGB, "L": fitz.csGRAY, "1": fitz.csGRAY}
+
+# Lookup table for the bilevel threshold: anti-aliased strokes darker than it stay ink
+_BILEVEL_TABLE = [255 if value >= config.BILEVEL_THRESHOLD else 0 for value in range(256)]
+
+_render_stats = {}
+_render_stats_lock = threading.Lock()
+
+
+def available_cpu_count():
+    """Number of CPU cores this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def parse_page_selection(selection, page_count):
+    """
+    Parse a 1-based page selection such as "all", "1", "1,3" or "2-4" into
+    sorted 0-based page indexes, capped at config.ANALYSIS_PDF_MAX_PAGES.
+    """
+    if selection is None or str(selection).strip().lower() in ("", "all"):
+        pages = list(range(page_count))
+    else:
+        pages = set()
+        for part in str(selection).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                first, last = part.split("-", 1)
+                pages.update(range(int(first) - 1, int(last)))
+            else:
+                pages.add(int(part) - 1)
+        pages = sorted(p for p in pages if 0 <= p < page_count)
+
+    if not pages:
+        raise ValueError(f"Page selection '{selection}' matches no pages (document has {page_count})")
+    return pages[:config.ANALYSIS_PDF_MAX_PAGES]
+
+
+def pdf_page_count(file_path):
+    """Number of pages in a PDF file."""
+    doc = fitz.open(file_path)
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
+
+
+def record_render(profile, page_number, width, height, seconds, rss_delta):
+    """Add one render to the per-profile statistics and log it."""
+    with _render_stats_lock:
+        stats = _render_stats.setdefault(profile, {
+            "renders": 0,
+            "total_seconds": 0.0,
+            "max_seconds": 0.0,
+            "pixels": 0,
+            "max_rss_delta_mb": 0.0,
+        })
+        stats["renders"] += 1
+        stats["total_seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        stats["pixels"] += width * height
+        stats["max_rss_delta_mb"] = max(stats["max_rss_delta_mb"], rss_delta / (1024 ** 2))
+    print(
+        f"[Render] {profile} page {page_number + 1}: {width}x{height} in {seconds:.3f}s, "
+        f"RSS delta: {rss_delta / (1024 ** 2):.2f} MB",
+        flush=True,
+    )
+
+
+def get_render_stats():
+    """Return a copy of the per-profile render statistics for this process."""
+    with _render_stats_lock:
+        return {profile: dict(stats) for profile, stats in _render_stats.items()}
+
+
+def _open_document(source):
+    """Open a PDF from a file path or from in-memory bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return fitz.open(stream=bytes(source), filetype="pdf")
+    return fitz.open(source)
+
+
+def _profile_zoom(page, profile, pixel_budget):
+    """
+    Render scale for a page: the profile's zoom, lowered so the page's
+    physical size stays within the pixel budget.
+    """
+    settings = RENDER_PROFILES[profile]
+    if "max_size" in settings:
+        zoom = settings["max_size"] / max(page.rect.width, page.rect.height)
+    else:
+        zoom = settings["zoom"]
+
+    page_points = page.rect.width * page.rect.height
+    if pixel_budget and page_points * zoom * zoom > pixel_budget:
+        zoom = (pixel_budget / page_points) ** 0.5
+        print(
+            f"[Render] Page {page.number + 1} ({page.rect.width / 72 * 25.4:.0f}x{page.rect.height / 72 * 25.4:.0f} mm) "
+            f"exceeds the {pixel_budget / 1e6:.0f} MP budget, zoom reduced to {zoom:.2f}",
+            flush=True,
+        )
+    return zoom
+
+
+def _render_pixmap(doc, page_number, profile, pixel_budget):
+    page = doc.load_page(page_number)
+    zoom = _profile_zoom(page, profile, pixel_budget)
+    colorspace = _COLORSPACES[RENDER_PROFILES[profile]["colorspace"]]
+    return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+
+
+def iter_page_tiles(page, zoom, colorspace, tile_size=None):
+    """
+    Yield (x, y, pixmap) tiles covering the page rendered at `zoom`, where
+    (x, y) is the tile's offset in the full image. Only one tile is alive at a
+    time, so consumers can stream a sheet of any size in bounded memory.
+    """
+    tile_size = tile_size or config.RENDER_TILE_SIZE
+    matrix = fitz.Matrix(zoom, zoom)
+    full = (page.rect * matrix).irect
+    step = tile_size / zoom
+    y = page.rect.y0
+    while y < page.rect.y1:
+        x = page.rect.x0
+        while x < page.rect.x1:
+            clip = fitz.Rect(x, y, min(x + step, page.rect.x1), min(y + step, page.rect.y1))
+            pix = page.get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False, clip=clip)
+            yield pix.x - full.x0, pix.y - full.y0, pix
+            del pix
+            x += step
+        y += step
+
+
+def _render_page_handle(page, zoom, mode, shared=False):
+    """
+    Render an 8-bit page into a RasterHandle. A page that fits in one tile is
+    wrapped straight from its pixmap; larger pages, and pages bound for another
+    process (`shared`), are rendered tile by tile into one canvas, so no
+    full-page pixmap is ever held next to it.
+    """
+    colorspace = _COLORSPACES[mode]
+    full = (page.rect * fitz.Matrix(zoom, zoom)).irect
+    fits = full.width * full.height <= config.RENDER_TILE_SIZE ** 2
+    if fits and not shared:
+        return RasterHandle.from_pixmap(page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False))
+
+    canvas = RasterHandle.allocate(mode, (full.width, full.height), shared=shared)
+    pixels = canvas.writable_array
+    tile_size = max(full.width, full.height) if fits else None
+    for x, y, pix in iter_page_tiles(page, zoom, colorspace, tile_size):
+        tile = RasterHandle.from_pixmap(pix).array
+        pixels[y:y + tile.shape[0], x:x + tile.shape[1]] = tile
+    return canvas.freeze()
+
+
+def _render_page_image(doc, page_number, profile, pixel_budget):
+    """
+    Render one page to a PIL image in this process. Grayscale pages share the
+    pixmap or canvas buffer; RGB and bilevel pages larger than one tile are
+    pasted tile by tile straight into PIL's own layout.
+    """
+    page = doc.load_page(page_number)
+    zoom = _profile_zoom(page, profile, pixel_budget)
+    mode = RENDER_PROFILES[profile]["colorspace"]
+    if mode == "L":
+        return _render_page_handle(page, zoom, mode).to_image()
+
+    colorspace = _COLORSPACES[mode]
+    full = (page.rect * fitz.Matrix(zoom, zoom)).irect
+    if full.width * full.height <= config.RENDER_TILE_SIZE ** 2:
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+        image = RasterHandle.from_pixmap(pix).to_image()
+        return image.point(_BILEVEL_TABLE, "1") if mode == "1" else image
+
+    image = Image.new(mode, (full.width, full.height), 255 if mode != "RGB" else (255, 255, 255))
+    for x, y, pix in iter_page_tiles(page, zoom, colorspace):
+        tile = RasterHandle.from_pixmap(pix).to_image()
+        image.paste(tile.point(_BILEVEL_TABLE, "1") if mode == "1" else tile, (x, y))
+    return image
+
+
+def _render_page_shared(source, page_number, profile, pixel_budget):
+    """
+    Render one page into shared memory. Runs inside a helper process, so it
+    opens its own document handle and returns a RasterHandle descriptor plus
+    the measured time and RSS delta for the caller to record. 8-bit pages are
+    tiled straight into the shared block; bilevel pages leave the helper
+    packed at 1 bit per pixel.
+    """
+    process = psutil.Process(os.getpid())
+    rss_before = process.memory_info().rss
+    started = time.perf_counter()
+    doc = _open_document(source)
+    try:
+        mode = RENDER_PROFILES[profile]["colorspace"]
+        if mode == "1":
+            image = _render_page_image(doc, page_number, profile, pixel_budget)
+            handle = RasterHandle.from_buffer("1", image.size, image.tobytes())
+        else:
+            page = doc.load_page(page_number)
+            handle = _render_page_handle(page, _profile_zoom(page, profile, pixel_budget), mode, shared=True)
+        descriptor = handle.to_shared()
+    finally:
+        doc.close()
+    seconds = time.perf_counter() - started
+    return page_number, descriptor, seconds, process.memory_info().rss - rss_before
+
+
+def _profile_cache_key(profile):
+    """
+    Cache key prefix for a profile: its name plus a digest of every setting
+    that changes its output (zoom or box size, colorspace, pixel budget and,
+    for bilevel, the threshold), so changing one never serves stale rasters.
+    """
+    settings = dict(RENDER_PROFILES[profile], pixel_budget_mp=config.RENDER_PIXEL_BUDGET_MP)
+    if settings["colorspace"] == "1":
+        settings["threshold"] = config.BILEVEL_THRESHOLD
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:12]
+    return f"{profile}-{digest}"
+
+
+def _page_cache_key(profile, page_number):
+    return f"{_profile_cache_key(profile)}-p{page_number + 1}"
+
+
+def render_pdf_pages(file_path, pages=None, profile="analysis", max_workers=None, file_hash=None):
+    """
+    Rasterize the selected pages of a PDF (default: all) with the given profile
+    and return one PIL image per page, in page order. Multiple pages are rendered
+    in a process pool sized to the available cores, or in the render sandbox's
+    helpers when it is enabled. When `file_hash` is given, pages are read from
+    and written to the shared raster cache.
+    """
+    try:
+        process = psutil.Process(os.getpid())
+        mem_before = process.memory_info().rss
+        started = time.perf_counter()
+
+        page_count = validate_pdf(file_path)
+        page_numbers = parse_page_selection(pages, page_count)
+        pixel_budget = config.RENDER_PIXEL_BUDGET_MP * 1_000_000
+        images = {}
+        cache = get_raster_cache() if file_hash else None
+        if cache:
+            for n in page_numbers:
+                cached = cache.get(file_hash, _page_cache_key(profile, n))
+                if cached is not None:
+                    images[n] = Image.open(io.BytesIO(cached))
+                    images[n].load()
+        missing = [n for n in page_numbers if n not in images]
+        workers = min(len(missing), max_workers or available_cpu_count())
+
+        if config.RENDER_SANDBOX and missing:
+            sandbox = get_render_sandbox()
+            workers = min(len(missing), sandbox.workers)
+            rendered = []
+            results = sandbox.run_many(_render_page_shared, [(file_path, n, profile, pixel_budget) for n in missing])
+            for n, descriptor, seconds, rss_delta in results:
+                images[n] = RasterHandle.from_shared(descriptor).to_image()
+                rendered.append((n, seconds, rss_delta))
+        elif workers <= 1:
+            # In-process: keep the rendered images as they are, no sample round trip
+            rendered = []
+            doc = fitz.open(file_path)
+            try:
+                for n in missing:
+                    rss_before = process.memory_info().rss
+                    render_started = time.perf_counter()
+                    images[n] = _render_page_image(doc, n, profile, pixel_budget)
+                    rendered.append((n, time.perf_counter() - render_started, process.memory_info().rss - rss_before))
+            finally:
+                doc.close()
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_render_page_shared, file_path, n, profile, pixel_budget) for n in missing]
+                rendered = []
+                for future in futures:
+                    n, descriptor, seconds, rss_delta = future.result()
+                    images[n] = RasterHandle.from_shared(descriptor).to_image()
+                    rendered.append((n, seconds, rss_delta))
+
+        for n, seconds, rss_delta in rendered:
+            record_render(profile, n, images[n].width, images[n].height, seconds, rss_delta)
+            if cache:
+                buffer = io.BytesIO()
+                images[n].save(buffer, format="PNG", compress_level=1)
+                cache.put(file_hash, _page_cache_key(profile, n), buffer.getvalue())
+
+        images = [images[n] for n in page_numbers]
+
+        mem_after = process.memory_info().rss
+        print(
+            f"[Render] Loaded {len(images)}/{page_count} page(s), {len(missing)} rendered with {workers} worker(s) "
+            f"in {time.perf_counter() - started:.2f}s, RAM delta: {(mem_after - mem_before) / (1024 ** 2):.2f} MB",
+            flush=True,
+        )
+
+        return images
+
+    except Exception as e:
+        raise Exception(f"PDF conversion failed: {str(e)}")
+
+
+def _render_page_png(source, page_number, profile, pixel_budget):
+    """Render one page to PNG bytes; returns (data, width, height, seconds, rss_delta)."""
+    process = psutil.Process(os.getpid())
+    rss_before = process.memory_info().rss
+    started = time.perf_counter()
+    doc = _open_document(source)
+    try:
+        pix = _render_pixmap(doc, page_number, profile, pixel_budget)
+        data = pix.tobytes("png")
+        width, height = pix.width, pix.height
+    finally:
+        doc.close()
+    return data, width, height, time.perf_counter() - started, process.memory_info().rss - rss_before
+
+
+def render_pdf_png(file_data, profile, page_number=0):
+    """Render one page of an in-memory PDF to PNG bytes with the given profile."""
+    validate_pdf(file_data)
+    args = (file_data, page_number, profile, config.RENDER_PIXEL_BUDGET_MP * 1_000_000)
+    if config.RENDER_SANDBOX:
+        data, width, height, seconds, rss_delta = get_render_sandbox().run(_render_page_png, *args)
+    else:
+        data, width, height, seconds, rss_delta = _render_page_png(*args)
+    record_render(profile, page_number, width, height, seconds, rss_delta)
+    return data
+
+
+def render_image_thumbnail(image_bytes):
+    """Downscale uploaded raster image bytes to a PNG thumbnail."""
+    process = psutil.Process(os.getpid())
+    rss_before = process.memory_info().rss
+    started = time.perf_counter()
+    image = Image.open(io.BytesIO(image_bytes))
+    max_size = RENDER_PROFILES["thumbnail"]["max_size"]
+    image.thumbnail((max_size, max_size))
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    img_io = io.BytesIO()
+    image.save(img_io, 'PNG', optimize=True)
+    record_render("thumbnail", 0, image.width, image.height, time.perf_counter() - started, process.memory_info().rss - rss_before)
+    return img_io.getvalue()
+
+
+def get_map_rendition(file_data, file_type, profile, file_hash=None):
+    """
+    Return (bytes, mimetype) for the "preview" or "thumbnail" rendition of an
+    uploaded map, rendering and caching it on a miss. Raster previews are the
+    uploaded bytes themselves. `file_data` may be a callable returning the
+    bytes, called only when they are needed (a cache miss with `file_hash` given).
+    """
+    if profile not in ("preview", "thumbnail"):
+        raise ValueError(f"Unknown rendition profile: {profile}")
+
+    is_pdf = file_type.lower() == 'pdf'
+    if profile == "preview" and not is_pdf:
+        mime_type = 'image/jpeg' if file_type.lower() == 'jpg' else f'image/{file_type.lower()}'
+        return file_data() if callable(file_data) else file_data, mime_type
+
+    cache = get_raster_cache()
+    if file_hash is None:
+        file_data = file_data() if callable(file_data) else file_data
+        file_hash = file_sha256(file_data)
+    cache_key = _profile_cache_key(profile)
+    cached = cache.get(file_hash, cache_key)
+    if cached is not None:
+        return cached, 'image/png'
+
+    if callable(file_data):
+        file_data = file_data()
+
+    if is_pdf:
+        data = render_pdf_png(file_data, profile)
+    else:
+        data = render_image_thumbnail(file_data)
+
+    cache.put(file_hash, cache_key, data)
+    return data, 'image/png'
+
+
+def ensure_map_renditions(file_data, file_type):
+    """Generate the preview and thumbnail renditions once; run in the background at upload."""
+    try:
+        started = time.perf_counter()
+        file_hash = file_sha256(file_data)
+        for profile in ("preview", "thumbnail"):
+            get_map_rendition(file_data, file_type, profile, file_hash)
+        print(f"[Renditions] Cached preview/thumbnail for {file_hash[:12]} in {time.perf_counter() - started:.2f}s", flush=True)
+    except Exception as e:
+        print(f"[Renditions] Could not pre-render renditions: {e}", flush=True)
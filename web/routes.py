@@ -1,26 +1,30 @@
-from flask import render_template, request, redirect, url_for, flash, session, send_file, jsonify
+from flask import abort, render_template, request, redirect, url_for, flash, session, send_file, jsonify
 from werkzeug.security import generate_password_hash, check_password_hash
 from functools import wraps
 import io
 import sys
 import os
-import threading
-from datetime import datetime
-
-ACTIVE_ANALYSIS_MAPS = set()
-ACTIVE_ANALYSIS_LOCK = threading.Lock()
 
 # DB_PATH = os.path.join(os.getcwd(), "database.db")
 
 # Handle both relative and absolute imports
 try:
     from .database import *
-    from .analysis import analyze_map_with_ai
+    from .blob_store import get_blob_store
+    from .render_sandbox import PDFValidationError, RenderSandboxError, validate_pdf
+    from .render_service import get_map_rendition
+    from .upload_normalization import submit_map_upload
 except ImportError:
     # Fallback for direct execution
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from database import *
-    from analysis import analyze_map_with_ai
+    from blob_store import get_blob_store
+    from render_sandbox import PDFValidationError, RenderSandboxError, validate_pdf
+    from render_service import get_map_rendition
+    from upload_normalization import submit_map_upload
+
+from src.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY as METRICS_REGISTRY
+from src.core.metrics import authorized as metrics_authorized
 
 
 def safe_print(message):
@@ -43,6 +47,18 @@ def login_required(f):
         return f(*args, **kwargs)
     return check_login
 
+def admin_required(f):
+    """Logged-in accounts listed in ADMIN_USERNAMES only; everyone else gets 403."""
+    @wraps(f)
+    def check_admin(*args, **kwargs):
+        if 'user_id' not in session:
+            flash('Please log in.', 'error')
+            return redirect(url_for('login'))
+        if not is_admin_user(session['user_id']):
+            abort(403)
+        return f(*args, **kwargs)
+    return check_admin
+
 def payment_required(f):
     @wraps(f)
     def check_payment(*args, **kwargs):
@@ -67,101 +83,6 @@ def payment_required(f):
     return check_payment
 
 def register_routes(app):
-    def run_analysis_async(user_id, target_map_id):
-        import traceback
-        try:
-            conn = get_connection()
-            c = conn.cursor()
-            c.execute(
-                'SELECT image, filename, file_type FROM maps WHERE id = %s AND user_id = %s',
-                (target_map_id, user_id)
-            )
-            map_data = c.fetchone()
-            conn.close()
-
-            if not map_data:
-                update_map_analysis(
-                    target_map_id,
-                    "Analysis Error: Map data not found\nPlease try uploading again or contact support.",
-                    'error'
-                )
-                return
-
-            file_data, filename, file_type = map_data
-
-            # Mark processing while analysis thread is active.
-            conn = get_connection()
-            c = conn.cursor()
-            c.execute('UPDATE maps SET analysis_status = %s WHERE id = %s', ('processing', target_map_id))
-            conn.commit()
-            conn.close()
-
-            results, overall_status, raw_validation, validation_text = analyze_map_with_ai(file_data, filename, file_type)
-
-            if overall_status == "error" or "error" in results:
-                error_message = results.get("error", {}).get("message", "Unknown error occurred")
-                error_report = f"Analysis Error: {error_message}\nPlease try uploading again or contact support."
-                update_map_analysis(target_map_id, error_report, 'error')
-                return
-
-            report = f"Map Analysis Report for {filename}\n"
-            report += f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            report += f"Overall Status: {overall_status.upper()}\n"
-            report += "\n"
-
-            if results and any(k != "error" for k in results.keys()):
-                report += "RULE COMPLIANCE SUMMARY:\n"
-                report += "=" * 55 + "\n"
-
-                rule_mapping = {
-                    'Habitable Room': 'Habitable Room (Bedroom & Drawing Room)',
-                    'Bathroom': 'Bathroom',
-                    'Store': 'Store Room',
-                }
-
-                rule_counter = 1
-                for rule, result in results.items():
-                    if rule != "error":
-                        clean_rule_name = rule_mapping.get(rule, rule)
-
-                        if result['passed']:
-                            status_symbol = "✅"
-                            status_text = "PASSED"
-                            status_display = f"  {status_symbol} {status_text}  "
-                        else:
-                            status_symbol = "❌"
-                            status_text = "FAILED"
-                            status_display = f"  {status_symbol} {status_text}  "
-
-                        report += f"{rule_counter:2d}. {clean_rule_name:<40} {status_display}\n"
-                        rule_counter += 1
-
-                report += "=" * 55 + "\n"
-
-            update_map_analysis(target_map_id, report, overall_status)
-
-        except Exception as e:
-            traceback.print_exc()
-            error_report = f"Analysis Error: {str(e)}\nPlease try uploading again or contact support."
-            try:
-                update_map_analysis(target_map_id, error_report, 'error')
-            except Exception:
-                traceback.print_exc()
-        finally:
-            with ACTIVE_ANALYSIS_LOCK:
-                ACTIVE_ANALYSIS_MAPS.discard(target_map_id)
-
-    def start_analysis_thread(user_id, target_map_id):
-        with ACTIVE_ANALYSIS_LOCK:
-            if target_map_id in ACTIVE_ANALYSIS_MAPS:
-                return False
-            ACTIVE_ANALYSIS_MAPS.add(target_map_id)
-
-        thread = threading.Thread(target=run_analysis_async, args=(user_id, target_map_id))
-        thread.daemon = True
-        thread.start()
-        return True
-
     @app.route('/')
     def home():
         return redirect(url_for('welcome')) if 'user_id' in session else redirect(url_for('login'))
@@ -292,10 +213,22 @@ def register_routes(app):
                 file_data = file.read()
                 filename = file.filename
                 file_type = filename.rsplit('.', 1)[1].lower()
+
+                # Reject malformed or oversized PDFs before they are stored
+                if file_type == 'pdf':
+                    try:
+                        validate_pdf(file_data)
+                    except (PDFValidationError, RenderSandboxError) as e:
+                        print(f"Upload rejected: {e}")
+                        flash(f'Invalid PDF: {e}', 'error')
+                        return redirect(request.url)
                 
                 # Insert map into database
                 map_id = insert_map(session['user_id'], file_data, filename, file_type)
                 session['current_map_id'] = map_id
+
+                # Normalize raster uploads and render preview/thumbnail once, off the request path
+                submit_map_upload(map_id, file_data, file_type)
                 
                 flash('Map uploaded successfully! Please proceed to payment.', 'success')
                 return redirect(url_for('payment', map_id=map_id))
@@ -372,7 +305,12 @@ def register_routes(app):
         
         session['current_map_id'] = map_id
 
-        start_analysis_thread(session['user_id'], map_id)
+        # Analyses run in the worker; a full queue leaves the map to be
+        # queued by check_analysis_status once there is room
+        try:
+            enqueue_analysis_job(map_id, ANALYSIS_QUEUE_MAX_DEPTH)
+        except AnalysisQueueFull:
+            flash('Many analyses are queued right now. Yours will start as soon as there is room.', 'info')
 
         return redirect(url_for('analysis_progress', map_id=map_id))
 
@@ -387,7 +325,7 @@ def register_routes(app):
             # conn = sqlite3.connect(DB_PATH)
             conn = get_connection()
             c = conn.cursor()
-            c.execute('SELECT image, filename, file_type, status, analysis_status FROM maps WHERE id = %s AND user_id = %s', 
+            c.execute('SELECT filename, file_type, status, analysis_status FROM maps WHERE id = %s AND user_id = %s', 
                     (map_id, session['user_id']))
             map_data = c.fetchone()
             conn.close()
@@ -396,7 +334,7 @@ def register_routes(app):
                 flash('Map not found.', 'error')
                 return redirect(url_for('upload_map'))
             
-            file_data, filename, file_type, status, analysis_status = map_data
+            filename, file_type, status, analysis_status = map_data
             
             # Check if analysis completed
             if analysis_status == 'completed':
@@ -434,8 +372,17 @@ def register_routes(app):
     @app.route('/history')
     @login_required
     def history():
-        maps = get_user_maps(session['user_id'])
-        
+        status_filter = request.args.get('status') or None
+        try:
+            history_data, next_cursor = history_page(request.args.get('cursor'), status_filter)
+        except ValueError:
+            return redirect(url_for('history', status=status_filter))
+
+        return render_template('history.html', history=history_data, next_cursor=next_cursor,
+                               status_filter=status_filter, is_first_page=not request.args.get('cursor'))
+
+    def history_page(cursor, status_filter, limit=None):
+        maps, next_cursor = get_user_maps_page(session['user_id'], limit=limit, cursor=cursor, status=status_filter)
         history_data = []
         for map_data in maps:
             history_data.append({
@@ -443,25 +390,38 @@ def register_routes(app):
                 'status': map_data[1],
                 'payment_status': map_data[2],
                 'analysis_status': map_data[3],
-                'created_at': map_data[4],
-                'report': map_data[5],
-                'filename': map_data[6]
+                'created_at': str(map_data[4]),
+                'filename': map_data[5]
             })
-        
-        return render_template('history.html', history=history_data)
+        return history_data, next_cursor
+
+    @app.route('/api/history')
+    @login_required
+    def history_api():
+        """Summary rows of one history page; follow next_cursor for older maps."""
+        try:
+            history_data, next_cursor = history_page(request.args.get('cursor'), request.args.get('status') or None,
+                                                     request.args.get('limit', type=int))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify({'maps': history_data, 'next_cursor': next_cursor})
+
+    @app.route('/api/report/<int:map_id>')
+    @login_required
+    def report_api(map_id):
+        """The full report of one map, loaded on demand by the history page."""
+        result = get_map_report(map_id, session['user_id'])
+        if not result:
+            return jsonify({'error': 'Report not found'}), 404
+        report, status, filename = result
+        return jsonify({'map_id': map_id, 'report': report, 'status': status, 'filename': filename})
 
 
 
     @app.route('/view_report/<int:map_id>')
     @login_required
     def view_report(map_id):
-        # conn = sqlite3.connect(DB_PATH)
-        conn = get_connection()
-        c = conn.cursor()
-        c.execute('SELECT report, status, filename FROM maps WHERE id = %s AND user_id = %s', 
-                (map_id, session['user_id']))
-        result = c.fetchone()
-        conn.close()
+        result = get_map_report(map_id, session['user_id'])
 
         if not result:
             flash('Report not found.', 'error')
@@ -566,6 +526,29 @@ def register_routes(app):
 
         return render_template('all_feedback.html', feedback_entries=feedback_entries)
 
+    @app.route('/admin/analysis_jobs')
+    @admin_required
+    def dead_analysis_jobs():
+        status = request.args.get('status', 'dead')
+        if status not in ('dead', 'failed'):
+            status = 'dead'
+        return render_template('dead_jobs.html', jobs=get_dead_analysis_jobs(status), status=status)
+
+    @app.route('/admin/analysis_jobs/requeue', methods=['POST'])
+    @admin_required
+    def requeue_dead_analysis_jobs():
+        job_ids = request.form.getlist('job_ids', type=int)
+        if not job_ids:
+            flash('Select at least one job to requeue.', 'error')
+        else:
+            requeued = requeue_analysis_jobs(job_ids)
+            skipped = len(job_ids) - len(requeued)
+            message = f'Requeued {len(requeued)} job(s).'
+            if skipped:
+                message += f' {skipped} skipped: already requeued or their map has an active job.'
+            flash(message, 'success' if requeued else 'info')
+        return redirect(url_for('dead_analysis_jobs', status=request.args.get('status', 'dead')))
+
     
         
 
@@ -587,58 +570,40 @@ def register_routes(app):
     @app.route('/map_image/<int:map_id>')
     @login_required
     def map_image(map_id):
-        import sqlite3
-        import io
-        import tempfile
-        import os
-        from flask import send_file
-        from pdf2image import convert_from_path
-
-        # conn = sqlite3.connect(DB_PATH)
-        conn = get_connection()
-        c = conn.cursor()
-        c.execute('SELECT image, file_type FROM maps WHERE id = %s AND user_id = %s', (map_id, session['user_id']))
-        result = c.fetchone()
-        conn.close()
+        result = get_map_blob(map_id, session['user_id'])
 
         if not result:
             return 'File not found', 404
 
-        file_data, file_type = result
-
-        if file_type.lower() == 'pdf':
-            try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                    temp_file.write(file_data)
-                    temp_file_path = temp_file.name
-
-                images = convert_from_path(temp_file_path, dpi=150)
-                if images:
-                    img_io = io.BytesIO()
-                    images[0].save(img_io, 'PNG')
-                    img_io.seek(0)
-                    os.unlink(temp_file_path)
-                    return send_file(img_io, mimetype='image/png')
-                else:
-                    os.unlink(temp_file_path)
-                    return 'Could not convert PDF to image', 500
-
-            except Exception as e:
-                try: os.unlink(temp_file_path)
-                except: pass
-                print(f"PDF conversion error: {e}")
-                return 'Error converting PDF', 500
+        blob_sha256, _, _, file_type = result
+        rendition = request.args.get('rendition', 'preview')
+        if rendition not in ('preview', 'thumbnail'):
+            return 'Unknown rendition', 400
+
+        if blob_sha256 is None:
+            file_data = get_map_file(map_id, session['user_id'])[0]
+        elif rendition == 'preview' and file_type.lower() != 'pdf':
+            # Raster previews are the upload itself: stream it from the blob store
+            mime_type = 'image/jpeg' if file_type.lower() == 'jpg' else f'image/{file_type.lower()}'
+            return send_file(get_blob_store().open(blob_sha256), mimetype=mime_type, as_attachment=False,
+                             download_name=f'map_image.{file_type}')
         else:
-            mime_type = f'image/{file_type.lower()}'
-            if file_type.lower() == 'jpg':
-                mime_type = 'image/jpeg'
+            # Only read on a raster cache miss
+            file_data = lambda: get_blob_store().read(blob_sha256)
 
-            return send_file(
-                io.BytesIO(file_data),
-                mimetype=mime_type,
-                as_attachment=False,
-                download_name=f'map_image.{file_type}'
-            )
+        try:
+            # Served from the raster cache; only a cold cache renders here
+            image_data, mime_type = get_map_rendition(file_data, file_type, rendition, file_hash=blob_sha256)
+        except Exception as e:
+            print(f"PDF conversion error: {e}")
+            return 'Error converting PDF', 500
+
+        return send_file(
+            io.BytesIO(image_data),
+            mimetype=mime_type,
+            as_attachment=False,
+            download_name=f'map_image.{"png" if mime_type == "image/png" else file_type}'
+        )
 
     
     @app.route('/check_analysis_status/<int:map_id>')
@@ -659,12 +624,20 @@ def register_routes(app):
                 
             analysis_status, map_status, report, payment_status = result
 
-            # If Render restarted mid-analysis, recover by starting analysis again.
+            # A paid map without an active job (queue was full at payment) is queued
+            # now; one that is already queued or running is left as it is
             if payment_status == 'completed' and analysis_status in ('pending', 'processing'):
-                with ACTIVE_ANALYSIS_LOCK:
-                    is_active_here = map_id in ACTIVE_ANALYSIS_MAPS
-                if not is_active_here:
-                    start_analysis_thread(session['user_id'], map_id)
+                try:
+                    enqueue_analysis_job(map_id, ANALYSIS_QUEUE_MAX_DEPTH)
+                except AnalysisQueueFull as e:
+                    response = jsonify({
+                        'analysis_completed': False,
+                        'status': 'queue_full',
+                        'queue_depth': e.depth,
+                        'retry_after': ANALYSIS_QUEUE_RETRY_AFTER_SECONDS,
+                    })
+                    response.headers['Retry-After'] = str(ANALYSIS_QUEUE_RETRY_AFTER_SECONDS)
+                    return response, 503
 
             analysis_completed = analysis_status == 'completed'
             
@@ -691,24 +664,40 @@ def register_routes(app):
             # conn = sqlite3.connect(DB_PATH)
             conn = get_connection()
             c = conn.cursor()
-            c.execute('SELECT * FROM maps WHERE id = %s AND user_id = %s', (map_id, session['user_id']))
+            # Every column but the legacy image blob
+            columns = ['id', 'user_id', 'filename', 'file_type', 'report', 'status', 'payment_status', 'analysis_status', 'created_at', 'original_ref', 'blob_sha256', 'blob_size']
+            c.execute(f'SELECT {", ".join(columns)} FROM maps WHERE id = %s AND user_id = %s', (map_id, session['user_id']))
             result = c.fetchone()
             conn.close()
             
             if not result:
                 return f"Map not found for ID: {map_id}"
             
-            # Convert to dict for display (excluding binary image data)
-            columns = ['id', 'user_id', 'image', 'filename', 'file_type', 'report', 'status', 'payment_status', 'analysis_status', 'created_at']
             map_info = dict(zip(columns, result))
-            map_info['image'] = f"<binary data: {len(result[2])} bytes>" if result[2] else "None"
-            map_info['report'] = result[5][:500] + "..." if result[5] and len(result[5]) > 500 else result[5]
+            report = map_info['report']
+            map_info['report'] = report[:500] + "..." if report and len(report) > 500 else report
             
             return f"<pre>{map_info}</pre>"
             
         except Exception as e:
             return f"Debug error: {str(e)}"
 
+    # Debug route - connection pool checkouts, waits and connects of this process
+    @app.route('/debug_db_pool')
+    @login_required
+    def debug_db_pool():
+        return jsonify(get_pool_stats())
+
+    # Prometheus scrape target; requires METRICS_TOKEN as a bearer token and is
+    # not served at all while no token is configured
+    @app.route('/metrics')
+    def metrics():
+        if not os.environ.get('METRICS_TOKEN'):
+            return 'Not Found', 404
+        if not metrics_authorized(request.headers.get('Authorization')):
+            return 'Unauthorized', 401
+        return app.response_class(METRICS_REGISTRY.render(), content_type=METRICS_CONTENT_TYPE)
+
 
 
 
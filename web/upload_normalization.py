@@ -0,0 +1,121 @@
+"""
+Background normalization of raster map uploads.
+
+Phone photos and scans arrive as multi-megabyte JPEG/PNG files carrying EXIF
+blocks, sideways orientation flags and far more pixels than the analysis path
+ever sends to the model. After insert_map() the upload is rewritten once:
+orientation applied, metadata dropped, downscaled to the render pixel budget
+and re-encoded as WebP. The original moves to the cold originals store
+(maps.original_ref keeps its digest) and leaves the hot blob store once no
+map points at it; an analysis that looked the map up before the swap reads
+it from there.
+
+Normalization decodes and resamples images of up to tens of megapixels, so
+the web process runs it on a small bounded pool (UPLOAD_NORMALIZATION_WORKERS
+threads, UPLOAD_NORMALIZATION_BACKLOG uploads waiting); uploads arriving
+while the backlog is full are kept as stored.
+"""
+
+import io
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.core import config_map as config
+
+try:
+    from .blob_store import get_originals_store
+    from .database import replace_map_image
+    from .render_service import ensure_map_renditions
+except ImportError:
+    from blob_store import get_originals_store
+    from database import replace_map_image
+    from render_service import ensure_map_renditions
+
+
+def normalize_raster_upload(file_data, file_type):
+    """
+    Return (bytes, file_type) for the normalized upload, or None when
+    re-encoding would not make it smaller.
+    """
+    image = Image.open(io.BytesIO(file_data))
+    image.seek(0)  # animated GIFs: the first frame is the plan
+    image = ImageOps.exif_transpose(image)
+
+    if image.mode in ("RGBA", "LA", "P", "PA"):
+        # Flatten transparency onto white paper rather than WebP's black
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    elif image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    budget = config.RENDER_PIXEL_BUDGET_MP * 1_000_000
+    pixels = image.width * image.height
+    if pixels > budget:
+        scale = math.sqrt(budget / pixels)
+        image = image.resize((max(1, int(image.width * scale)), max(1, int(image.height * scale))), Image.LANCZOS)
+
+    img_io = io.BytesIO()
+    # No exif/icc_profile arguments: Pillow writes none, which strips the metadata
+    image.save(img_io, "WEBP", quality=config.UPLOAD_WEBP_QUALITY, method=4)
+    data = img_io.getvalue()
+    if len(data) >= len(file_data):
+        return None
+    return data, "webp"
+
+
+def normalize_map_upload(map_id, file_data, file_type):
+    """Normalize a stored upload and pre-render its renditions; run in the background at upload."""
+    if file_type.lower() != "pdf" and config.UPLOAD_NORMALIZATION:
+        try:
+            started = time.perf_counter()
+            normalized = normalize_raster_upload(file_data, file_type)
+            if normalized is None:
+                print(f"[Upload] map_id={map_id}: {file_type} upload already compact, kept as is", flush=True)
+            else:
+                data, new_type = normalized
+                # insert_map() stored the upload under the same digest in the hot store
+                original_sha256, _ = get_originals_store().put(file_data)
+                if replace_map_image(map_id, original_sha256, data, new_type):
+                    print(f"[Upload] map_id={map_id}: {len(file_data) / 1024:.0f} KB {file_type} -> "
+                          f"{len(data) / 1024:.0f} KB {new_type} ({len(file_data) / len(data):.1f}x) "
+                          f"in {time.perf_counter() - started:.2f}s", flush=True)
+                    file_data, file_type = data, new_type
+                else:
+                    print(f"[Upload] map_id={map_id}: file changed meanwhile, normalized copy not used", flush=True)
+        except Exception as e:
+            print(f"[Upload] map_id={map_id}: normalization failed, keeping the original: {e}", flush=True)
+
+    ensure_map_renditions(file_data, file_type)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_backlog = threading.BoundedSemaphore(max(1, config.UPLOAD_NORMALIZATION_WORKERS + config.UPLOAD_NORMALIZATION_BACKLOG))
+
+
+def submit_map_upload(map_id, file_data, file_type):
+    """
+    Queue normalize_map_upload() on the bounded pool. Returns False, leaving
+    the upload as stored (renditions then render on first view), when the
+    backlog is full.
+    """
+    global _executor
+    if not _backlog.acquire(blocking=False):
+        print(f"[Upload] map_id={map_id}: normalization backlog full, upload kept as stored", flush=True)
+        return False
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, config.UPLOAD_NORMALIZATION_WORKERS), thread_name_prefix="upload-normalize")
+    future = _executor.submit(normalize_map_upload, map_id, file_data, file_type)
+    future.add_done_callback(lambda _: _backlog.release())
+    return True
@@ -1,31 +1,59 @@
 import os
+import sqlite3
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import psycopg2
+
 # Handle both relative and absolute imports
 try:
     from .database import (
-        claim_next_analysis_job,
-        get_connection,
+        claim_analysis_jobs,
+        connection_scope,
+        database_url,
+        get_map_file,
+        get_pool_stats,
         mark_analysis_job_completed,
         mark_analysis_job_failed,
+        requeue_expired_analysis_jobs,
+        retry_analysis_job,
         set_map_analysis_status,
         update_map_analysis,
     )
-    from .analysis import analyze_map_with_ai
+    from .blob_store import get_blob_store
+    from .db_pool import PoolTimeout
+    from .job_lease import LeaseKeeper
+    from .job_wakeup import JobWakeup
+    from .analysis_sandbox import get_analysis_sandbox, run_analysis
 except ImportError:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from database import (
-        claim_next_analysis_job,
-        get_connection,
+        claim_analysis_jobs,
+        connection_scope,
+        database_url,
+        get_map_file,
+        get_pool_stats,
         mark_analysis_job_completed,
         mark_analysis_job_failed,
+        requeue_expired_analysis_jobs,
+        retry_analysis_job,
         set_map_analysis_status,
         update_map_analysis,
     )
-    from analysis import analyze_map_with_ai
+    from blob_store import get_blob_store
+    from db_pool import PoolTimeout
+    from job_lease import LeaseKeeper
+    from job_wakeup import JobWakeup
+    from analysis_sandbox import get_analysis_sandbox, run_analysis
+
+from src.core import config_map as config
+from src.core.errors import is_transient_error
+from src.core.metrics import REGISTRY, serve_metrics
+from src.core.rate_limiter import gemini_rate_limiter
 
 
 def safe_print(message):
@@ -60,7 +88,9 @@ def build_report(filename, overall_status, results):
                 continue
 
             clean_rule_name = rule_mapping.get(rule, rule)
-            if result.get("passed"):
+            if result.get("not_evaluated"):
+                status_symbol = "NOT EVALUATED"
+            elif result.get("passed"):
                 status_symbol = "PASS"
             else:
                 status_symbol = "FAIL"
@@ -73,69 +103,247 @@ def build_report(filename, overall_status, results):
     return report
 
 
-def process_analysis_job(job_id, map_id):
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute("SELECT image, filename, file_type FROM maps WHERE id = %s", (map_id,))
-    map_data = c.fetchone()
-    conn.close()
+def is_transient_job_error(exc):
+    """Model-side transient errors plus a lost or exhausted database connection."""
+    return is_transient_error(exc) or isinstance(
+        exc, (psycopg2.OperationalError, psycopg2.InterfaceError, sqlite3.OperationalError, PoolTimeout))
 
-    if not map_data:
-        error_report = "Analysis Error: Map data not found\nPlease try uploading again or contact support."
-        update_map_analysis(map_id, error_report, "error")
-        mark_analysis_job_failed(job_id, "Map data not found")
-        return
 
-    file_data, filename, file_type = map_data
-    safe_print(f"Starting analysis job_id={job_id} map_id={map_id} filename={filename}")
+def process_analysis_job(job_id, map_id, lease=None):
+    """
+    Run one claimed job. With a LeaseKeeper, the job's lease is confirmed
+    before any result is written and the job is closed only by its lease
+    holder, so a run whose lease was reaped cannot overwrite the retry.
+    Transient failures are rescheduled with backoff instead of reported.
+    """
+    owner = lease.owner if lease else None
 
     try:
+        map_data = get_map_file(map_id)
+        if not map_data:
+            error_report = "Analysis Error: Map data not found\nPlease try uploading again or contact support."
+            update_map_analysis(map_id, error_report, "error")
+            mark_analysis_job_failed(job_id, "Map data not found", owner)
+            return
+
+        file_data, filename, file_type = map_data
+        safe_print(f"Starting analysis job_id={job_id} map_id={map_id} filename={filename}")
+
         set_map_analysis_status(map_id, "processing")
-        results, overall_status, raw_validation, validation_text = analyze_map_with_ai(file_data, filename, file_type)
+        results, overall_status, raw_validation, validation_text = run_analysis(file_data, filename, file_type)
+        if lease and not lease.confirm(job_id):
+            return
 
         if overall_status == "error" or "error" in results:
             error_message = results.get("error", {}).get("message", "Unknown error occurred")
             error_report = f"Analysis Error: {error_message}\nPlease try uploading again or contact support."
             update_map_analysis(map_id, error_report, "error")
-            mark_analysis_job_failed(job_id, error_message)
+            mark_analysis_job_failed(job_id, error_message, owner)
             safe_print(f"Analysis failed for map_id={map_id}: {error_message}")
             return
 
         report = build_report(filename, overall_status, results)
         update_map_analysis(map_id, report, overall_status)
-        mark_analysis_job_completed(job_id)
+        mark_analysis_job_completed(job_id, owner)
         safe_print(f"Analysis completed for map_id={map_id} with status={overall_status}")
 
     except Exception as exc:
-        traceback.print_exc()
         error_message = str(exc)
+        if is_transient_job_error(exc):
+            safe_print(f"Transient error for job_id={job_id} map_id={map_id}: {error_message}")
+            # retry_analysis_job checks the lease itself
+            retry_analysis_job(job_id, error_message, owner)
+            return
+
+        traceback.print_exc()
+        if lease and not lease.confirm(job_id):
+            return
         error_report = f"Analysis Error: {error_message}\nPlease try uploading again or contact support."
         try:
             update_map_analysis(map_id, error_report, "error")
         except Exception:
             traceback.print_exc()
-        mark_analysis_job_failed(job_id, error_message)
+        mark_analysis_job_failed(job_id, error_message, owner)
         safe_print(f"Unhandled worker error for map_id={map_id}: {error_message}")
 
 
-def run_worker_loop():
-    poll_interval = int(os.environ.get("ANALYSIS_JOB_POLL_SECONDS", "3"))
-    safe_print(f"Analysis worker started. Poll interval: {poll_interval}s")
+# Re-check of a full memory budget when no job has ended in the meantime
+ADMISSION_RETRY_SECONDS = 5
+
+worker_slots = REGISTRY.gauge("analysis_worker_slots", "Worker slots by state", ("state",))
+# Running totals kept by the lease and the limiter, mirrored at scrape time
+worker_lease_events = REGISTRY.gauge(
+    "analysis_worker_lease_events", "Lease renewals, leases lost and expired leases reaped so far", ("event",))
+rate_limit_waits = REGISTRY.gauge("gemini_rate_limit_waits", "Model calls that waited for the rate limiter so far")
+rate_limit_wait_seconds = REGISTRY.gauge("gemini_rate_limit_wait_seconds", "Time model calls waited for the rate limiter so far")
+
+
+class WorkerSlots:
+    """
+    Runs claimed jobs on up to `size` threads. Analyses spend most of their
+    time waiting on the model, so one process keeps several in flight; busy
+    time is accumulated for the utilisation figure.
+    """
+
+    def __init__(self, size, lease, on_release=None):
+        self.size = max(1, size)
+        self.lease = lease
+        self.on_release = on_release
+        self.executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="analysis-slot")
+        self._cond = threading.Condition()
+        self._busy = 0
+        self._busy_seconds = 0.0
+        self._started = time.monotonic()
+        self.completed = 0
+
+    @property
+    def free(self):
+        with self._cond:
+            return self.size - self._busy
+
+    def submit(self, job_id, map_id):
+        with self._cond:
+            self._busy += 1
+        # Heartbeats start with the claim, before the job waits for a thread
+        self.lease.add(job_id)
+        self.executor.submit(self._run, job_id, map_id)
+
+    def _run(self, job_id, map_id):
+        started = time.monotonic()
+        try:
+            # Every status update of the job reuses one pooled connection
+            with connection_scope():
+                process_analysis_job(job_id, map_id, self.lease)
+        except Exception as exc:
+            traceback.print_exc()
+            safe_print(f"Slot error for job_id={job_id}: {str(exc)}")
+        finally:
+            self.lease.discard(job_id)
+            with self._cond:
+                self._busy -= 1
+                self._busy_seconds += time.monotonic() - started
+                self.completed += 1
+                self._cond.notify_all()
+            if self.on_release:
+                # Claim again now, not at the next poll: the job may have held back its user's next one
+                self.on_release()
+        safe_print(f"[Slots] job_id={job_id} done in {time.monotonic() - started:.1f}s; {self.format_stats()}")
+
+    def wait_for_free_slot(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: self._busy < self.size, timeout)
+
+    def wait_for_job_end(self, timeout):
+        """Sleep until a running job finishes (freeing its memory) or `timeout` passes."""
+        with self._cond:
+            return self._cond.wait(timeout)
+
+    def stats(self):
+        with self._cond:
+            elapsed = max(time.monotonic() - self._started, 1e-9)
+            return {
+                "slots": self.size,
+                "busy": self._busy,
+                "completed": self.completed,
+                # Share of slot-time spent on jobs since start (running jobs not yet counted)
+                "utilisation": self._busy_seconds / (self.size * elapsed),
+            }
+
+    def collect_metrics(self):
+        stats = self.stats()
+        worker_slots.set(stats["busy"], state="busy")
+        worker_slots.set(stats["slots"] - stats["busy"], state="free")
+        lease = self.lease.stats()
+        for event in ("renewals", "lost", "reaped"):
+            worker_lease_events.set(lease[event], event=event)
+        limiter = gemini_rate_limiter.stats()
+        rate_limit_waits.set(limiter["waits"])
+        rate_limit_wait_seconds.set(limiter["wait_seconds"])
+
+    def format_stats(self):
+        stats = self.stats()
+        db = get_pool_stats()
+        limiter = gemini_rate_limiter.stats()
+        lease = self.lease.stats()
+        return (f"busy {stats['busy']}/{stats['slots']}, utilisation {stats['utilisation']:.0%}, "
+                f"completed {stats['completed']}; leases lost {lease['lost']}, reaped {lease['reaped']}; "
+                f"model calls {limiter['calls']} "
+                f"(rate-limited {limiter['waits']}, {limiter['wait_seconds']:.1f}s); "
+                f"DB connects={db['connects']} checkouts={db['checkouts']} waits={db.get('waits', 0)}")
+
+
+def run_worker_loop(slot_count=None):
+    # Refuse to start (rather than fail every job) when uploads are unreadable from here
+    get_blob_store()
+    # New jobs wake the worker immediately; the poll interval is only a safety net
+    poll_interval = int(os.environ.get("ANALYSIS_JOB_POLL_SECONDS", "30"))
+    lease = LeaseKeeper()
+    wakeup = JobWakeup(database_url())
+    slots = WorkerSlots(slot_count or int(os.environ.get("ANALYSIS_WORKER_SLOTS", "4")), lease, wakeup.interrupt)
+    claim_batch = int(os.environ.get("ANALYSIS_CLAIM_BATCH", str(slots.size)))
+    REGISTRY.register_collector(slots.collect_metrics)
+    sandbox = None
+    if config.ANALYSIS_ISOLATION:
+        sandbox = get_analysis_sandbox(slots.size)
+        sandbox.start()
+        REGISTRY.register_collector(sandbox.collect_metrics)
+    # Recover jobs stranded by a previous crash before claiming, then keep reaping
+    requeue_expired_analysis_jobs()
+    lease.start()
+    safe_print(f"Analysis worker started with {slots.size} slot(s). Safety poll interval: {poll_interval}s")
 
     while True:
         try:
-            claimed_job = claim_next_analysis_job()
-            if not claimed_job:
-                time.sleep(poll_interval)
+            free = slots.free
+            if free == 0:
+                slots.wait_for_free_slot()
                 continue
 
-            job_id, map_id = claimed_job
-            process_analysis_job(job_id, map_id)
+            requested = min(free, claim_batch)
+            if sandbox:
+                # Claim only what the memory budget can take; running jobs free memory as they end
+                requested = sandbox.admit(requested)
+                if requested == 0:
+                    slots.wait_for_job_end(ADMISSION_RETRY_SECONDS)
+                    continue
+
+            claimed_jobs = []
+            try:
+                claimed_jobs = claim_analysis_jobs(requested, lease.owner)
+            finally:
+                if sandbox:
+                    sandbox.release(requested - len(claimed_jobs))
+            for job_id, map_id in claimed_jobs:
+                slots.submit(job_id, map_id)
+
+            if len(claimed_jobs) < requested:
+                # Queue drained: sleep until a job is announced
+                wakeup.wait(poll_interval)
         except Exception as exc:
             traceback.print_exc()
             safe_print(f"Worker loop error: {str(exc)}")
-            time.sleep(poll_interval)
+            time.sleep(min(poll_interval, 3))
+
+
+
+def start_embedded_worker():
+    """
+    Run the worker loop on a daemon thread of the web process, for deploys
+    with a single service. Analyses then share the process with requests, so
+    it runs ANALYSIS_EMBEDDED_WORKER_SLOTS (default 1) at a time; a separate
+    `python web/worker.py` keeps request latency independent of analysis load.
+    """
+    slot_count = int(os.environ.get("ANALYSIS_EMBEDDED_WORKER_SLOTS", "1"))
+    thread = threading.Thread(target=run_worker_loop, args=(slot_count,), name="embedded-worker", daemon=True)
+    thread.start()
+    return thread
 
 
 if __name__ == "__main__":
+    # The web app serves /metrics for an embedded worker; a standalone one serves its own
+    metrics_port = int(os.environ.get("WORKER_METRICS_PORT", "9101"))
+    if metrics_port:
+        metrics_host = os.environ.get("WORKER_METRICS_HOST", "127.0.0.1")
+        serve_metrics(metrics_port, metrics_host)
+        safe_print(f"Metrics at http://{metrics_host}:{metrics_port}/metrics")
     run_worker_loop()